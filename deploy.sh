@@ -203,6 +203,28 @@ sync_database() {
     fi
 }
 
+# 校验牌面图片资源（缺失、损坏、未引用或与 tarot-cards.ts 不一致时中止部署）
+verify_assets() {
+    print_info "校验牌面图片资源..."
+
+    if ! command -v python3 &> /dev/null; then
+        print_warning "未找到 python3，跳过图片资源校验"
+        return
+    fi
+
+    if ! python3 scripts/fingerprint_assets.py --check; then
+        print_error "带哈希的静态资源已过期，请先运行 python3 scripts/fingerprint_assets.py 并提交结果"
+        exit 1
+    fi
+
+    if python3 scripts/verify_card_assets.py; then
+        print_success "图片资源校验通过"
+    else
+        print_error "图片资源校验失败，请根据上面的报告修复后重新部署"
+        exit 1
+    fi
+}
+
 # 停止并删除旧容器
 stop_old_container() {
     print_info "检查端口占用..."
@@ -381,6 +403,7 @@ main() {
     confirm_deploy "$@"
     configure_npm_mirror
     # sync_database
+    verify_assets
     stop_old_container
     build_image
     run_container
@@ -44,6 +44,7 @@ CREATE TABLE IF NOT EXISTS tarot_interpretations (
 
 CREATE INDEX IF NOT EXISTS tarot_interpretations_user_id_idx ON tarot_interpretations(user_id);
 CREATE INDEX IF NOT EXISTS tarot_interpretations_created_at_idx ON tarot_interpretations(created_at DESC);
+CREATE INDEX IF NOT EXISTS tarot_interpretations_user_id_created_at_id_idx ON tarot_interpretations(user_id, created_at, id);
 
 -- ========================================
 -- 3. 用户每日限额表 (daily_quotas)
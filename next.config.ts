@@ -2,7 +2,6 @@ import type { NextConfig } from 'next';
 
 const nextConfig: NextConfig = {
   output: 'standalone', // 启用 standalone 输出模式，优化 Docker 部署
-  generateEtags: false, // 禁用 ETag 生成，防止 304 缓存
   /* config options here */
   allowedDevOrigins: ['*.dev.coze.site'],
   images: {
@@ -14,10 +13,21 @@ const nextConfig: NextConfig = {
       },
     ],
   },
+  // 缓存策略：只有带内容哈希的地址才能长期缓存；其余地址每次向服务器验证（ETag / Last-Modified，未变化时返回 304）
   async headers() {
     return [
       {
         source: '/:path*',
+        headers: [
+          {
+            key: 'Cache-Control',
+            value: 'no-cache',
+          },
+        ],
+      },
+      {
+        // 接口响应可能包含用户数据，不允许任何缓存
+        source: '/api/:path*',
         headers: [
           {
             key: 'Cache-Control',
@@ -52,16 +62,8 @@ const nextConfig: NextConfig = {
         ],
       },
       {
-        source: '/tarot-cards/:path*',
-        headers: [
-          {
-            key: 'Cache-Control',
-            value: 'public, max-age=31536000, immutable',
-          },
-        ],
-      },
-      {
-        source: '/(file|globe|next|vercel|window).svg',
+        // scripts/fingerprint_assets.py 生成的带哈希副本，内容变化时地址随之变化
+        source: '/assets/:path*',
         headers: [
           {
             key: 'Cache-Control',
@@ -1,123 +1,106 @@
 #!/usr/bin/env python3
+import os
 import re
+import sys
+import difflib
+import argparse
 
-# 图片URL映射
-BASE_URL = "https://raw.githubusercontent.com/ricarvy/tarot_source/main/result/"
-
-MAJOR_IMAGES = {
-    0: "Major/The_Fool_New_beginnings.png",
-    1: "Major/The_Magician_Creativity.png",
-    2: "Major/The_High_Priestess_Intuition.png",
-    3: "Major/The_Empress_Abundance.png",
-    4: "Major/The_Emperor_Authority.png",
-    5: "Major/The_Hierophant_Tradition.png",
-    6: "Major/The_Lovers_Love.png",
-    7: "Major/The_Chariot_Victory.png",
-    8: "Major/Strength_Strength.png",
-    9: "Major/The_Hermit_Introspection.png",
-    10: "Major/Wheel_of_Fortune_Destiny.png",
-    11: "Major/Justice_Justice.png",
-    12: "Major/The_Hanged_Man_Sacrifice.png",
-    13: "Major/Death_Change.png",
-    14: "Major/Temperance_Balance.png",
-    15: "Major/The_Devil_Temptation.png",
-    16: "Major/The_Tower_Sudden_change.png",
-    17: "Major/The_Star_Hope.png",
-    18: "Major/The_Moon_Illusion.png",
-    19: "Major/The_Sun_Success.png",
-    20: "Major/Judgement_Rebirth.png",
-    21: "Major/The_World_Completion.png",
-}
-
-WANDS_IMAGES = {
-    22: "Minor/Ace_of_Wands_Creativity.png",
-    23: "Minor/Two_of_Wands_Planning.png",
-    24: "Minor/Three_of_Wands_Expansion.png",
-    25: "Minor/Four_of_Wands_Stability.png",
-    26: "Minor/Five_of_Wands_Competition.png",
-    27: "Minor/Six_of_Wands_Victory.png",
-    28: "Minor/Seven_of_Wands_Challenge.png",
-    29: "Minor/Eight_of_Wands_Speed.png",
-    30: "Minor/Nine_of_Wands_Persistence.png",
-    31: "Minor/Ten_of_Wands_Burden.png",
-    32: "Minor/Page_of_Wands_Exploration.png",
-    33: "Minor/Knight_of_Wands_Adventure.png",
-    34: "Minor/Queen_of_Wands_Confidence.png",
-    35: "Minor/King_of_Wands_Leadership.png",
-}
-
-CUPS_IMAGES = {
-    36: "Minor/Ace_of_Cups_New_feelings.png",
-    37: "Minor/Two_of_Cups_Partnership.png",
-    38: "Minor/Three_of_Cups_Friendship.png",
-    39: "Minor/Four_of_Cups_Apathy.png",
-    40: "Minor/Five_of_Cups_Disappointment.png",
-    41: "Minor/Six_of_Cups_Nostalgia.png",
-    42: "Minor/Seven_of_Cups_Fantasy.png",
-    43: "Minor/Eight_of_Cups_Abandonment.png",
-    44: "Minor/Nine_of_Cups_Satisfaction.png",
-    45: "Minor/Ten_of_Cups_Happiness.png",
-    46: "Minor/Page_of_Cups_Sensitivity.png",
-    47: "Minor/Knight_of_Cups_Romance.png",
-    48: "Minor/Queen_of_Cups_Intuition.png",
-    49: "Minor/King_of_Cups_Emotional_maturity.png",
-}
-
-SWORDS_IMAGES = {
-    50: "Minor/Ace_of_Swords_Clarity.png",
-    51: "Minor/Two_of_Swords_Indecision.png",
-    52: "Minor/Three_of_Swords_Heartbreak.png",
-    53: "Minor/Four_of_Swords_Rest.png",
-    54: "Minor/Five_of_Swords_Defeat.png",
-    55: "Minor/Six_of_Swords_Transition.png",
-    56: "Minor/Seven_of_Swords_Deception.png",
-    57: "Minor/Eight_of_Swords_Restriction.png",
-    58: "Minor/Nine_of_Swords_Anxiety.png",
-    59: "Minor/Ten_of_Swords_Ruin.png",
-    60: "Minor/Page_of_Swords_Curiosity.png",
-    61: "Minor/Knight_of_Swords_Impulsiveness.png",
-    62: "Minor/Queen_of_Swords_Independence.png",
-    63: "Minor/King_of_Swords_Logic.png",
-}
-
-PENTACLES_IMAGES = {
-    64: "Minor/Ace_of_Pentacles_Material_opportunity.png",
-    65: "Minor/Two_of_Pentacles_Balance.png",
-    66: "Minor/Three_of_Pentacles_Teamwork.png",
-    67: "Minor/Four_of_Pentacles_Security.png",
-    68: "Minor/Five_of_Pentacles_Hardship.png",
-    69: "Minor/Six_of_Pentacles_Generosity.png",
-    70: "Minor/Seven_of_Pentacles_Assessment.png",
-    71: "Minor/Eight_of_Pentacles_Dedication.png",
-    72: "Minor/Nine_of_Pentacles_Independence.png",
-    73: "Minor/Ten_of_Pentacles_Wealth.png",
-    74: "Minor/Page_of_Pentacles_Learning.png",
-    75: "Minor/Knight_of_Pentacles_Responsibility.png",
-    76: "Minor/Queen_of_Pentacles_Abundance.png",
-    77: "Minor/King_of_Pentacles_Wealth.png",
-}
-
-ALL_IMAGES = {**MAJOR_IMAGES, **WANDS_IMAGES, **CUPS_IMAGES, **SWORDS_IMAGES, **PENTACLES_IMAGES}
-
-# 读取原文件
-with open('src/lib/tarot-cards.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
-
-# 替换图片URL
-for card_id, image_path in ALL_IMAGES.items():
-    new_url = BASE_URL + image_path
-    # 查找该ID的图片URL并替换
-    pattern = rf'id: {card_id},.*?imageUrl:\s*[\'"]([^\'\"]+)[\'"]'
-    match = re.search(pattern, content, re.DOTALL)
-    if match:
-        old_url = match.group(1)
-        content = content.replace(old_url, new_url)
-        print(f"Updated card {card_id}: {old_url} -> {new_url}")
-    else:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+# 图片URL映射统一维护在 scripts/tarot_registry.py
+from tarot_registry import BASE_URL, CARDS, LOCAL_URL_PREFIX, image_url
+# 本地图片使用 scripts/fingerprint_assets.py 生成的带哈希地址（/assets/...）
+from fingerprint_assets import load_hashed_urls
+
+CARDS_TS = 'src/lib/tarot-cards.ts'
+
+# 一次扫描同时匹配 id 和 imageUrl，按出现顺序把 imageUrl 归属到最近的 id
+TOKEN_RE = re.compile(r"""\bid:\s*(\d+),|\bimageUrl:\s*(['"])([^'"]*)\2""")
+
+
+def build_url_index(content):
+    """解析卡牌数组一次，返回 {card_id: (start, end)}，即 imageUrl 字符串值在文件中的位置"""
+    index = {}
+    current_id = None
+    for match in TOKEN_RE.finditer(content):
+        if match.group(1) is not None:
+            current_id = int(match.group(1))
+            continue
+        if current_id is None:
+            continue
+        if current_id in index:
+            raise ValueError(f"card {current_id} has more than one imageUrl")
+        index[current_id] = match.span(3)
+        # 每个对象只认一个 imageUrl，避免串到下一张牌
+        current_id = None
+    return index
+
+
+def rewrite(content, urls):
+    """按位置顺序一次性拼接出新内容，返回 (new_content, changes)"""
+    index = build_url_index(content)
+    changes = []
+    pieces = []
+    last = 0
+    for card_id, (start, end) in sorted(index.items(), key=lambda item: item[1][0]):
+        new_url = urls.get(card_id)
+        old_url = content[start:end]
+        if new_url is None or new_url == old_url:
+            continue
+        pieces.append(content[last:start])
+        pieces.append(new_url)
+        last = end
+        changes.append((card_id, old_url, new_url))
+    pieces.append(content[last:])
+
+    missing = sorted(set(urls) - set(index))
+    return ''.join(pieces), changes, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rewrite imageUrl fields in tarot-cards.ts')
+    parser.add_argument('--base-url', default=LOCAL_URL_PREFIX,
+                        help=f'URL prefix for every image (default: {LOCAL_URL_PREFIX}, '
+                             f'mapped to fingerprinted /assets URLs; upstream: {BASE_URL})')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--dry-run', action='store_true', help='print a diff instead of writing')
+    mode.add_argument('--check', action='store_true', help='exit non-zero if any imageUrl would change')
+    args = parser.parse_args()
+
+    # 读取原文件
+    with open(CARDS_TS, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    urls = {card.id: image_url(card, args.base_url) for card in CARDS}
+    # 本地地址换成清单中的带哈希地址，避免覆盖掉指纹化的结果
+    hashed = load_hashed_urls()
+    urls = {card_id: hashed.get(url, url) for card_id, url in urls.items()}
+    new_content, changes, missing = rewrite(content, urls)
+
+    for card_id in missing:
         print(f"Warning: Could not find imageUrl for card {card_id}")
 
-# 写回文件
-with open('src/lib/tarot-cards.ts', 'w', encoding='utf-8') as f:
-    f.write(content)
+    if args.dry_run or args.check:
+        sys.stdout.writelines(difflib.unified_diff(
+            content.splitlines(keepends=True), new_content.splitlines(keepends=True),
+            fromfile=CARDS_TS, tofile=CARDS_TS,
+        ))
+        if args.check and (changes or missing):
+            print(f"\n✗ {len(changes)} imageUrl(s) out of date, {len(missing)} missing")
+            sys.exit(1)
+        print(f"\n{len(changes)} imageUrl(s) would change")
+        return
+
+    for card_id, old_url, new_url in changes:
+        print(f"Updated card {card_id}: {old_url} -> {new_url}")
+
+    # 写回文件
+    if changes:
+        with open(CARDS_TS, 'w', encoding='utf-8') as f:
+            f.write(new_content)
+
+    print(f"\n✓ Image URLs updated successfully ({len(changes)} changed)")
+
 
-print("\n✓ Image URLs updated successfully")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,316 @@
+"""Seed a large synthetic reading history and benchmark history paging.
+
+Loads ``tarot_interpretations`` in a local PostgreSQL database with one heavy
+user (and optional background users), then times fetching a 20-row page at
+increasing depths two ways:
+
+- ``offset``: the old query, every column, ``ORDER BY created_at DESC
+  LIMIT n OFFSET k``;
+- ``keyset``: what ``getInterpretationSummaries`` runs, the summary projection
+  with ``(created_at, id) < cursor`` on the ``(user_id, created_at, id)`` index.
+
+::
+
+    createdb tarot_bench
+    python scripts/bench_history.py --dsn postgresql:///tarot_bench seed --rows 200000
+    python scripts/bench_history.py --dsn postgresql:///tarot_bench bench --depths 1,10,100,1000,5000
+    python scripts/bench_history.py api --url http://localhost:8899 --user-id <id> --pages 200
+
+``api`` walks the running app's ``/api/tarot/history`` cursor chain instead,
+which also covers JSON encoding and the route itself. Only run ``seed`` against
+a scratch database. It creates the table if needed and ``--reset`` truncates
+it, so it refuses any non-local host unless ``--allow-remote`` is given.
+``--dsn`` never falls back to ``$DATABASE_URL``, the app's production
+database. Requires psycopg 3 (``pip install "psycopg[binary]"``) for the database
+modes.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import random
+import argparse
+import urllib.parse
+import urllib.request
+from datetime import datetime, timedelta, timezone
+
+from bench_stats import summarize, format_bytes
+from tarot_ts import load_spreads, load_cards, request_card
+
+try:
+    import psycopg
+    from psycopg.conninfo import conninfo_to_dict
+except ImportError:
+    psycopg = None
+
+LOCAL_HOSTS = {"", "localhost", "127.0.0.1", "::1"}
+BENCH_USER_ID = "00000000-0000-4000-8000-00000000be11"
+PAGE_SIZE = 20
+PREVIEW_CHARS = 120
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tarot_interpretations (
+  id varchar(36) PRIMARY KEY DEFAULT gen_random_uuid(),
+  user_id varchar(36) NOT NULL,
+  question text NOT NULL,
+  spread_type varchar(50) NOT NULL,
+  cards text NOT NULL,
+  interpretation text NOT NULL,
+  created_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE INDEX IF NOT EXISTS tarot_interpretations_user_id_idx ON tarot_interpretations(user_id);
+CREATE INDEX IF NOT EXISTS tarot_interpretations_created_at_idx ON tarot_interpretations(created_at);
+CREATE INDEX IF NOT EXISTS tarot_interpretations_user_id_created_at_id_idx
+  ON tarot_interpretations(user_id, created_at, id);
+"""
+
+OFFSET_QUERY = """
+SELECT * FROM tarot_interpretations
+WHERE user_id = %(user_id)s
+ORDER BY created_at DESC
+LIMIT %(limit)s OFFSET %(offset)s
+"""
+
+KEYSET_QUERY = f"""
+SELECT id, user_id, question, spread_type, cards, created_at,
+       left(interpretation, {PREVIEW_CHARS}) AS preview,
+       (extract(epoch from created_at) * 1000000)::bigint::text AS cursor_micros
+FROM tarot_interpretations
+WHERE user_id = %(user_id)s
+  AND (created_at, id) < (timestamptz 'epoch' + %(micros)s::bigint * interval '1 microsecond', %(id)s)
+ORDER BY created_at DESC, id DESC
+LIMIT %(limit)s
+"""
+
+FIRST_PAGE_QUERY = KEYSET_QUERY.replace(
+    "  AND (created_at, id) < (timestamptz 'epoch' + %(micros)s::bigint * interval '1 microsecond', %(id)s)\n", ""
+)
+
+CURSOR_AT_QUERY = """
+SELECT (extract(epoch from created_at) * 1000000)::bigint::text, id
+FROM tarot_interpretations
+WHERE user_id = %(user_id)s
+ORDER BY created_at DESC, id DESC
+LIMIT 1 OFFSET %(offset)s
+"""
+
+QUESTIONS = [
+    "我的工作发展前景如何？",
+    "这段感情接下来会怎样？",
+    "What does today hold?",
+    "我应该接受这个新机会吗？",
+    "How can I improve my finances this month?",
+    "我和他还有可能吗？",
+]
+
+
+def connect(dsn):
+    if psycopg is None:
+        raise SystemExit('psycopg 3 is required: pip install "psycopg[binary]"')
+    return psycopg.connect(dsn, autocommit=True)
+
+
+def dsn_hosts(dsn):
+    """Hosts a DSN connects to; empty (or a socket directory) means a local Unix socket."""
+    params = conninfo_to_dict(dsn)
+    hosts = params.get("host") or os.environ.get("PGHOST", "")
+    return [host.strip() for host in hosts.split(",")]
+
+
+def require_scratch(args):
+    if args.allow_remote:
+        return
+    remote = [host for host in dsn_hosts(args.dsn) if host not in LOCAL_HOSTS and not host.startswith("/")]
+    if remote:
+        raise SystemExit(f"Refusing to seed {', '.join(remote)}: seed writes synthetic rows and --reset truncates "
+                         "tarot_interpretations. Use a local scratch database, or pass --allow-remote.")
+
+
+def synthetic_rows(user_ids, rows, body_chars, rng):
+    """Yield COPY rows, newest first, spaced a few minutes apart per user."""
+    spreads = load_spreads()
+    cards = load_cards()
+    paragraph = "牌面显示你正处在一个转折点，过去的经验将成为新的力量。" * 4
+    now = datetime.now(timezone.utc)
+    clocks = {user_id: now for user_id in user_ids}
+    for index in range(rows):
+        # The first user gets half the rows; the rest share the remainder.
+        user_id = user_ids[0] if index % 2 == 0 or len(user_ids) == 1 else rng.choice(user_ids[1:])
+        clocks[user_id] -= timedelta(seconds=rng.randint(60, 6 * 3600), microseconds=rng.randint(0, 999999))
+        spread = rng.choice(spreads)
+        drawn = rng.sample(cards, len(spread["positions"]))
+        body = (paragraph * (body_chars // len(paragraph) + 1))[:body_chars]
+        yield (
+            str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+            user_id,
+            rng.choice(QUESTIONS),
+            spread["id"],
+            json.dumps([request_card(card, rng.random() < 0.5) for card in drawn], ensure_ascii=False),
+            body,
+            clocks[user_id],
+        )
+
+
+def seed(args):
+    if psycopg is None:
+        raise SystemExit('psycopg 3 is required: pip install "psycopg[binary]"')
+    require_scratch(args)
+    rng = random.Random(args.seed)
+    user_ids = [BENCH_USER_ID] + [str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(args.users - 1)]
+    with connect(args.dsn) as conn:
+        conn.execute(SCHEMA)
+        if args.reset:
+            conn.execute("TRUNCATE tarot_interpretations")
+        started = time.perf_counter()
+        with conn.cursor() as cur:
+            with cur.copy(
+                "COPY tarot_interpretations (id, user_id, question, spread_type, cards, interpretation, created_at) FROM STDIN"
+            ) as copy:
+                for done, row in enumerate(synthetic_rows(user_ids, args.rows, args.body_chars, rng), 1):
+                    copy.write_row(row)
+                    if done % 50000 == 0:
+                        print(f"  {done:,} rows...", file=sys.stderr)
+        conn.execute("ANALYZE tarot_interpretations")
+        count = conn.execute(
+            "SELECT count(*) FROM tarot_interpretations WHERE user_id = %s", (BENCH_USER_ID,)
+        ).fetchone()[0]
+    print(f"Seeded {args.rows:,} rows across {len(user_ids)} users in {time.perf_counter() - started:.1f}s")
+    print(f"Benchmark user {BENCH_USER_ID} has {count:,} readings")
+
+
+def timed(conn, query, params, repeat):
+    """Run ``query`` ``repeat`` times; returns ``(latencies, row_count, payload_bytes)``."""
+    latencies = []
+    rows = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        rows = conn.execute(query, params).fetchall()
+        latencies.append(time.perf_counter() - started)
+    payload = sum(len(str(value).encode()) for row in rows for value in row)
+    return latencies, len(rows), payload
+
+
+def bench(args):
+    with connect(args.dsn) as conn:
+        total = conn.execute(
+            "SELECT count(*) FROM tarot_interpretations WHERE user_id = %s", (args.user_id,)
+        ).fetchone()[0]
+        if not total:
+            raise SystemExit(f"No rows for user {args.user_id}; run the seed command first")
+        print(f"User {args.user_id}: {total:,} readings, page size {PAGE_SIZE}, {args.repeat} runs per point\n")
+
+        header = (f"{'page':>7}{'offset p50':>12}{'p95':>9}{'bytes':>11}"
+                  f"{'keyset p50':>12}{'p95':>9}{'bytes':>11}{'speedup':>9}")
+        print(header)
+        print("-" * len(header))
+        results = []
+        for page in args.depths:
+            offset = (page - 1) * PAGE_SIZE
+            if offset >= total:
+                print(f"{page:>7}  (beyond the last page)")
+                continue
+            old, old_rows, old_bytes = timed(
+                conn, OFFSET_QUERY, {"user_id": args.user_id, "limit": PAGE_SIZE, "offset": offset}, args.repeat
+            )
+            if offset == 0:
+                new, new_rows, new_bytes = timed(
+                    conn, FIRST_PAGE_QUERY, {"user_id": args.user_id, "limit": PAGE_SIZE + 1}, args.repeat
+                )
+            else:
+                # The cursor a client would hold after reading the previous page.
+                micros, last_id = conn.execute(
+                    CURSOR_AT_QUERY, {"user_id": args.user_id, "offset": offset - 1}
+                ).fetchone()
+                new, new_rows, new_bytes = timed(
+                    conn, KEYSET_QUERY,
+                    {"user_id": args.user_id, "limit": PAGE_SIZE + 1, "micros": micros, "id": last_id},
+                    args.repeat,
+                )
+            old_stats, new_stats = summarize(old), summarize(new)
+            speedup = old_stats["p50"] / new_stats["p50"] if new_stats["p50"] else 0
+            print(f"{page:>7}{old_stats['p50'] * 1000:>12.2f}{old_stats['p95'] * 1000:>9.2f}"
+                  f"{format_bytes(old_bytes):>11}{new_stats['p50'] * 1000:>12.2f}{new_stats['p95'] * 1000:>9.2f}"
+                  f"{format_bytes(new_bytes):>11}{speedup:>8.1f}x")
+            results.append({
+                "page": page, "offset": old_stats, "offsetBytes": old_bytes, "offsetRows": old_rows,
+                "keyset": new_stats, "keysetBytes": new_bytes, "keysetRows": min(new_rows, PAGE_SIZE),
+            })
+        print("\n(latencies in ms)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"user": args.user_id, "total": total, "pageSize": PAGE_SIZE, "points": results}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+def walk_api(args):
+    """Follow ``nextCursor`` through the running app and time each page."""
+    base = args.url.rstrip("/") + "/api/tarot/history"
+    cursor = None
+    latencies = []
+    sizes = []
+    for page in range(1, args.pages + 1):
+        query = {"userId": args.user_id, "limit": PAGE_SIZE}
+        if cursor:
+            query["cursor"] = cursor
+        started = time.perf_counter()
+        with urllib.request.urlopen(f"{base}?{urllib.parse.urlencode(query)}", timeout=30) as response:
+            raw = response.read()
+        latencies.append(time.perf_counter() - started)
+        sizes.append(len(raw))
+        body = json.loads(raw)
+        if not body.get("success"):
+            raise SystemExit(f"Page {page} failed: {body.get('error')}")
+        cursor = body["data"].get("nextCursor")
+        if page == 1 or page % args.report_every == 0 or not cursor:
+            window = summarize(latencies[-args.report_every:])
+            print(f"page {page:>6}: last {window['count']} pages p50 {window['p50'] * 1000:.1f} ms, "
+                  f"p95 {window['p95'] * 1000:.1f} ms, {format_bytes(sum(sizes) / len(sizes))}/page avg")
+        if not cursor:
+            print("Reached the end of the history")
+            break
+    overall = summarize(latencies)
+    print(f"\n{overall['count']} pages: p50 {overall['p50'] * 1000:.1f} ms, p95 {overall['p95'] * 1000:.1f} ms, "
+          f"p99 {overall['p99'] * 1000:.1f} ms")
+
+
+def parse_depths(value):
+    return sorted({int(item) for item in value.split(",") if item})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed and benchmark reading history paging")
+    parser.add_argument("--dsn", default="postgresql:///tarot_bench",
+                        help="PostgreSQL DSN of a scratch database (default: postgresql:///tarot_bench)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="load synthetic readings")
+    seed_parser.add_argument("--rows", type=int, default=200000, help="rows to insert (default: 200000)")
+    seed_parser.add_argument("--users", type=int, default=50, help="users to spread them over (default: 50)")
+    seed_parser.add_argument("--body-chars", type=int, default=2500, help="interpretation length (default: 2500)")
+    seed_parser.add_argument("--reset", action="store_true", help="truncate the table first")
+    seed_parser.add_argument("--seed", type=int, default=0)
+    seed_parser.add_argument("--allow-remote", action="store_true",
+                             help="seed a non-local host (it must still be a scratch database)")
+
+    bench_parser = commands.add_parser("bench", help="time offset vs keyset pages at increasing depth")
+    bench_parser.add_argument("--user-id", default=BENCH_USER_ID)
+    bench_parser.add_argument("--depths", type=parse_depths, default=[1, 10, 100, 1000, 5000],
+                              help="page numbers to sample (default: 1,10,100,1000,5000)")
+    bench_parser.add_argument("--repeat", type=int, default=20, help="runs per point (default: 20)")
+    bench_parser.add_argument("--json", help="write results to this file")
+
+    api_parser = commands.add_parser("api", help="walk /api/tarot/history through the running app")
+    api_parser.add_argument("--url", default="http://localhost:8899")
+    api_parser.add_argument("--user-id", default=BENCH_USER_ID)
+    api_parser.add_argument("--pages", type=int, default=200, help="pages to walk (default: 200)")
+    api_parser.add_argument("--report-every", type=int, default=50)
+
+    args = parser.parse_args()
+    {"seed": seed, "bench": bench, "api": walk_api}[args.command](args)
+
+
+if __name__ == "__main__":
+    main()
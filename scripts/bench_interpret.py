@@ -0,0 +1,259 @@
+"""Streaming benchmark for ``POST /api/tarot/interpret``.
+
+Runs a matrix of spreads x card counts x tones against the route and records,
+per request, time to first body byte, the gaps between chunks, total stream
+time and bytes/sec, then prints percentiles per scenario::
+
+    # 1. start a stub LLM that replays chunks at a fixed rate
+    python scripts/mock_backend.py --port 8901
+    # 2. run the app against it
+    LLM_STUB_URL=http://127.0.0.1:8901/llm/stream pnpm dev
+    # 3. benchmark the route, and the stub alone as a baseline
+    python scripts/bench_interpret.py --url http://localhost:8899/api/tarot/interpret
+    python scripts/bench_interpret.py --url http://127.0.0.1:8901/llm/stream
+
+Subtracting the baseline from the route's numbers gives the route's own
+overhead (body parsing, quota check, prompt building, DB writes) separately
+from model latency. ``--json`` writes the full results for later comparison.
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_stats import summarize, format_bytes
+from tarot_ts import load_spreads, load_cards, request_card
+
+DEFAULT_URL = "http://localhost:8899/api/tarot/interpret"
+DEFAULT_SPREADS = ["single", "three", "cross"]
+TONES = ["none", "mystical", "rational", "warm", "direct"]
+READ_SIZE = 64 * 1024
+
+
+def build_payload(spread, card_count, tone, rng, user_id):
+    cards = rng.sample(load_cards(), card_count)
+    payload = {
+        "userId": user_id,
+        "question": "我的工作发展前景如何？",
+        "spread": spread,
+        "cards": [request_card(card, rng.random() < 0.5) for card in cards],
+    }
+    if tone != "none":
+        payload["tone"] = tone
+    # The stub LLM endpoint takes chat messages rather than a reading.
+    payload["messages"] = [{"role": "user", "content": payload["question"]}]
+    return payload
+
+
+class Client:
+    """One keep-alive connection per worker thread."""
+
+    def __init__(self, url, timeout):
+        self.parts = urllib.parse.urlsplit(url)
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def connection(self, fresh=False):
+        conn = getattr(self.local, "conn", None)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            cls = http.client.HTTPSConnection if self.parts.scheme == "https" else http.client.HTTPConnection
+            conn = self.local.conn = cls(self.parts.netloc, timeout=self.timeout)
+        return conn
+
+    def stream(self, payload, headers):
+        """POST ``payload`` and time the streamed response; returns a result dict."""
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        path = self.parts.path + (f"?{self.parts.query}" if self.parts.query else "")
+        for attempt in range(2):
+            conn = self.connection(fresh=attempt > 0)
+            started = time.perf_counter()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                response = conn.getresponse()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise
+
+        first = last = None
+        gaps = []
+        received = 0
+        content = []
+        while True:
+            chunk = response.read1(READ_SIZE)
+            if not chunk:
+                break
+            now = time.perf_counter()
+            if first is None:
+                first = now
+            else:
+                gaps.append(now - last)
+            last = now
+            received += len(chunk)
+            if len(content) < 4:
+                content.append(chunk)
+        finished = time.perf_counter()
+        if response.will_close:
+            self.local.conn = None
+            conn.close()
+
+        result = {
+            "status": response.status,
+            "ttfb": (first or finished) - started,
+            "total": finished - started,
+            "gaps": gaps,
+            "bytes": received,
+            "error": None,
+        }
+        content_type = response.getheader("Content-Type", "")
+        if response.status != 200:
+            result["error"] = f"HTTP {response.status}"
+        elif content_type.startswith("application/json"):
+            # The route reports failures as a 200 JSON body.
+            try:
+                error = json.loads(b"".join(content)).get("error") or {}
+                result["error"] = error.get("code") or "JSON response"
+            except ValueError:
+                result["error"] = "JSON response"
+        return result
+
+
+def scenarios(spreads, card_counts, tones):
+    by_id = {spread["id"]: spread for spread in load_spreads()}
+    for spread_id in spreads:
+        if spread_id not in by_id:
+            raise SystemExit(f"Unknown spread: {spread_id} (known: {', '.join(by_id)})")
+        spread = by_id[spread_id]
+        counts = card_counts or [len(spread["positions"])]
+        for count in counts:
+            for tone in tones:
+                yield spread, count, tone
+
+
+def run_scenario(client, spread, card_count, tone, args, rng):
+    headers = {"Content-Type": "application/json", "Accept": "text/event-stream"}
+    if args.auth:
+        headers["Authorization"] = args.auth
+    payloads = [
+        build_payload(spread, card_count, tone, rng, args.user_id)
+        for _ in range(args.requests)
+    ]
+    results = []
+
+    def one(payload):
+        try:
+            return client.stream(payload, headers)
+        except Exception as e:
+            return {"status": 0, "ttfb": 0, "total": 0, "gaps": [], "bytes": 0, "error": type(e).__name__}
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(one, payloads))
+    wall = time.perf_counter() - started
+
+    ok = [r for r in results if not r["error"]]
+    errors = {}
+    for r in results:
+        if r["error"]:
+            errors[r["error"]] = errors.get(r["error"], 0) + 1
+    return {
+        "spread": spread["id"],
+        "cards": card_count,
+        "tone": tone,
+        "requests": len(results),
+        "errors": errors,
+        "wall": wall,
+        "ttfb": summarize([r["ttfb"] for r in ok]),
+        "gap": summarize([gap for r in ok for gap in r["gaps"]]),
+        "total": summarize([r["total"] for r in ok]),
+        "throughput": summarize([r["bytes"] / r["total"] for r in ok if r["total"] > 0]),
+        "bytes": summarize([r["bytes"] for r in ok]),
+    }
+
+
+def ms(stats, key):
+    return f"{stats[key] * 1000:.0f}"
+
+
+def print_table(reports):
+    header = (f"{'scenario':<28}{'ok/n':>8}{'ttfb p50':>10}{'p95':>8}{'p99':>8}"
+              f"{'gap p50':>9}{'p95':>8}{'total p50':>11}{'p95':>8}{'rate p50':>12}")
+    print(header)
+    print("-" * len(header))
+    for report in reports:
+        ok = report["requests"] - sum(report["errors"].values())
+        name = f"{report['spread']}/{report['cards']}/{report['tone']}"
+        counts = f"{ok}/{report['requests']}"
+        print(f"{name:<28}{counts:>8}"
+              f"{ms(report['ttfb'], 'p50'):>10}{ms(report['ttfb'], 'p95'):>8}{ms(report['ttfb'], 'p99'):>8}"
+              f"{ms(report['gap'], 'p50'):>9}{ms(report['gap'], 'p95'):>8}"
+              f"{ms(report['total'], 'p50'):>11}{ms(report['total'], 'p95'):>8}"
+              f"{format_bytes(report['throughput']['p50']) + '/s':>12}")
+    print("\n(all times in ms; gap = time between consecutive chunks)")
+
+    failing = [r for r in reports if r["errors"]]
+    if failing:
+        print("\nErrors:")
+        for report in failing:
+            for error, count in sorted(report["errors"].items()):
+                print(f"  {report['spread']}/{report['cards']}/{report['tone']}: {count} x {error}")
+
+
+def parse_list(value, cast=str):
+    return [cast(item) for item in value.split(",") if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the streaming interpret route")
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"endpoint to benchmark (default: {DEFAULT_URL})")
+    parser.add_argument("--spreads", type=parse_list, default=DEFAULT_SPREADS,
+                        help="comma-separated spread ids, or 'all' (default: single,three,cross)")
+    parser.add_argument("--cards", type=lambda v: parse_list(v, int),
+                        help="comma-separated card counts (default: each spread's position count)")
+    parser.add_argument("--tones", type=parse_list, default=["none", "mystical"],
+                        help=f"comma-separated tones from {','.join(TONES)} (default: none,mystical)")
+    parser.add_argument("-n", "--requests", type=int, default=10, help="requests per scenario (default: 10)")
+    parser.add_argument("-c", "--concurrency", type=int, default=2, help="parallel streams (default: 2)")
+    parser.add_argument("--user-id", default="demo-user-id", help="userId sent with each request")
+    parser.add_argument("--auth", help="Authorization header value, e.g. 'Basic ...'")
+    parser.add_argument("--timeout", type=float, default=120, help="socket timeout in seconds")
+    parser.add_argument("--seed", type=int, default=0, help="seed for card draws")
+    parser.add_argument("--json", help="write full results to this file")
+    args = parser.parse_args()
+
+    if args.spreads == ["all"]:
+        args.spreads = [spread["id"] for spread in load_spreads()]
+    for tone in args.tones:
+        if tone not in TONES:
+            raise SystemExit(f"Unknown tone: {tone} (known: {', '.join(TONES)})")
+
+    client = Client(args.url, args.timeout)
+    rng = random.Random(args.seed)
+    reports = []
+    matrix = list(scenarios(args.spreads, args.cards, args.tones))
+    print(f"Benchmarking {args.url}: {len(matrix)} scenarios x {args.requests} requests, "
+          f"concurrency {args.concurrency}\n")
+    for spread, count, tone in matrix:
+        reports.append(run_scenario(client, spread, count, tone, args, rng))
+        print(f"  done {spread['id']}/{count}/{tone}", file=sys.stderr)
+
+    print()
+    print_table(reports)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"url": args.url, "concurrency": args.concurrency, "scenarios": reports}, f, indent=2)
+        print(f"\nWrote {args.json}")
+    if any(report["errors"] for report in reports):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""Simulate many pending checkouts hitting the payment-status endpoint.
+
+Each simulated checkout waits on ``/api/stripe/payment-status/{session_id}``
+until the payment completes, either the old way (``poll``: a plain GET every
+3 s) or the new way (``longpoll``: ``?wait=25&since=<last status>``). The
+script reports how many requests clients made, how many reached the backend
+and how long it took clients to notice completion::
+
+    python scripts/mock_backend.py --set payment-status.pending_ms=5000 \\
+        --set payment-status.pending_jitter_ms=20000
+    NEXT_PUBLIC_BACKEND_URL=http://127.0.0.1:8901 pnpm dev
+    python scripts/bench_payment_status.py --checkouts 200 --mode both
+
+Backend traffic is read from the mock's ``/__mock/stats``. ``--tabs 2`` gives
+every session two concurrent waiters, like a user with the success page open
+twice, to show requests for one session sharing backend lookups. The
+``poll`` mode also works straight against the mock (``--app-url`` equal to
+``--mock-url``) as a no-proxy baseline.
+"""
+
+import json
+import time
+import uuid
+import argparse
+import threading
+import urllib.error
+import urllib.request
+
+from bench_stats import summarize
+
+DEFAULT_APP_URL = "http://localhost:8899"
+DEFAULT_MOCK_URL = "http://127.0.0.1:8901"
+POLL_INTERVAL = 3.0
+WAIT_SECONDS = 25
+PENDING = "pending"
+
+
+def get_json(url, timeout):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+
+def post(url):
+    request = urllib.request.Request(url, data=b"", method="POST")
+    with urllib.request.urlopen(request, timeout=10) as response:
+        response.read()
+
+
+def backend_hits(mock_url):
+    _, body = get_json(f"{mock_url}/__mock/stats", 10)
+    return body["data"]["requests"].get("payment-status", 0)
+
+
+def wait_for_completion(app_url, session_id, mode, deadline, results, lock):
+    """One success-page tab: wait until the session leaves ``pending``."""
+    base = f"{app_url}/api/stripe/payment-status/{session_id}"
+    started = time.monotonic()
+    requests = errors = 0
+    status = PENDING
+    pending_ms = None
+    while time.monotonic() < deadline:
+        if mode == "longpoll":
+            url = f"{base}?wait={WAIT_SECONDS}&since={status}"
+        else:
+            url = base
+        requests += 1
+        try:
+            code, body = get_json(url, WAIT_SECONDS + 10)
+        except OSError:
+            code, body = 0, {}
+        if code != 200:
+            errors += 1
+            time.sleep(POLL_INTERVAL)
+            continue
+        status = body.get("status", status)
+        pending_ms = body.get("pendingMs", pending_ms)
+        if status != PENDING:
+            break
+        if mode == "poll":
+            time.sleep(POLL_INTERVAL)
+
+    seen = time.monotonic() - started
+    with lock:
+        results.append({
+            "session": session_id,
+            "status": status,
+            "requests": requests,
+            "errors": errors,
+            "seen": seen,
+            # Time between the payment completing and this tab noticing it.
+            "lag": seen - pending_ms / 1000 if pending_ms is not None and status != PENDING else None,
+        })
+
+
+def run(args, mode):
+    post(f"{args.mock_url}/__mock/reset")
+    before = backend_hits(args.mock_url)
+    results = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + args.timeout
+    threads = []
+    started = time.monotonic()
+    for _ in range(args.checkouts):
+        session_id = f"cs_bench_{uuid.uuid4().hex}"
+        for _ in range(args.tabs):
+            thread = threading.Thread(
+                target=wait_for_completion,
+                args=(args.app_url, session_id, mode, deadline, results, lock),
+                daemon=True,
+            )
+            thread.start()
+            threads.append(thread)
+        time.sleep(args.ramp / max(args.checkouts, 1))
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    hits = backend_hits(args.mock_url) - before
+
+    unresolved = sum(1 for r in results if r["status"] == PENDING)
+    client_requests = sum(r["requests"] for r in results)
+    lag = summarize([r["lag"] for r in results if r["lag"] is not None])
+    return {
+        "mode": mode,
+        "checkouts": args.checkouts,
+        "tabs": args.tabs,
+        "elapsed": elapsed,
+        "clientRequests": client_requests,
+        "backendRequests": hits,
+        "errors": sum(r["errors"] for r in results),
+        "unresolved": unresolved,
+        "lag": lag,
+    }
+
+
+def print_report(reports):
+    header = (f"{'mode':<10}{'waiters':>8}{'client req':>12}{'backend req':>13}{'per checkout':>14}"
+              f"{'lag p50':>9}{'p95':>8}{'max':>8}{'errors':>8}{'unresolved':>12}")
+    print(header)
+    print("-" * len(header))
+    for r in reports:
+        print(f"{r['mode']:<10}{r['checkouts'] * r['tabs']:>8}{r['clientRequests']:>12}{r['backendRequests']:>13}"
+              f"{r['backendRequests'] / r['checkouts']:>14.1f}"
+              f"{r['lag']['p50']:>9.2f}{r['lag']['p95']:>8.2f}{r['lag']['max']:>8.2f}"
+              f"{r['errors']:>8}{r['unresolved']:>12}")
+    print("\n(lag = seconds between a payment completing and the page noticing it)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test payment-status polling vs long-polling")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help=f"Next.js app (default: {DEFAULT_APP_URL})")
+    parser.add_argument("--mock-url", default=DEFAULT_MOCK_URL, help=f"mock backend (default: {DEFAULT_MOCK_URL})")
+    parser.add_argument("--mode", choices=["poll", "longpoll", "both"], default="both")
+    parser.add_argument("-n", "--checkouts", type=int, default=100, help="pending checkouts (default: 100)")
+    parser.add_argument("--tabs", type=int, default=1, help="concurrent waiters per checkout (default: 1)")
+    parser.add_argument("--ramp", type=float, default=5.0, help="seconds over which checkouts start (default: 5)")
+    parser.add_argument("--timeout", type=float, default=120, help="give up after this many seconds")
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    modes = ["poll", "longpoll"] if args.mode == "both" else [args.mode]
+    reports = []
+    for mode in modes:
+        print(f"Running {mode}: {args.checkouts} checkouts x {args.tabs} tab(s)...")
+        reports.append(run(args, mode))
+    print()
+    print_report(reports)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
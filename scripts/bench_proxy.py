@@ -0,0 +1,282 @@
+"""Measure what ``/api/proxy`` adds on top of talking to the backend directly.
+
+For each payload size the script downloads ``GET /__mock/blob?size=N`` and
+uploads ``POST /__mock/echo`` from the mock backend, first directly and then
+through the Next.js proxy. It reports:
+
+* the latency the proxy adds (p50/p95 total time and time to first byte)
+* the peak RSS growth of the Next.js process while proxying, which stays flat
+  when bodies stream through and grows with the payload when they are buffered
+* how many upstream connections the proxy opened, from the mock's counter,
+  showing keep-alive reuse
+
+Run it like this::
+
+    python scripts/mock_backend.py
+    INTERNAL_BACKEND_URL=http://127.0.0.1:8901 pnpm dev
+    python scripts/bench_proxy.py --sizes 1K,64K,1M,8M -n 20 -c 4
+
+``--gzip`` asks the mock for gzip-encoded blobs and checks that the proxy
+forwards ``Content-Encoding`` and ``Content-Length`` untouched. Memory is read
+from ``/proc/<pid>/status``. The Next.js process is found from the app port,
+or can be given with ``--pid`` (Linux only; otherwise memory is skipped).
+"""
+
+import os
+import json
+import time
+import hashlib
+import argparse
+import threading
+import http.client
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+
+from bench_stats import summarize, format_bytes
+
+DEFAULT_APP_URL = "http://localhost:8899"
+DEFAULT_MOCK_URL = "http://127.0.0.1:8901"
+PROXY_PREFIX = "/api/proxy"
+UNITS = {"K": 1024, "M": 1024 * 1024}
+
+
+def parse_size(value):
+    value = value.strip().upper().rstrip("B")
+    if value and value[-1] in UNITS:
+        return int(float(value[:-1]) * UNITS[value[-1]])
+    return int(value)
+
+
+class Client:
+    """One keep-alive connection per worker thread."""
+
+    def __init__(self, base_url, timeout):
+        self.parts = urllib.parse.urlsplit(base_url)
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def connection(self, fresh=False):
+        conn = getattr(self.local, "conn", None)
+        if conn is None or fresh:
+            if conn is not None:
+                conn.close()
+            cls = http.client.HTTPSConnection if self.parts.scheme == "https" else http.client.HTTPConnection
+            conn = cls(self.parts.netloc, timeout=self.timeout)
+            self.local.conn = conn
+        return conn
+
+    def request(self, method, path, body=None, headers=None):
+        """Return ``(seconds to first byte, total seconds, status, headers, body bytes)``."""
+        for attempt in range(2):
+            conn = self.connection(fresh=attempt > 0)
+            started = time.perf_counter()
+            try:
+                conn.request(method, path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                ttfb = time.perf_counter() - started
+                # Read and discard in blocks so the client never holds the whole payload.
+                digest, size = hashlib.sha256(), 0
+                while True:
+                    block = response.read(1 << 16)
+                    if not block:
+                        break
+                    digest.update(block)
+                    size += len(block)
+                total = time.perf_counter() - started
+                return ttfb, total, response.status, dict(response.getheaders()), (size, digest.hexdigest())
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise
+
+
+def find_listener_pid(port):
+    """Find the pid listening on ``port`` through /proc (Linux); None when unavailable."""
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table) as f:
+                next(f)
+                for line in f:
+                    fields = line.split()
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+    if not inodes:
+        return None
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            for fd in os.listdir(f"/proc/{pid}/fd"):
+                target = os.readlink(f"/proc/{pid}/fd/{fd}")
+                if target.startswith("socket:[") and target[8:-1] in inodes:
+                    return int(pid)
+        except OSError:
+            continue
+    return None
+
+
+def rss_bytes(pid):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        return None
+    return None
+
+
+class RssSampler:
+    """Samples a process's RSS in the background and keeps the peak."""
+
+    def __init__(self, pid, interval=0.01):
+        self.pid = pid
+        self.interval = interval
+        self.peak = self.baseline = rss_bytes(pid) if pid else None
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def run(self):
+        while not self.stop_event.wait(self.interval):
+            rss = rss_bytes(self.pid)
+            if rss is not None and rss > self.peak:
+                self.peak = rss
+
+    def __enter__(self):
+        if self.pid and self.baseline is not None:
+            self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    @property
+    def growth(self):
+        return None if self.baseline is None else self.peak - self.baseline
+
+
+def mock_stats(mock):
+    conn = http.client.HTTPConnection(urllib.parse.urlsplit(mock).netloc, timeout=10)
+    conn.request("GET", "/__mock/stats")
+    data = json.loads(conn.getresponse().read())["data"]
+    conn.close()
+    return data
+
+
+def run_case(client, prefix, direction, size, args, upload_body):
+    if direction == "download":
+        path = f"{prefix}/__mock/blob?size={size}" + ("&gzip=1" if args.gzip else "")
+        method, body, headers = "GET", None, {"Accept-Encoding": "gzip"} if args.gzip else {}
+    else:
+        path = f"{prefix}/__mock/echo"
+        method, body = "POST", upload_body
+        headers = {"Content-Type": "application/octet-stream", "Content-Length": str(len(body))}
+
+    def one(_):
+        return client.request(method, path, body, headers)
+
+    one(None)  # warm-up: opens the connections and fills the mock's blob cache
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        results = list(pool.map(one, range(args.requests)))
+    errors = sum(1 for r in results if r[2] != 200)
+    return results, errors
+
+
+def check_passthrough(direct, proxied):
+    """Compare the first direct and proxied responses; returns a list of differences."""
+    problems = []
+    _, _, _, d_headers, d_body = direct
+    _, _, _, p_headers, p_body = proxied
+    lower = lambda headers: {k.lower(): v for k, v in headers.items()}
+    d_headers, p_headers = lower(d_headers), lower(p_headers)
+    for name in ("content-encoding", "content-length", "content-type"):
+        if d_headers.get(name) != p_headers.get(name):
+            problems.append(f"{name}: direct {d_headers.get(name)!r}, proxy {p_headers.get(name)!r}")
+    if d_body != p_body:
+        problems.append(f"body differs ({d_body[0]} vs {p_body[0]} bytes)")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the /api/proxy pass-through against the mock backend")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help=f"Next.js app (default: {DEFAULT_APP_URL})")
+    parser.add_argument("--mock-url", default=DEFAULT_MOCK_URL, help=f"mock backend (default: {DEFAULT_MOCK_URL})")
+    parser.add_argument("--sizes", default="1K,16K,256K,1M,4M", help="payload sizes (default: 1K,16K,256K,1M,4M)")
+    parser.add_argument("--directions", default="download,upload", help="download, upload or both (default)")
+    parser.add_argument("-n", "--requests", type=int, default=20, help="requests per size and path (default: 20)")
+    parser.add_argument("-c", "--concurrency", type=int, default=4, help="concurrent clients (default: 4)")
+    parser.add_argument("--gzip", action="store_true", help="download gzip-encoded blobs")
+    parser.add_argument("--pid", type=int, help="Next.js server pid for memory sampling (default: find by port)")
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    sizes = [parse_size(s) for s in args.sizes.split(",") if s.strip()]
+    directions = [d.strip() for d in args.directions.split(",") if d.strip()]
+    app_port = urllib.parse.urlsplit(args.app_url).port or 80
+    pid = args.pid or find_listener_pid(app_port)
+    print(f"Next.js pid: {pid or 'not found, skipping memory'}")
+
+    direct = Client(args.mock_url, args.timeout)
+    proxy = Client(args.app_url, args.timeout)
+    reports = []
+    for direction in directions:
+        for size in sizes:
+            upload_body = os.urandom(size) if direction == "upload" else None
+            direct_results, direct_errors = run_case(direct, "", direction, size, args, upload_body)
+            before = mock_stats(args.mock_url)["connections"]
+            with RssSampler(pid) as sampler:
+                proxy_results, proxy_errors = run_case(proxy, PROXY_PREFIX, direction, size, args, upload_body)
+            upstream_connections = mock_stats(args.mock_url)["connections"] - before
+
+            d_total = summarize([r[1] for r in direct_results])
+            p_total = summarize([r[1] for r in proxy_results])
+            d_ttfb = summarize([r[0] for r in direct_results])
+            p_ttfb = summarize([r[0] for r in proxy_results])
+            report = {
+                "direction": direction,
+                "size": size,
+                # Bytes of the payload on the wire: the (possibly gzipped) response, or the request body.
+                "wireBytes": direct_results[0][4][0] if direction == "download" else size,
+                "directP50Ms": d_total["p50"] * 1000,
+                "proxyP50Ms": p_total["p50"] * 1000,
+                "addedP50Ms": (p_total["p50"] - d_total["p50"]) * 1000,
+                "addedP95Ms": (p_total["p95"] - d_total["p95"]) * 1000,
+                "addedTtfbP50Ms": (p_ttfb["p50"] - d_ttfb["p50"]) * 1000,
+                "rssGrowth": sampler.growth,
+                "upstreamConnections": upstream_connections,
+                "errors": direct_errors + proxy_errors,
+                "passthrough": check_passthrough(direct_results[0], proxy_results[0]),
+            }
+            reports.append(report)
+            print(f"  {direction:<8} {format_bytes(size):>9}: direct {report['directP50Ms']:.1f} ms, "
+                  f"proxy {report['proxyP50Ms']:.1f} ms")
+
+    header = (f"{'direction':<10}{'size':>10}{'on wire':>10}{'direct p50':>12}{'+p50 ms':>9}{'+p95 ms':>9}"
+              f"{'+ttfb ms':>10}{'peak RSS +':>12}{'upstream conns':>16}{'errors':>8}")
+    print()
+    print(header)
+    print("-" * len(header))
+    for r in reports:
+        rss = format_bytes(r["rssGrowth"]) if r["rssGrowth"] is not None else "-"
+        print(f"{r['direction']:<10}{format_bytes(r['size']):>10}{format_bytes(r['wireBytes']):>10}"
+              f"{r['directP50Ms']:>12.1f}{r['addedP50Ms']:>9.1f}{r['addedP95Ms']:>9.1f}{r['addedTtfbP50Ms']:>10.1f}"
+              f"{rss:>12}{r['upstreamConnections']:>16}{r['errors']:>8}")
+    print(f"\n({args.requests} requests per row at concurrency {args.concurrency}; "
+          "+ columns are proxy minus direct)")
+
+    mismatches = [(r, p) for r in reports for p in r["passthrough"]]
+    for r, problem in mismatches:
+        print(f"pass-through mismatch ({r['direction']} {format_bytes(r['size'])}): {problem}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
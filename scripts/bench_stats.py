@@ -0,0 +1,32 @@
+"""Small statistics helpers shared by the benchmark scripts."""
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of ``values`` (need not be sorted); 0.0 if empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = -(-pct * len(ordered) // 100)
+    return ordered[max(0, min(len(ordered), int(rank)) - 1)]
+
+
+def summarize(values):
+    """Return count/mean/p50/p95/p99/max for a list of numbers."""
+    if not values:
+        return {"count": 0, "mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "mean": sum(ordered) / len(ordered),
+        "p50": percentile(ordered, 50),
+        "p95": percentile(ordered, 95),
+        "p99": percentile(ordered, 99),
+        "max": ordered[-1],
+    }
+
+
+def format_bytes(size):
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024 or unit == "MiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
@@ -8,6 +8,14 @@ cd "${COZE_WORKSPACE_PATH}"
 echo "Installing dependencies..."
 pnpm install --prefer-frozen-lockfile --prefer-offline --loglevel debug --reporter=append-only
 
+# The shards are committed; only check they match src/data/answers.ts when python3 is available
+if command -v python3 &> /dev/null; then
+    echo "Checking answer book shards..."
+    python3 scripts/build_answer_shards.py --check
+else
+    echo "python3 not found, skipping the answer book shard check"
+fi
+
 echo "Building the project..."
 npx next build
 
@@ -0,0 +1,106 @@
+"""Compile the answer book pools into one compact JSON shard per locale.
+
+``src/data/answers.ts`` holds the ``zh``, ``en`` and ``ja`` pools in a single
+module, so importing it ships all three languages to pick one string. This
+writes ``src/data/answer-shards/<locale>.json`` (a bare JSON array, same order
+as the source so an index means the same answer everywhere). The page loads
+only the active locale's shard with a dynamic ``import()``, and the
+``/api/answer-book/draw`` route serves single answers from the same shards::
+
+    python scripts/build_answer_shards.py            # write shards, print the size report
+    python scripts/build_answer_shards.py --check    # exit 1 if a shard is out of date
+
+``answers.ts`` stays the file to edit. The report compares what a visitor
+downloaded before (every pool) with the active locale's shard and with one
+draw response, raw and gzipped.
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import argparse
+
+from tarot_ts import REPO_ROOT
+from bench_stats import format_bytes
+from build_translation_bundles import Tokens, parse_value, write_if_changed
+
+ANSWERS_TS = os.path.join(REPO_ROOT, "src", "data", "answers.ts")
+SHARDS_DIR = os.path.join(REPO_ROOT, "src", "data", "answer-shards")
+LOCALES = ["zh", "en", "ja"]
+
+
+def load_pools():
+    with open(ANSWERS_TS, encoding="utf-8") as f:
+        text = f.read()
+    start = re.search(r"export const ANSWERS\b[^=]*=\s*", text)
+    if not start:
+        raise SystemExit(f"Could not find `export const ANSWERS` in {os.path.relpath(ANSWERS_TS, REPO_ROOT)}")
+    pools = parse_value(Tokens(text[start.end():]))
+    missing = [locale for locale in LOCALES if not pools.get(locale)]
+    if missing:
+        raise SystemExit(f"answers.ts has no answers for: {', '.join(missing)}")
+    return pools
+
+
+def encode(pool):
+    return json.dumps(pool, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+
+
+def sizes(data):
+    return len(data), len(gzip.compress(data, 9))
+
+
+def report(pools, shards):
+    # Before: the page chunk carried every pool; JSON is a close stand-in for the minified literal.
+    before = sizes(json.dumps(pools, ensure_ascii=False, separators=(",", ":")).encode())
+    header = f"{'locale':<8}{'answers':>9}{'dupes':>7}{'before':>12}{'shard':>12}{'draw response':>15}{'saved':>8}"
+    print(header)
+    print("-" * len(header))
+    for locale in LOCALES:
+        pool = pools[locale]
+        shard = sizes(shards[locale])
+        longest = max(pool, key=lambda answer: len(answer.encode()))
+        draw = sizes(json.dumps({"success": True, "data": {
+            "lang": locale, "index": len(pool) - 1, "total": len(pool), "answer": longest,
+        }}, ensure_ascii=False, separators=(",", ":")).encode())
+        print(f"{locale:<8}{len(pool):>9}{len(pool) - len(set(pool)):>7}{format_bytes(before[1]):>12}"
+              f"{format_bytes(shard[1]):>12}{format_bytes(draw[1]):>15}{1 - shard[1] / before[1]:>8.0%}")
+    print(f"\nSizes are gzipped (before: {format_bytes(before[0])} raw for all pools). "
+          "'draw response' is the largest single answer from /api/answer-book/draw; "
+          "'saved' compares the shard with before. Duplicates are kept: they weight the draw.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write per-locale answer book shards from src/data/answers.ts")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a shard is missing or out of date")
+    args = parser.parse_args()
+
+    pools = load_pools()
+    shards = {locale: encode(pools[locale]) for locale in LOCALES}
+
+    if args.check:
+        stale = []
+        for locale, data in shards.items():
+            try:
+                with open(os.path.join(SHARDS_DIR, f"{locale}.json"), "rb") as f:
+                    current = f.read() == data
+            except OSError:
+                current = False
+            if not current:
+                stale.append(locale)
+        if stale:
+            print(f"Answer shards out of date: {', '.join(stale)}; run scripts/build_answer_shards.py")
+            sys.exit(1)
+        print("Answer shards are up to date")
+        return
+
+    written = [locale for locale, data in shards.items()
+               if write_if_changed(os.path.join(SHARDS_DIR, f"{locale}.json"), data)]
+    print(f"Wrote {len(written)} of {len(shards)} shard(s) to {os.path.relpath(SHARDS_DIR, REPO_ROOT)}\n")
+    report(pools, shards)
+
+
+if __name__ == "__main__":
+    main()
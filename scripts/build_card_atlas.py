@@ -0,0 +1,149 @@
+"""Pack card thumbnails into per-suit sprite sheets.
+
+The gallery and spread selector otherwise fire one request per card. This
+builds one atlas for the Major Arcana and one per Minor suit under
+public/tarot-cards/atlas, plus an index.json mapping each card ``id`` to its
+sheet and rectangle, so thumbnails render from five requests and full-size art
+is only fetched when a card is opened::
+
+    python scripts/build_card_atlas.py
+
+Output is deterministic: cards are laid out in id order and images are encoded
+without metadata, so an unchanged deck yields byte-identical sheets (and the
+same ``?v=`` hash in their URLs). Requires Pillow.
+"""
+
+import os
+import io
+import json
+import hashlib
+import argparse
+
+from tarot_registry import CARDS, LOCAL_URL_PREFIX
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PUBLIC_ROOT = os.environ.get("TAROT_PUBLIC_ROOT", "public")
+OUTPUT_DIR = os.path.join(PUBLIC_ROOT, "tarot-cards", "atlas")
+URL_PREFIX = "/tarot-cards/atlas"
+INDEX_VERSION = 1
+
+THUMB_WIDTH = 120
+COLUMNS = 7
+PADDING = 2
+SHEETS = ["major", "wands", "cups", "swords", "pentacles"]
+FORMATS = {
+    "webp": {"format": "WEBP", "quality": 82, "method": 6},
+    "png": {"format": "PNG", "optimize": True},
+}
+
+
+def load_cards():
+    """Return ``[(id, sheet, image_url)]`` for every card, sorted by id."""
+    return [
+        (card.id, (card.suit or "major").lower(), LOCAL_URL_PREFIX + card.path)
+        for card in CARDS
+    ]
+
+
+def make_thumbnail(image_url):
+    with Image.open(os.path.join(PUBLIC_ROOT, image_url.lstrip("/"))) as image:
+        image = image.convert("RGB")
+        height = round(image.height * THUMB_WIDTH / image.width)
+        return image.resize((THUMB_WIDTH, height), Image.LANCZOS)
+
+
+def pack_sheet(cards):
+    """Lay thumbnails out on a fixed-column grid; returns ``(image, rects)``."""
+    thumbs = [(card_id, make_thumbnail(url)) for card_id, _, url in cards]
+    cell_width = THUMB_WIDTH + PADDING
+    cell_height = max(thumb.height for _, thumb in thumbs) + PADDING
+    columns = min(COLUMNS, len(thumbs))
+    rows = -(-len(thumbs) // columns)
+
+    sheet = Image.new("RGB", (columns * cell_width, rows * cell_height), (0, 0, 0))
+    rects = {}
+    for index, (card_id, thumb) in enumerate(thumbs):
+        x = (index % columns) * cell_width
+        y = (index // columns) * cell_height
+        sheet.paste(thumb, (x, y))
+        rects[card_id] = {"x": x, "y": y, "w": thumb.width, "h": thumb.height}
+    return sheet, rects
+
+
+def write_if_changed(path, data):
+    """Write ``data`` only when it differs, so unchanged sheets keep their mtime."""
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build(fmt):
+    cards = load_cards()
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    index = {
+        "version": INDEX_VERSION,
+        "thumbWidth": THUMB_WIDTH,
+        "sheets": {},
+        "cards": {},
+    }
+
+    for name in SHEETS:
+        members = [card for card in cards if card[1] == name]
+        if not members:
+            continue
+        sheet, rects = pack_sheet(members)
+        buffer = io.BytesIO()
+        sheet.save(buffer, **FORMATS[fmt])
+        data = buffer.getvalue()
+        digest = hashlib.sha256(data).hexdigest()
+
+        filename = f"{name}.{fmt}"
+        changed = write_if_changed(os.path.join(OUTPUT_DIR, filename), data)
+        print(f"{'Wrote' if changed else 'Unchanged'}: {filename} "
+              f"({len(members)} cards, {sheet.width}x{sheet.height}, {len(data):,} bytes)")
+
+        index["sheets"][name] = {
+            "url": f"{URL_PREFIX}/{filename}?v={digest[:12]}",
+            "width": sheet.width,
+            "height": sheet.height,
+            "bytes": len(data),
+            "sha256": digest,
+        }
+        for card_id, rect in rects.items():
+            index["cards"][str(card_id)] = {"sheet": name, **rect}
+
+    payload = (json.dumps(index, indent=2, sort_keys=True) + "\n").encode()
+    write_if_changed(os.path.join(OUTPUT_DIR, "index.json"), payload)
+
+    source_bytes = sum(os.path.getsize(os.path.join(PUBLIC_ROOT, url.lstrip("/"))) for _, _, url in cards)
+    atlas_bytes = sum(sheet["bytes"] for sheet in index["sheets"].values())
+    print(f"\n{len(index['cards'])} cards in {len(index['sheets'])} sheets: "
+          f"{atlas_bytes:,} bytes in {len(index['sheets'])} requests "
+          f"(vs {source_bytes:,} bytes in {len(cards)} requests for full-size art)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build tarot card thumbnail atlases")
+    parser.add_argument("--format", choices=sorted(FORMATS), default="webp",
+                        help="sheet image format (default: webp)")
+    args = parser.parse_args()
+
+    if Image is None:
+        raise SystemExit("Pillow is required: pip install Pillow")
+    build(args.format)
+
+
+if __name__ == "__main__":
+    main()
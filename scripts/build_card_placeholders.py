@@ -0,0 +1,162 @@
+"""Precompute low-quality image placeholders for the tarot card art.
+
+For every card image under ``public/tarot-cards/result`` this records the
+intrinsic size, the average colour and a tiny blurred WebP preview (a few
+hundred bytes as a data URL) in ``src/lib/card-placeholders.json``. ``TarotCardDisplay`` and
+``TarotResult`` paint the preview and reserve the card's aspect ratio while the
+full PNG downloads::
+
+    python scripts/build_card_placeholders.py            # only changed images
+    python scripts/build_card_placeholders.py --force    # recompute everything
+    python scripts/build_card_placeholders.py --check    # exit 1 if out of date
+
+Images are decoded on a process pool. Each entry stores a SHA-256 prefix of the
+source file, so a rerun only decodes images whose content changed (or
+all of them when the preview settings change). Requires Pillow.
+"""
+
+import os
+import io
+import sys
+import json
+import time
+import base64
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    from PIL import Image, ImageFilter
+except ImportError:
+    raise SystemExit("Pillow is required: pip install Pillow")
+
+from tarot_ts import REPO_ROOT, load_cards
+from fingerprint_assets import source_url
+
+PUBLIC_DIR = os.path.join(REPO_ROOT, "public")
+# Only the card art itself: generated variants and atlases under tarot-cards/ would bloat
+# the JSON, which ships in the client bundle.
+IMAGES_DIR = os.path.join(PUBLIC_DIR, "tarot-cards", "result")
+OUTPUT_PATH = os.path.join(REPO_ROOT, "src", "lib", "card-placeholders.json")
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+
+PREVIEW_WIDTH = 12
+PREVIEW_QUALITY = 40
+BLUR_RADIUS = 0.6
+# Changing any preview setting invalidates every cached entry.
+SETTINGS = f"w{PREVIEW_WIDTH}-q{PREVIEW_QUALITY}-b{BLUR_RADIUS}"
+# The JSON ships in the client bundle, so keep the content hash short.
+HASH_CHARS = 16
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()[:HASH_CHARS]
+
+
+def url_for(path):
+    return "/" + os.path.relpath(path, PUBLIC_DIR).replace(os.sep, "/")
+
+
+def compute_placeholder(path):
+    """Decode one image; runs in a worker process."""
+    with open(path, "rb") as f:
+        data = f.read()
+    with Image.open(io.BytesIO(data)) as image:
+        width, height = image.size
+        image.draft("RGB", (PREVIEW_WIDTH * 4, PREVIEW_WIDTH * 8))  # JPEG only: decode at reduced scale
+        image = image.convert("RGB")
+        color = image.resize((1, 1), Image.Resampling.BOX).getpixel((0, 0))
+        preview_height = max(1, round(height * PREVIEW_WIDTH / width))
+        preview = image.resize((PREVIEW_WIDTH, preview_height), Image.Resampling.LANCZOS)
+        preview = preview.filter(ImageFilter.GaussianBlur(BLUR_RADIUS))
+        buffer = io.BytesIO()
+        preview.save(buffer, "WEBP", quality=PREVIEW_QUALITY, method=6)
+    return url_for(path), {
+        "width": width,
+        "height": height,
+        "color": "#{:02x}{:02x}{:02x}".format(*color),
+        "blurDataURL": "data:image/webp;base64," + base64.b64encode(buffer.getvalue()).decode(),
+        "hash": hashlib.sha256(data).hexdigest()[:HASH_CHARS],
+    }
+
+
+def find_images():
+    images = []
+    for root, _, files in os.walk(IMAGES_DIR):
+        images.extend(os.path.join(root, name) for name in files if name.lower().endswith(IMAGE_EXTENSIONS))
+    return sorted(images)
+
+
+def load_existing():
+    try:
+        with open(OUTPUT_PATH, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None, {}
+    return data.get("settings"), data.get("images", {})
+
+
+def encode(settings, entries):
+    data = {"settings": settings, "images": dict(sorted(entries.items()))}
+    return json.dumps(data, ensure_ascii=False, indent=2) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute placeholders for the tarot card images")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(), help="worker processes (default: CPU count)")
+    parser.add_argument("--force", action="store_true", help="recompute every image")
+    parser.add_argument("--check", action="store_true", help="exit 1 if the placeholders are out of date; write nothing")
+    args = parser.parse_args()
+
+    existing_settings, existing = load_existing()
+    reuse = not args.force and existing_settings == SETTINGS
+    images = find_images()
+    entries, stale = {}, []
+    for path in images:
+        url = url_for(path)
+        cached = existing.get(url)
+        if reuse and cached and cached.get("hash") == file_digest(path):
+            entries[url] = cached
+        else:
+            stale.append(path)
+    removed = sorted(set(existing) - {url_for(path) for path in images})
+
+    if args.check:
+        for path in stale:
+            print(f"out of date: {url_for(path)}")
+        for url in removed:
+            print(f"no longer exists: {url}")
+        sys.exit(1 if stale or removed else 0)
+
+    started = time.perf_counter()
+    if stale:
+        with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+            entries.update(pool.map(compute_placeholder, stale, chunksize=4))
+    elapsed = time.perf_counter() - started
+
+    content = encode(SETTINGS, entries)
+    if content != encode(existing_settings, existing):
+        with open(OUTPUT_PATH + ".tmp", "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(OUTPUT_PATH + ".tmp", OUTPUT_PATH)
+
+    sizes = [len(entry["blurDataURL"]) for entry in entries.values()]
+    print(f"{len(images)} images: {len(stale)} computed in {elapsed:.2f}s with {args.jobs} worker(s), "
+          f"{len(images) - len(stale)} unchanged, {len(removed)} removed")
+    if sizes:
+        print(f"preview data URLs: avg {sum(sizes) / len(sizes):.0f} B, max {max(sizes)} B, "
+              f"total {sum(sizes):,} B")
+
+    card_urls = {source_url(card["imageUrl"]) for card in load_cards() if card.get("imageUrl")}
+    missing = sorted(card_urls - set(entries))
+    if missing:
+        print(f"warning: {len(missing)} card image(s) referenced in tarot-cards.ts not found: "
+              + ", ".join(missing[:5]))
+
+
+if __name__ == "__main__":
+    main()
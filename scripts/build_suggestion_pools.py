@@ -0,0 +1,286 @@
+"""Precompute suggested-question pools per (spread category, locale, tone).
+
+The questions offered before a reading depend on the spread category, the
+language and the reading tone, not on the user. So they are generated offline
+in bulk and served from an index instead of costing an LLM call per visitor.
+This job asks an OpenAI-compatible chat completions endpoint for batches of
+questions and keeps the unique ones, with at most ``-j`` calls in flight. It
+writes::
+
+    src/data/suggestion-pools.json   {"version", "model", "generatedAt", "pools": {"love/zh/warm": [...]}}
+
+``GET /api/tarot/suggest`` picks from these pools and only falls back to a
+live LLM call for combinations the index does not cover. The committed index
+is empty, so the ``SuggestedQuestions`` panel keeps its built-in questions and
+does not call the route; wire it up only once a generated index covers every
+combination. Runs are incremental: existing pools are topped up to ``--target`` unless ``--fresh``
+is given::
+
+    LLM_API_KEY=... python scripts/build_suggestion_pools.py --llm-url https://.../v1/chat/completions --model deepseek-chat
+    python scripts/build_suggestion_pools.py --only 'love/*/*' --target 80 -j 8
+
+For a dry run against the mock backend's stub LLM (writes elsewhere so stub
+text never lands in the app)::
+
+    python scripts/mock_backend.py
+    python scripts/build_suggestion_pools.py --llm-url http://127.0.0.1:8901/llm/chat/completions \\
+        --model stub --out /tmp/suggestion-pools.json
+
+Duplicates are dropped after normalisation (width, case, whitespace,
+punctuation, list markers). A pool stops early when ``--patience`` calls in a
+row add nothing new, so a model that keeps repeating itself does not burn the
+budget.
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import time
+import fnmatch
+import argparse
+import itertools
+import unicodedata
+import urllib.error
+import urllib.request
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+from tarot_ts import REPO_ROOT
+from bench_stats import format_bytes
+from build_translation_bundles import write_if_changed
+
+TAROT_TS = os.path.join(REPO_ROOT, "src", "lib", "tarot.ts")
+DEFAULT_OUT = os.path.join(REPO_ROOT, "src", "data", "suggestion-pools.json")
+FORMAT_VERSION = 1
+LOCALES = ["zh", "en", "ja"]
+LANGUAGE_NAMES = {"zh": "简体中文", "en": "English", "ja": "日本語"}
+
+# Keep in sync with src/lib/suggestion-pool.ts (prompt for live generation) and the tone options on the ai-tarot page.
+TONE_INSTRUCTIONS = {
+    "mystical": "语气神秘且富有启发性，可以适度运用意象与象征。",
+    "rational": "语气理性、具体，聚焦可以分析和行动的问题。",
+    "warm": "语气温暖、治愈，关注情绪与自我关怀。",
+    "direct": "语气直接、简洁，直指关键问题。",
+}
+CATEGORY_TOPICS = {
+    "recommended": "日常生活中的常见困惑（感情、工作、选择、成长均可）",
+    "basic": "近期的状况与走向",
+    "love": "感情、恋爱与亲密关系",
+    "decision": "面临的选择与决定",
+    "career": "工作、事业与学业发展",
+    "self": "自我认知、内在成长与情绪",
+    "advanced": "人生阶段、长期方向与深层课题",
+}
+
+CATEGORY_RE = re.compile(r"\bcategory:\s*'([a-z]+)'")
+LIST_MARKER_RE = re.compile(r"^\s*(?:[-*•·]|\d+[.、)）]|[（(]\d+[)）])\s*")
+MIN_CHARS, MAX_CHARS = 4, 80
+RETRIES = 3
+
+
+def spread_categories():
+    """Spread categories in the order they first appear in tarot.ts."""
+    with open(TAROT_TS, encoding="utf-8") as f:
+        found = CATEGORY_RE.findall(f.read())
+    return list(dict.fromkeys(found)) or list(CATEGORY_TOPICS)
+
+
+def build_messages(category, locale, tone, count):
+    system = ("你是一位专业的塔罗牌解读师。请为准备抽牌的用户写一些可以向塔罗提问的问题。"
+              "每个问题单独一行，不要编号、不要解释、不要引号。")
+    user = (f"主题：{CATEGORY_TOPICS.get(category, category)}\n"
+            f"语言：{LANGUAGE_NAMES[locale]}（locale: {locale}）\n"
+            f"{TONE_INSTRUCTIONS[tone]}\n"
+            f"请写 {count} 个彼此不同、以第一人称提出的问题（count: {count}），每个不超过 40 个字。")
+    return [{"role": "system", "content": system}, {"role": "user", "content": user}]
+
+
+def clean_line(line):
+    line = LIST_MARKER_RE.sub("", line.strip()).strip().strip("\"'“”「」")
+    return line if MIN_CHARS <= len(line) <= MAX_CHARS else None
+
+
+def dedupe_key(text):
+    """Width-, case-, whitespace- and punctuation-insensitive form used to detect duplicates."""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return "".join(ch for ch in text if unicodedata.category(ch)[0] not in "PZS")
+
+
+class ChatClient:
+    def __init__(self, url, model, api_key, temperature, timeout):
+        self.url = url
+        self.model = model
+        self.api_key = api_key
+        self.temperature = temperature
+        self.timeout = timeout
+
+    def complete(self, messages):
+        body = json.dumps({"model": self.model, "messages": messages, "temperature": self.temperature}).encode()
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        for attempt in range(RETRIES):
+            request = urllib.request.Request(self.url, data=body, headers=headers, method="POST")
+            try:
+                with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                    payload = json.loads(response.read())
+                return payload["choices"][0]["message"]["content"] or ""
+            except urllib.error.HTTPError as error:
+                # Client errors other than rate limiting will not get better by retrying.
+                if attempt == RETRIES - 1 or (400 <= error.code < 500 and error.code != 429):
+                    raise
+                delay = float(error.headers.get("Retry-After") or 2 ** attempt)
+            except (urllib.error.URLError, TimeoutError, ConnectionError):
+                if attempt == RETRIES - 1:
+                    raise
+                delay = 2 ** attempt
+            time.sleep(delay)
+
+
+class PoolJob:
+    """Generation state for one (category, locale, tone) pool."""
+
+    def __init__(self, key, existing, target, max_calls, patience):
+        self.key = key
+        self.questions = list(existing)
+        self.seen = {dedupe_key(q) for q in self.questions}
+        self.target = target
+        self.max_calls = max_calls
+        self.patience = patience
+        self.calls = self.in_flight = self.stalled = self.received = self.failures = 0
+
+    @property
+    def done(self):
+        return (len(self.questions) >= self.target or self.calls >= self.max_calls
+                or self.stalled >= self.patience)
+
+    def wants_call(self, batch):
+        # Enough calls in flight to cover what is still missing, no more.
+        missing = self.target - len(self.questions)
+        return not self.done and self.calls + self.in_flight < self.max_calls and self.in_flight * batch < missing
+
+    def add(self, text):
+        added = 0
+        for line in text.splitlines():
+            question = clean_line(line)
+            if question is None:
+                continue
+            self.received += 1
+            key = dedupe_key(question)
+            if key and key not in self.seen and len(self.questions) < self.target:
+                self.seen.add(key)
+                self.questions.append(question)
+                added += 1
+        self.stalled = 0 if added else self.stalled + 1
+        return added
+
+
+def run(jobs, client, args):
+    """Drive all jobs with at most ``args.concurrency`` LLM calls in flight."""
+    started = time.monotonic()
+    queue = itertools.cycle(jobs)
+    in_flight = {}
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        while True:
+            # Round-robin so every pool makes progress instead of one pool hogging the workers.
+            for _ in range(len(jobs)):
+                if len(in_flight) >= args.concurrency:
+                    break
+                job = next(queue)
+                if job.wants_call(args.batch):
+                    category, locale, tone = job.key.split("/")
+                    future = pool.submit(client.complete, build_messages(category, locale, tone, args.batch))
+                    in_flight[future] = job
+                    job.in_flight += 1
+            if not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                job = in_flight.pop(future)
+                job.in_flight -= 1
+                job.calls += 1
+                try:
+                    job.add(future.result())
+                except Exception as error:  # noqa: BLE001 - one failed call should not stop the batch
+                    job.failures += 1
+                    job.stalled += 1
+                    print(f"  {job.key}: call failed: {error}", file=sys.stderr)
+                if job.done and not job.in_flight:
+                    print(f"  {job.key}: {len(job.questions)} questions after {job.calls} call(s)")
+    return time.monotonic() - started
+
+
+def load_existing(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get("pools", {}) if data.get("version") == FORMAT_VERSION else {}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate suggested-question pools per spread category, locale and tone")
+    parser.add_argument("--llm-url", default=os.environ.get("SUGGEST_LLM_URL"),
+                        help="OpenAI-compatible chat completions URL (default: $SUGGEST_LLM_URL)")
+    parser.add_argument("--model", default=os.environ.get("LLM_MODEL", "deepseek-chat"))
+    parser.add_argument("--api-key-env", default="LLM_API_KEY", help="environment variable holding the API key")
+    parser.add_argument("--temperature", type=float, default=1.0)
+    parser.add_argument("--target", type=int, default=60, help="questions per pool (default: 60)")
+    parser.add_argument("--batch", type=int, default=12, help="questions requested per call (default: 12)")
+    parser.add_argument("--max-calls", type=int, help="calls per pool (default: 3x what the target needs)")
+    parser.add_argument("--patience", type=int, default=3, help="stop a pool after this many calls add nothing")
+    parser.add_argument("-j", "--concurrency", type=int, default=4, help="LLM calls in flight (default: 4)")
+    parser.add_argument("--only", action="append", metavar="CATEGORY/LOCALE/TONE",
+                        help="glob of pools to (re)generate, e.g. 'love/*/*' (repeatable)")
+    parser.add_argument("--fresh", action="store_true", help="discard existing pools instead of topping them up")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"index file (default: {os.path.relpath(DEFAULT_OUT, REPO_ROOT)})")
+    args = parser.parse_args()
+
+    if not args.llm_url:
+        raise SystemExit("No LLM endpoint: pass --llm-url or set SUGGEST_LLM_URL")
+    max_calls = args.max_calls or 3 * -(-args.target // args.batch)
+
+    existing = {} if args.fresh else load_existing(args.out)
+    keys = [f"{c}/{l}/{t}" for c in spread_categories() for l in LOCALES for t in TONE_INSTRUCTIONS]
+    selected = [k for k in keys if not args.only or any(fnmatch.fnmatch(k, pattern) for pattern in args.only)]
+    if not selected:
+        raise SystemExit(f"--only matched no pools (pools look like {keys[0]})")
+    jobs = [PoolJob(k, existing.get(k, []), args.target, max_calls, args.patience) for k in selected]
+    todo = [job for job in jobs if not job.done]
+    print(f"{len(selected)} pool(s) selected, {len(todo)} below target {args.target}; "
+          f"{args.concurrency} call(s) in flight against {args.llm_url}")
+
+    client = ChatClient(args.llm_url, args.model, os.environ.get(args.api_key_env), args.temperature, args.timeout)
+    elapsed = run(todo, client, args)
+
+    pools = dict(existing)
+    pools.update({job.key: job.questions for job in jobs if job.questions})
+    artifact = {
+        "version": FORMAT_VERSION,
+        "model": args.model,
+        "generatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "pools": dict(sorted(pools.items())),
+    }
+    data = json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+    write_if_changed(os.path.abspath(args.out), data)
+
+    calls = sum(job.calls for job in todo)
+    received = sum(job.received for job in todo)
+    added = sum(len(job.questions) for job in todo) - sum(len(existing.get(job.key, [])) for job in todo)
+    short = [job.key for job in jobs if len(job.questions) < args.target]
+    print(f"\n{calls} call(s) in {elapsed:.1f}s ({calls / elapsed if elapsed else 0:.1f}/s), "
+          f"{sum(job.failures for job in todo)} failed; {received} questions received, {added} kept "
+          f"({1 - added / received if received else 0:.0%} duplicates or rejected)")
+    print(f"Wrote {len(pools)} pool(s), {sum(map(len, pools.values()))} questions to {args.out} "
+          f"({format_bytes(len(data))}, {format_bytes(len(gzip.compress(data)))} gzipped)")
+    if short:
+        print(f"{len(short)} pool(s) below target (served live for now if empty): {', '.join(short[:8])}"
+              + (" ..." if len(short) > 8 else ""))
+
+
+if __name__ == "__main__":
+    main()
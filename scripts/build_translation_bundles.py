@@ -0,0 +1,422 @@
+"""Split the translation dictionaries into per-route, per-locale JSON bundles.
+
+``src/lib/translations/{zh,en,ja}.ts`` are imported whole, so every page
+ships every key. This scans ``src/app``, ``src/components`` and ``src/lib``
+for translation usage (``t.home.title``, aliases such as ``const c =
+t.cookiePolicy`` and dynamic lookups like ``t.palmLines[key]``), follows each
+page's imports, and writes::
+
+    public/i18n/<locale>/_shared.json   keys used by the root layout (header, sidebar, footer)
+    public/i18n/<locale>/<route>.json   the remaining keys that route needs
+    public/i18n/manifest.json           route -> bundle URLs (with ?v= content hashes) and sizes
+
+It then reports, per route, the bytes of the locale's shared and route bundles
+against the whole dictionary. Keys no source file reaches are listed as
+unused, and keys missing from a locale are flagged::
+
+    python scripts/build_translation_bundles.py
+    python scripts/build_translation_bundles.py --dry-run --list-unused
+
+Nothing in ``src/`` loads these bundles yet, so this is an opt-in report rather
+than a build step: run it to see what per-route loading would save, or before
+wiring a route to fetch its bundle.
+
+The analysis is conservative. A dynamic index or an alias that escapes keeps
+the whole subtree, so a bundle may hold keys a route does not need but never
+misses one it does.
+"""
+
+import os
+import re
+import json
+import hashlib
+import argparse
+
+from tarot_ts import REPO_ROOT
+
+SRC_DIR = os.path.join(REPO_ROOT, "src")
+APP_DIR = os.path.join(SRC_DIR, "app")
+TRANSLATIONS_DIR = os.path.join(SRC_DIR, "lib", "translations")
+OUTPUT_DIR = os.path.join(REPO_ROOT, "public", "i18n")
+URL_PREFIX = "/i18n"
+LOCALES = ["zh", "en", "ja"]
+SOURCE_LOCALE = "zh"  # TranslationType is typeof zh
+SHARED = "_shared"
+MANIFEST_VERSION = 1
+
+IMPORT_RE = re.compile(r"""(?:from\s+|import\s*\(\s*|import\s+)['"]([^'"]+)['"]""")
+# ``t`` not preceded by an identifier or a member access (``...t.x`` spreads are usages)
+NOT_MEMBER = r"(?<![\w$])(?:(?<=\.\.\.)|(?<!\.))"
+USAGE_RE = re.compile(NOT_MEMBER + r"t((?:\s*\??\.\s*[A-Za-z_$][\w$]*)+)(\s*(?:\?\.)?\[)?")
+ALIAS_RE = re.compile(r"\b(?:const|let|var)\s+([A-Za-z_$][\w$]*)\s*=\s*t((?:\??\.[A-Za-z_$][\w$]*)+)\b(?!\s*\()")
+DESTRUCTURE_RE = re.compile(r"\b(?:const|let|var)\s*\{([^}]*)\}\s*=\s*t((?:\??\.[A-Za-z_$][\w$]*)*)\s*[;\n]")
+WHOLE_RE = re.compile(r"=\{\s*t\s*\}|\w\(\s*t\s*[,)]")
+EXTENSIONS = ["", ".tsx", ".ts", "/index.tsx", "/index.ts"]
+
+
+# --- reading the dictionaries ------------------------------------------------
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+|//[^\n]*|/\*.*?\*/)
+  | (?P<str>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`(?:[^`\\]|\\.)*`)
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,])
+""", re.VERBOSE | re.DOTALL)
+ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "'": "'", '"': '"', "\\": "\\", "`": "`", "0": "\0"}
+
+
+def unquote(literal):
+    body = literal[1:-1]
+    if literal[0] == "`" and "${" in body:
+        raise ValueError(f"template literal with substitutions: {literal[:40]}")
+    return re.sub(
+        r"\\(u\{?[0-9a-fA-F]+\}?|.)",
+        lambda m: chr(int(m.group(1)[1:].strip("{}"), 16)) if m.group(1)[0] == "u" else ESCAPES.get(m.group(1), m.group(1)),
+        body,
+    )
+
+
+def tokenize(text):
+    pos = 0
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            raise ValueError(f"unexpected character {text[pos]!r} at offset {pos}")
+        pos = match.end()
+        if match.lastgroup != "ws":
+            yield match.lastgroup, match.group()
+
+
+class Tokens:
+    """Lazy token stream with one token of lookahead (the file continues past the literal)."""
+
+    def __init__(self, text):
+        self.stream = tokenize(text)
+        self.lookahead = None
+
+    def peek(self):
+        if self.lookahead is None:
+            self.lookahead = next(self.stream)
+        return self.lookahead
+
+    def next(self):
+        token = self.peek()
+        self.lookahead = None
+        return token
+
+
+def parse_value(tokens):
+    kind, value = tokens.next()
+    if value in ("{", "["):
+        close = "}" if value == "{" else "]"
+        container = {} if value == "{" else []
+        while True:
+            if tokens.peek()[1] == close:
+                tokens.next()
+                return container
+            if tokens.peek()[1] == ",":
+                tokens.next()
+                continue
+            if isinstance(container, list):
+                container.append(parse_value(tokens))
+                continue
+            kind, key = tokens.next()
+            key = unquote(key) if kind == "str" else key
+            if tokens.next()[1] != ":":
+                raise ValueError(f"expected ':' after {key}")
+            container[key] = parse_value(tokens)
+    if kind == "str":
+        return unquote(value)
+    if kind == "num":
+        return float(value) if "." in value else int(value)
+    if value in ("true", "false"):
+        return value == "true"
+    raise ValueError(f"unsupported value {value!r}")
+
+
+def load_dictionary(locale):
+    with open(os.path.join(TRANSLATIONS_DIR, f"{locale}.ts"), encoding="utf-8") as f:
+        text = f.read()
+    start = re.search(rf"export const {locale}\b[^=]*=\s*", text)
+    if not start:
+        raise SystemExit(f"Could not find `export const {locale}` in {locale}.ts")
+    return parse_value(Tokens(text[start.end():]))
+
+
+# --- scanning usage ----------------------------------------------------------
+
+def resolve_import(spec, importer):
+    if spec.startswith("@/"):
+        base = os.path.join(SRC_DIR, spec[2:])
+    elif spec.startswith("."):
+        base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+    else:
+        return None
+    for ext in EXTENSIONS:
+        path = base + ext
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+class SourceIndex:
+    """Parses each source file once: its local imports and the translation paths it uses."""
+
+    def __init__(self):
+        self.imports = {}
+        self.usages = {}
+
+    def scan(self, path):
+        if path in self.imports:
+            return
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        self.imports[path] = {
+            resolved for spec in IMPORT_RE.findall(text)
+            if (resolved := resolve_import(spec, path)) and not resolved.startswith(TRANSLATIONS_DIR)
+        }
+        self.usages[path] = extract_usages(text) if "useI18n" in text else []
+        for dependency in self.imports[path]:
+            self.scan(dependency)
+
+    def reachable(self, entry):
+        self.scan(entry)
+        seen, stack = set(), [entry]
+        while stack:
+            path = stack.pop()
+            if path not in seen:
+                seen.add(path)
+                stack.extend(self.imports[path])
+        return seen
+
+
+def split_path(chain):
+    return [part.strip(" \t\n?") for part in chain.split(".") if part.strip(" \t\n?")]
+
+
+def extract_usages(text):
+    """Return ``[(path_segments, dynamic)]`` for every translation access in ``text``."""
+    usages = []
+    if WHOLE_RE.search(text):
+        usages.append(([], True))
+    for match in USAGE_RE.finditer(text):
+        usages.append((split_path(match.group(1)), bool(match.group(2))))
+
+    aliases = {name: split_path(chain) for name, chain in ALIAS_RE.findall(text)}
+    for names, chain in DESTRUCTURE_RE.findall(text):
+        prefix = split_path(chain)
+        for name in names.split(","):
+            key, _, local = name.partition(":")
+            key, local = key.strip(), (local or key).strip()
+            if key and not key.startswith("..."):
+                aliases[local] = prefix + [key]
+            elif key.startswith("..."):
+                usages.append((prefix, True))
+    for name, prefix in aliases.items():
+        alias_re = re.compile(NOT_MEMBER + rf"{re.escape(name)}((?:\s*\??\.\s*[A-Za-z_$][\w$]*)*)(\s*(?:\?\.)?\[)?")
+        for match in alias_re.finditer(text):
+            rest = split_path(match.group(1))
+            # A bare alias (passed around, spread, returned) may be read anywhere.
+            usages.append((prefix + rest, bool(match.group(2)) or not rest))
+    return usages
+
+
+def resolve_usage(dictionary, segments):
+    """Walk ``segments`` into the dictionary; returns the deepest existing key path."""
+    node, path = dictionary, []
+    for segment in segments:
+        if not isinstance(node, dict) or segment not in node:
+            break
+        node = node[segment]
+        path.append(segment)
+    return tuple(path)
+
+
+def leaf_paths(node, prefix=()):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            yield from leaf_paths(value, prefix + (key,))
+    else:
+        yield prefix
+
+
+def select(dictionary, paths):
+    """Build the smallest sub-dictionary containing every path (a path keeps its whole subtree)."""
+    result, kept = {}, []
+    for path in sorted(paths, key=len):
+        if not path:
+            return dictionary
+        if covered(path, kept):
+            continue
+        node, target = dictionary, result
+        for key in path[:-1]:
+            node = node[key]
+            target = target.setdefault(key, {})
+        target[path[-1]] = node[path[-1]]
+        kept.append(path)
+    return result
+
+
+def covered(path, used):
+    return any(path[:len(prefix)] == prefix for prefix in used)
+
+
+# --- routes --------------------------------------------------------------------
+
+def route_for(page):
+    parts = [p for p in os.path.relpath(os.path.dirname(page), APP_DIR).split(os.sep)
+             if p != "." and not (p.startswith("(") and p.endswith(")"))]
+    return "/" + "/".join(parts)
+
+
+def slug_for(route):
+    return "index" if route == "/" else re.sub(r"[^A-Za-z0-9_-]+", "_", route.strip("/")).strip("_")
+
+
+def layouts_for(page):
+    """Layouts wrapping ``page``, root first."""
+    layouts = []
+    directory = os.path.dirname(page)
+    while True:
+        candidate = os.path.join(directory, "layout.tsx")
+        if os.path.isfile(candidate):
+            layouts.append(candidate)
+        if os.path.normpath(directory) == os.path.normpath(APP_DIR):
+            break
+        directory = os.path.dirname(directory)
+    return list(reversed(layouts))
+
+
+def find_pages():
+    pages = []
+    for root, _, files in os.walk(APP_DIR):
+        if os.path.join("app", "api") in root:
+            continue
+        pages.extend(os.path.join(root, name) for name in files if name == "page.tsx")
+    return sorted(pages)
+
+
+# --- output ------------------------------------------------------------------
+
+def encode(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode()
+
+
+def write_if_changed(path, data):
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return False
+    except OSError:
+        pass
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
+
+def build(args):
+    dictionaries = {locale: load_dictionary(locale) for locale in LOCALES}
+    source = dictionaries[SOURCE_LOCALE]
+    index = SourceIndex()
+
+    def used_paths(files):
+        paths = set()
+        for path in files:
+            for segments, _dynamic in index.usages[path]:
+                paths.add(resolve_usage(source, segments))
+        return paths
+
+    root_layout = os.path.join(APP_DIR, "layout.tsx")
+    shared_files = index.reachable(root_layout)
+    shared_paths = used_paths(shared_files)
+
+    routes = {}
+    for page in find_pages():
+        files = set(index.reachable(page))
+        for layout in layouts_for(page):
+            if layout != root_layout:
+                files |= index.reachable(layout)
+        paths = {path for path in used_paths(files - shared_files) if not covered(path, shared_paths)}
+        routes[route_for(page)] = paths
+
+    all_used = shared_paths.union(*routes.values())
+    manifest = {"version": MANIFEST_VERSION, "shared": {}, "routes": {}}
+    full_sizes = {locale: len(encode(dictionaries[locale])) for locale in LOCALES}
+    all_locales_size = sum(full_sizes.values())
+    written = 0
+
+    def emit(locale, name, paths):
+        nonlocal written
+        data = encode(select(dictionaries[locale], paths))
+        if not args.dry_run and write_if_changed(os.path.join(args.out, locale, f"{name}.json"), data):
+            written += 1
+        digest = hashlib.sha256(data).hexdigest()[:12]
+        return {"url": f"{URL_PREFIX}/{locale}/{name}.json?v={digest}", "bytes": len(data)}
+
+    for locale in LOCALES:
+        manifest["shared"][locale] = emit(locale, SHARED, shared_paths)
+    for route, paths in sorted(routes.items()):
+        slug = slug_for(route)
+        manifest["routes"][route] = {
+            "bundle": slug,
+            "keys": len([p for p in leaf_paths(source) if covered(p, paths)]),
+            "locales": {locale: emit(locale, slug, paths) for locale in LOCALES},
+        }
+    if not args.dry_run:
+        write_if_changed(os.path.join(args.out, "manifest.json"),
+                         (json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n").encode())
+
+    report(manifest, full_sizes, all_locales_size, source, all_used, dictionaries, args)
+    if not args.dry_run:
+        print(f"\n{written} bundle(s) updated in {os.path.relpath(args.out, REPO_ROOT)}")
+
+
+def report(manifest, full_sizes, all_locales_size, source, all_used, dictionaries, args):
+    leaves = list(leaf_paths(source))
+    print(f"Dictionaries: {len(leaves)} keys; "
+          + ", ".join(f"{locale} {full_sizes[locale]:,} B" for locale in LOCALES)
+          + f" ({all_locales_size:,} B for all locales)\n")
+
+    header = f"{'route':<26}{'keys':>6}" + "".join(f"{locale + ' (B)':>16}" for locale in LOCALES) + f"{'saved':>9}"
+    print(header)
+    print("-" * len(header))
+    shared = manifest["shared"]
+    print(f"{'(shared layout)':<26}{'':>6}" + "".join(f"{shared[l]['bytes']:>16,}" for l in LOCALES))
+    for route, info in manifest["routes"].items():
+        sizes = {l: shared[l]["bytes"] + info["locales"][l]["bytes"] for l in LOCALES}
+        saved = 1 - sum(sizes.values()) / sum(full_sizes.values())
+        print(f"{route:<26}{info['keys']:>6}"
+              + "".join(f"{sizes[l]:>16,}" for l in LOCALES) + f"{saved:>9.0%}")
+    print("\n(sizes are shared + route bundle per locale; saved is against the whole dictionaries)")
+
+    unused = [p for p in leaves if not covered(p, all_used)]
+    print(f"\nUnused keys: {len(unused)} of {len(leaves)}")
+    if args.list_unused:
+        for path in unused:
+            print(f"  {'.'.join(path)}")
+    elif unused:
+        print("  (run with --list-unused to see them)")
+
+    for locale in LOCALES:
+        if locale == SOURCE_LOCALE:
+            continue
+        missing = [p for p in leaves if resolve_usage(dictionaries[locale], p) != p]
+        if missing:
+            print(f"Missing in {locale}: " + ", ".join(".".join(p) for p in missing[:10])
+                  + (f" (+{len(missing) - 10} more)" if len(missing) > 10 else ""))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build per-route, per-locale translation bundles")
+    parser.add_argument("--out", default=OUTPUT_DIR, help="output directory (default: public/i18n)")
+    parser.add_argument("--dry-run", action="store_true", help="analyse and report without writing files")
+    parser.add_argument("--list-unused", action="store_true", help="print every unused key")
+    build(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,52 +1,262 @@
 import os
 import json
-import urllib.request
+import hashlib
 import time
-import ssl
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Create unverified context to bypass SSL errors
-ssl_context = ssl._create_unverified_context()
+from tarot_registry import CARDS_BY_PATH
+from tarot_source import FOLDERS, ConnectionPool, fetch_listing, offline_default
 
-BASE_URL = "https://api.github.com/repos/ricarvy/tarot_source/contents"
-PUBLIC_DIR = "public/tarot-cards/result"
+PUBLIC_DIR = os.environ.get("TAROT_PUBLIC_DIR", "public/tarot-cards/result")
+# Records the upstream blob sha, size and local sha256 of every synced card so
+# later runs only transfer what actually changed.
+MANIFEST_PATH = os.path.join(os.path.dirname(PUBLIC_DIR.rstrip("/")), "sync-manifest.json")
+MANIFEST_VERSION = 1
+DEFAULT_CONCURRENCY = int(os.environ.get("TAROT_SYNC_CONCURRENCY", "8"))
+# Bodies are streamed to disk in fixed-size chunks so memory use stays flat
+# regardless of how large the source art gets.
+CHUNK_SIZE = 64 * 1024
+PART_SUFFIX = ".part"
 
-def fetch_json(url):
+
+def hash_local(path):
+    """Return ``(git_blob_sha, sha256, size)`` for a local file, read in chunks.
+
+    The blob sha is computed the way git does, so it compares equal to the
+    contents API's ``sha``.
+    """
+    size = os.path.getsize(path)
+    blob = hashlib.sha1(b"blob %d\0" % size)
+    sha256 = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            blob.update(chunk)
+            sha256.update(chunk)
+    return blob.hexdigest(), sha256.hexdigest(), size
+
+
+def load_manifest(path=MANIFEST_PATH):
     try:
-        with urllib.request.urlopen(url, context=ssl_context) as response:
-            return json.loads(response.read().decode())
-    except Exception as e:
-        print(f"Error fetching {url}: {e}")
-        return []
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def save_manifest(files, path=MANIFEST_PATH):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "files": dict(sorted(files.items()))}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def download_file(pool, url, path, expected_size=None, expected_sha=None):
+    """Stream ``url`` into ``path`` via a ``.part`` file and rename it into place.
+
+    An existing ``.part`` left by an interrupted run is resumed with a Range
+    request. The finished file is checked against the listing's size and git
+    blob sha before it replaces ``path``, so a truncated or corrupt download is
+    never mistaken for a complete card. Returns ``(bytes_transferred, sha256)``.
+    """
+    part_path = path + PART_SUFFIX
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if expected_size is None or offset >= expected_size:
+        offset = 0
 
-def download_file(url, path):
+    headers = {"Range": f"bytes={offset}-"} if offset else {}
+    transferred = 0
+    with pool.stream(url, headers) as response:
+        if response.status == 206 and offset:
+            mode = "ab"
+        elif response.status == 200:
+            # Server ignored the Range header (or there was nothing to resume).
+            mode, offset = "wb", 0
+        else:
+            response.read()
+            raise RuntimeError(f"HTTP {response.status}")
+
+        with open(part_path, mode) as out_file:
+            for chunk in iter(lambda: response.read(CHUNK_SIZE), b""):
+                out_file.write(chunk)
+                transferred += len(chunk)
+
+    blob_sha, sha256, size = hash_local(part_path)
+    if expected_size is not None and size != expected_size:
+        if size > expected_size:
+            os.remove(part_path)
+        raise RuntimeError(f"size mismatch: got {size} bytes, expected {expected_size}")
+    if expected_sha and blob_sha != expected_sha:
+        os.remove(part_path)
+        raise RuntimeError(f"sha mismatch: got {blob_sha}, expected {expected_sha}")
+
+    os.replace(part_path, path)
+    return transferred, sha256
+
+
+def is_current(rel_path, item, manifest, verify):
+    """Check whether the local copy of ``rel_path`` already matches upstream.
+
+    Files the manifest vouches for are trusted on a size check alone unless
+    ``verify`` is set. Untracked files are hashed once and adopted when their
+    git blob sha matches, so existing trees don't get downloaded again.
+    """
+    local_path = os.path.join(PUBLIC_DIR, rel_path)
     try:
-        with urllib.request.urlopen(url, context=ssl_context) as response, open(path, 'wb') as out_file:
-            out_file.write(response.read())
-        print(f"Downloaded: {path}")
-    except Exception as e:
-        print(f"Error downloading {url} to {path}: {e}")
-
-def process_folder(folder_name):
-    print(f"Processing {folder_name}...")
+        size = os.path.getsize(local_path)
+    except OSError:
+        return None
+
+    entry = manifest.get(rel_path)
+    if entry and entry.get("sha") == item.get("sha") and entry.get("size") == size and not verify:
+        return entry
+
+    blob_sha, sha256, size = hash_local(local_path)
+    if blob_sha == item.get("sha"):
+        return {"sha": blob_sha, "size": size, "sha256": sha256}
+    return None
+
+
+def prune(folder_name, upstream, manifest):
+    """Delete local cards in ``folder_name`` that no longer exist upstream."""
+    removed = []
     target_dir = os.path.join(PUBLIC_DIR, folder_name)
-    os.makedirs(target_dir, exist_ok=True)
-    
-    url = f"{BASE_URL}/result/{folder_name}?ref=main"
-    files = fetch_json(url)
-    
-    for item in files:
-        if item.get('type') == 'file' and item['name'].endswith('.png'):
-            download_url = item['download_url']
-            file_path = os.path.join(target_dir, item['name'])
-            if not os.path.exists(file_path):
-                download_file(download_url, file_path)
-                time.sleep(0.2) # Be nice to GitHub
-            else:
-                print(f"Skipping existing: {file_path}")
+    for name in sorted(os.listdir(target_dir)):
+        rel_path = f"{folder_name}/{name}"
+        if name.endswith(".png") and rel_path not in upstream:
+            os.remove(os.path.join(target_dir, name))
+            removed.append(rel_path)
+    for rel_path in list(manifest):
+        if rel_path.startswith(folder_name + "/") and rel_path not in upstream:
+            manifest.pop(rel_path)
+    return removed
+
+
+def sync(folders=FOLDERS, concurrency=DEFAULT_CONCURRENCY, verify=False, do_prune=True, offline=False):
+    """Bring the local cards in line with upstream, transferring only changed files.
+
+    At most ``concurrency`` downloads are in flight at once. With ``offline``
+    the cached listing is used and nothing is fetched; files that would need a
+    download are reported as failures.
+    """
+    stats = {"files": 0, "skipped": 0, "failed": 0, "pruned": 0, "bytes": 0}
+    pool = ConnectionPool()
+    started = time.perf_counter()
+    manifest = load_manifest()
+
+    try:
+        listing = fetch_listing(pool, offline=offline)
+        pending = []
+        for folder_name in folders:
+            print(f"Processing {folder_name}...")
+            os.makedirs(os.path.join(PUBLIC_DIR, folder_name), exist_ok=True)
+            if listing is None:
+                # Never prune against a listing we failed to fetch.
+                stats["failed"] += 1
+                continue
+            upstream = {
+                rel_path: item for rel_path, item in listing.items()
+                if rel_path.startswith(folder_name + "/")
+            }
+
+            for rel_path in sorted(set(upstream) - set(CARDS_BY_PATH)):
+                print(f"Warning: {rel_path} is not in the card registry")
+            for rel_path in sorted(p for p in CARDS_BY_PATH if p.startswith(folder_name + "/")):
+                if rel_path not in upstream:
+                    print(f"Warning: card {CARDS_BY_PATH[rel_path].id} ({rel_path}) is missing upstream")
+
+            for rel_path, item in upstream.items():
+                entry = is_current(rel_path, item, manifest, verify)
+                if entry is not None:
+                    manifest[rel_path] = entry
+                    stats["skipped"] += 1
+                else:
+                    pending.append((rel_path, item))
+
+            if do_prune:
+                for rel_path in prune(folder_name, upstream, manifest):
+                    print(f"Pruned: {rel_path}")
+                    stats["pruned"] += 1
+
+        if offline and pending:
+            for rel_path, _ in pending:
+                print(f"Offline mode: cannot download {rel_path}")
+            stats["failed"] += len(pending)
+            pending = []
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            futures = {
+                executor.submit(
+                    download_file, pool, item['download_url'], os.path.join(PUBLIC_DIR, rel_path),
+                    item.get('size'), item.get('sha'),
+                ): (rel_path, item)
+                for rel_path, item in pending
+            }
+            for future in as_completed(futures):
+                rel_path, item = futures[future]
+                try:
+                    transferred, sha256 = future.result()
+                except Exception as e:
+                    stats["failed"] += 1
+                    manifest.pop(rel_path, None)
+                    print(f"Error downloading {item['download_url']} to {rel_path}: {e}")
+                    continue
+                size = os.path.getsize(os.path.join(PUBLIC_DIR, rel_path))
+                manifest[rel_path] = {"sha": item.get("sha"), "size": size, "sha256": sha256}
+                stats["bytes"] += transferred
+                stats["files"] += 1
+                print(f"Downloaded: {rel_path}")
+    finally:
+        pool.close()
+        save_manifest(manifest)
+
+    stats["seconds"] = time.perf_counter() - started
+    stats["connections"] = pool.opened
+    return stats
+
+
+def print_summary(stats):
+    seconds = stats["seconds"]
+    throughput = stats["bytes"] / seconds / 1024 / 1024 if seconds > 0 else 0.0
+    print(
+        f"\nSynced {stats['files']} files ({stats['bytes'] / 1024:.1f} KiB), "
+        f"unchanged {stats['skipped']}, pruned {stats['pruned']}, failed {stats['failed']} "
+        f"in {seconds:.2f}s ({throughput:.2f} MiB/s, {stats['connections']} connections)"
+    )
+
 
 def main():
-    process_folder('Major')
-    process_folder('Minor')
+    parser = argparse.ArgumentParser(description="Sync tarot card images into public/")
+    parser.add_argument(
+        "-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"maximum parallel downloads (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--verify", action="store_true",
+        help="re-hash every local file instead of trusting the manifest",
+    )
+    parser.add_argument(
+        "--no-prune", action="store_true",
+        help="keep local files that were deleted upstream",
+    )
+    parser.add_argument(
+        "--offline", action="store_true", default=offline_default(),
+        help="use the cached listing and make no network requests (or set TAROT_SOURCE_OFFLINE=1)",
+    )
+    args = parser.parse_args()
+
+    stats = sync(
+        concurrency=args.concurrency, verify=args.verify,
+        do_prune=not args.no_prune, offline=args.offline,
+    )
+    print_summary(stats)
+    if stats["failed"]:
+        raise SystemExit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,191 @@
+"""Publish content-hashed copies of the static assets the app references.
+
+The card art (every card in ``scripts/tarot_registry.py``) and the files named
+in ``STATIC_ASSETS`` are copied to ``public/assets/<path>.<hash>.<ext>``,
+where ``<hash>`` is the first 10 hex characters of its SHA-256. ``public/assets/manifest.json`` maps every original
+URL to its hashed URL, and the ``imageUrl`` fields in ``src/lib/tarot-cards.ts``
+are rewritten to the hashed URLs. A hashed URL changes whenever the bytes
+change, so ``next.config.ts`` can safely mark ``/assets/*`` immutable while
+everything unhashed revalidates::
+
+    python scripts/fingerprint_assets.py            # copy, rewrite, prune stale copies
+    python scripts/fingerprint_assets.py --check    # exit 1 if anything is out of date or stale
+
+The originals stay where they are, so old links, stored history records and
+external references keep working. Hashed copies are byte-identical to their
+sources, so git stores them as the same blobs. Copies whose hash no longer
+matches a source are removed unless ``--keep-stale`` is given (useful when the
+previous deploy's HTML may still be open in browsers); ``--check`` fails on them
+unless ``--keep-stale`` is given too.
+"""
+
+import os
+import re
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+
+from tarot_ts import REPO_ROOT, CARDS_TS
+from tarot_registry import CARDS, LOCAL_URL_PREFIX
+
+PUBLIC_DIR = os.path.join(REPO_ROOT, "public")
+ASSETS_DIR = os.path.join(PUBLIC_DIR, "assets")
+MANIFEST_PATH = os.path.join(ASSETS_DIR, "manifest.json")
+URL_PREFIX = "/assets"
+MANIFEST_VERSION = 1
+HASH_CHARS = 10
+CHUNK_SIZE = 64 * 1024
+
+# Other public/ files served from a hashed URL. Only list files the app links to; generated
+# output (variants, atlases, i18n bundles) carries its own ?v= versioning.
+STATIC_ASSETS = ()
+
+IMAGE_URL_RE = re.compile(r"""(\bimageUrl:\s*)(['"])([^'"]*)\2""")
+HASHED_RE = re.compile(rf"^{re.escape(URL_PREFIX)}(/.+)\.[0-9a-f]{{{HASH_CHARS}}}(\.[^./]+)?$")
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hashed_url(url, digest):
+    stem, ext = os.path.splitext(url)
+    return f"{URL_PREFIX}{stem}.{digest[:HASH_CHARS]}{ext}"
+
+
+def source_url(url):
+    """Map a fingerprinted URL back to the original public URL; other URLs pass through."""
+    match = HASHED_RE.match(url)
+    return match.group(1) + (match.group(2) or "") if match else url
+
+
+def list_sources():
+    """Public URLs of every file to fingerprint, sorted."""
+    urls = sorted({LOCAL_URL_PREFIX + card.path for card in CARDS} | set(STATIC_ASSETS))
+    missing = [url for url in urls if not os.path.isfile(os.path.join(PUBLIC_DIR, url.lstrip("/")))]
+    if missing:
+        raise SystemExit(f"Missing under public/: {', '.join(missing[:5])}" + (" ..." if len(missing) > 5 else ""))
+    return urls
+
+
+def load_hashed_urls():
+    """``{original URL: hashed URL}`` from the published manifest; empty if there is none."""
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            files = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        return {}
+    return {url: entry["url"] for url, entry in files.items()}
+
+
+def build_manifest():
+    files = {}
+    for url in list_sources():
+        path = os.path.join(PUBLIC_DIR, url.lstrip("/"))
+        digest = sha256_file(path)
+        files[url] = {"url": hashed_url(url, digest), "sha256": digest, "bytes": os.path.getsize(path)}
+    return {"version": MANIFEST_VERSION, "files": files}
+
+
+def rewrite_image_urls(content, files):
+    """Point every ``imageUrl`` at its hashed copy; returns (new_content, changes, unknown)."""
+    changes, unknown = [], []
+
+    def replace(match):
+        current = match.group(3)
+        entry = files.get(source_url(current))
+        if entry is None:
+            if current.startswith("/"):
+                unknown.append(current)
+            return match.group(0)
+        if entry["url"] != current:
+            changes.append((current, entry["url"]))
+        return f"{match.group(1)}{match.group(2)}{entry['url']}{match.group(2)}"
+
+    return IMAGE_URL_RE.sub(replace, content), changes, unknown
+
+
+def existing_copies():
+    copies = set()
+    for root, _, files in os.walk(ASSETS_DIR):
+        for name in files:
+            path = os.path.join(root, name)
+            if path != MANIFEST_PATH:
+                copies.add("/" + os.path.relpath(path, PUBLIC_DIR).replace(os.sep, "/"))
+    return copies
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Fingerprint public/ assets and rewrite card imageUrls")
+    parser.add_argument("--check", action="store_true", help="exit 1 if copies, manifest or imageUrls are stale")
+    parser.add_argument("--keep-stale", action="store_true", help="keep hashed copies of old file versions")
+    args = parser.parse_args()
+
+    manifest = build_manifest()
+    files = manifest["files"]
+    wanted = {entry["url"] for entry in files.values()}
+    present = existing_copies()
+    missing = sorted(wanted - present)
+    stale = sorted(present - wanted)
+
+    with open(CARDS_TS, encoding="utf-8") as f:
+        content = f.read()
+    new_content, changes, unknown = rewrite_image_urls(content, files)
+    manifest_text = json.dumps(manifest, indent=2, sort_keys=True) + "\n"
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            manifest_current = f.read() == manifest_text
+    except OSError:
+        manifest_current = False
+
+    for url in unknown:
+        print(f"warning: imageUrl {url} is not a file under public/")
+
+    if args.check:
+        for url in missing:
+            print(f"missing copy: {url}")
+        if not args.keep_stale:
+            for url in stale:
+                print(f"stale copy: {url}")
+        for old, new in changes:
+            print(f"stale imageUrl: {old} -> {new}")
+        if not manifest_current:
+            print("manifest.json is out of date")
+        ok = not (missing or (stale and not args.keep_stale) or changes or not manifest_current)
+        print("Fingerprinted assets are up to date" if ok else "Run scripts/fingerprint_assets.py")
+        sys.exit(0 if ok else 1)
+
+    for url in missing:
+        source = source_url(url)
+        destination = os.path.join(PUBLIC_DIR, url.lstrip("/"))
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        shutil.copy2(os.path.join(PUBLIC_DIR, source.lstrip("/")), destination + ".tmp")
+        os.replace(destination + ".tmp", destination)
+    if not args.keep_stale:
+        for url in stale:
+            os.remove(os.path.join(PUBLIC_DIR, url.lstrip("/")))
+        for root, dirs, names in os.walk(ASSETS_DIR, topdown=False):
+            if root != ASSETS_DIR and not dirs and not names:
+                os.rmdir(root)
+    if not manifest_current:
+        os.makedirs(ASSETS_DIR, exist_ok=True)
+        with open(MANIFEST_PATH, "w", encoding="utf-8") as f:
+            f.write(manifest_text)
+    if changes:
+        with open(CARDS_TS, "w", encoding="utf-8") as f:
+            f.write(new_content)
+
+    total = sum(entry["bytes"] for entry in files.values())
+    print(f"{len(files)} assets ({total / 1024 / 1024:.1f} MiB): {len(missing)} copied, "
+          f"{len(wanted) - len(missing)} unchanged, {0 if args.keep_stale else len(stale)} stale removed; "
+          f"{len(changes)} imageUrl(s) rewritten in {os.path.relpath(CARDS_TS, REPO_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
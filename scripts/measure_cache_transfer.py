@@ -0,0 +1,261 @@
+"""Measure the bytes a cold visit and a repeat visit transfer under the current cache headers.
+
+The script plays a browser with an HTTP cache against a running app:
+
+1. Cold visit: fetch each page and every asset it references (``src``,
+   ``href`` and ``srcset`` of the HTML, plus the card art listed in
+   ``src/lib/tarot-cards.ts`` with ``--cards``), storing responses the way a
+   browser cache would.
+2. Repeat visit, ``--after`` seconds later (simulated, no sleeping): responses
+   that are still fresh (``max-age`` not expired, or ``immutable``) are served
+   from the cache without a request; stale ones are revalidated with
+   ``If-None-Match`` / ``If-Modified-Since`` and count only the 304's bytes;
+   ``no-store`` responses are fetched again in full.
+
+Bytes are body plus header bytes as received. Run it like this::
+
+    pnpm build && pnpm start          # or pnpm dev, where Next sets its own dev headers
+    python scripts/measure_cache_transfer.py --cards
+
+Compare the repeat-visit totals before and after ``scripts/fingerprint_assets.py``
+to see what immutable caching saves.
+"""
+
+import re
+import gzip
+import json
+import time
+import argparse
+import http.client
+import urllib.parse
+from html.parser import HTMLParser
+from email.utils import parsedate_to_datetime
+
+from bench_stats import format_bytes
+from tarot_ts import load_cards
+
+DEFAULT_APP_URL = "http://localhost:8899"
+DEFAULT_PAGES = ("/", "/tarot-cards", "/ai-tarot")
+CATEGORIES = ("html", "next static", "fingerprinted", "card art", "other")
+MAX_AGE_RE = re.compile(r"\bmax-age\s*=\s*(\d+)", re.I)
+
+
+def category(path, content_type):
+    if path.startswith("/_next/static/") or path.startswith("/_next/image"):
+        return "next static"
+    if path.startswith("/assets/"):
+        return "fingerprinted"
+    if path.startswith("/tarot-cards/"):
+        return "card art"
+    if content_type.startswith("text/html"):
+        return "html"
+    return "other"
+
+
+class AssetParser(HTMLParser):
+    """Collects same-origin URLs referenced by src/href/srcset attributes."""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == "a":
+            return  # links are navigations, not subresources
+        for name in ("src", "href"):
+            if attrs.get(name):
+                self.urls.append(attrs[name])
+        for candidate in (attrs.get("srcset") or "").split(","):
+            if candidate.strip():
+                self.urls.append(candidate.split()[0])
+
+
+def same_origin_path(url, base):
+    parts = urllib.parse.urlsplit(urllib.parse.urljoin(base, url))
+    if parts.scheme not in ("http", "https") or parts.netloc != urllib.parse.urlsplit(base).netloc:
+        return None
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class CachedResponse:
+    def __init__(self, headers, body, stored_at):
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+        cache_control = headers.get("cache-control", "").lower()
+        self.no_store = "no-store" in cache_control
+        self.no_cache = "no-cache" in cache_control
+        self.immutable = "immutable" in cache_control
+        match = MAX_AGE_RE.search(cache_control)
+        self.max_age = int(match.group(1)) if match else None
+        if self.max_age is None and "expires" in headers:
+            try:
+                expires = parsedate_to_datetime(headers["expires"]).timestamp()
+                self.max_age = max(0, int(expires - stored_at))
+            except (TypeError, ValueError):
+                self.max_age = 0
+
+    def fresh(self, now):
+        if self.no_cache:
+            return False
+        if self.immutable:
+            return True
+        # No freshness information: browsers guess, here we conservatively revalidate.
+        return self.max_age is not None and now - self.stored_at < self.max_age
+
+    def validators(self):
+        headers = {}
+        if "etag" in self.headers:
+            headers["If-None-Match"] = self.headers["etag"]
+        if "last-modified" in self.headers:
+            headers["If-Modified-Since"] = self.headers["last-modified"]
+        return headers
+
+
+class Browser:
+    """A single keep-alive connection with a private HTTP cache and a simulated clock."""
+
+    def __init__(self, base_url, timeout):
+        self.base_url = base_url
+        self.parts = urllib.parse.urlsplit(base_url)
+        self.timeout = timeout
+        self.cache = {}
+        self.clock = time.time()
+        self.conn = None
+
+    def connection(self, fresh=False):
+        if self.conn is None or fresh:
+            if self.conn is not None:
+                self.conn.close()
+            cls = http.client.HTTPSConnection if self.parts.scheme == "https" else http.client.HTTPConnection
+            self.conn = cls(self.parts.netloc, timeout=self.timeout)
+        return self.conn
+
+    def send(self, path, headers):
+        for attempt in range(2):
+            conn = self.connection(fresh=attempt > 0)
+            try:
+                conn.request("GET", path, headers={"Accept-Encoding": "gzip", **headers})
+                response = conn.getresponse()
+                body = response.read()
+                return response, body
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                if attempt:
+                    raise
+
+    def get(self, path):
+        """Fetch ``path`` through the cache; returns a dict describing what happened."""
+        cached = self.cache.get(path)
+        if cached and cached.fresh(self.clock):
+            return {"path": path, "outcome": "cache", "status": 200, "bytes": 0,
+                    "type": cached.headers.get("content-type", ""), "body": cached.body}
+
+        request_headers = cached.validators() if cached and not cached.no_store else {}
+        response, body = self.send(path, request_headers)
+        headers = {k.lower(): v for k, v in response.getheaders()}
+        header_bytes = len(f"HTTP/1.1 {response.status} {response.reason}\r\n") + sum(
+            len(k) + len(v) + 4 for k, v in response.getheaders()) + 2
+        if response.status == 304 and cached:
+            cached.headers.update(headers)
+            cached.stored_at = self.clock
+            outcome, content_type, body_seen = "revalidated", cached.headers.get("content-type", ""), cached.body
+        else:
+            # Bytes counted are what crossed the wire; the cache keeps the decoded body for parsing.
+            decoded = gzip.decompress(body) if headers.get("content-encoding") == "gzip" else body
+            entry = CachedResponse(headers, decoded, self.clock)
+            if response.status == 200 and not entry.no_store:
+                self.cache[path] = entry
+            else:
+                self.cache.pop(path, None)
+            outcome, content_type, body_seen = "full", headers.get("content-type", ""), decoded
+        return {"path": path, "outcome": outcome, "status": response.status,
+                "bytes": header_bytes + len(body), "type": content_type, "body": body_seen}
+
+
+def visit(browser, pages, extra_paths):
+    results, seen = [], set()
+
+    def fetch(path):
+        if path in seen:
+            return None
+        seen.add(path)
+        result = browser.get(path)
+        results.append(result)
+        return result
+
+    for page in pages:
+        result = fetch(page)
+        if result is None or not result["type"].startswith("text/html"):
+            continue
+        parser = AssetParser()
+        parser.feed(result["body"].decode("utf-8", "replace"))
+        for url in parser.urls:
+            path = same_origin_path(url, browser.base_url + page)
+            if path:
+                fetch(path)
+    for path in extra_paths:
+        fetch(path)
+    return results
+
+
+def totals(results):
+    summary = {name: {"requests": 0, "cacheHits": 0, "notModified": 0, "bytes": 0} for name in CATEGORIES}
+    for r in results:
+        row = summary[category(r["path"], r["type"])]
+        if r["outcome"] == "cache":
+            row["cacheHits"] += 1
+        else:
+            row["requests"] += 1
+            row["notModified"] += r["outcome"] == "revalidated"
+        row["bytes"] += r["bytes"]
+    return summary
+
+
+def print_table(title, summary):
+    header = f"{'':<15}{'requests':>10}{'304':>6}{'from cache':>12}{'bytes':>12}"
+    print(f"\n{title}")
+    print(header)
+    print("-" * len(header))
+    for name in CATEGORIES:
+        row = summary[name]
+        if row["requests"] or row["cacheHits"]:
+            print(f"{name:<15}{row['requests']:>10}{row['notModified']:>6}{row['cacheHits']:>12}"
+                  f"{format_bytes(row['bytes']):>12}")
+    total_bytes = sum(row["bytes"] for row in summary.values())
+    total_requests = sum(row["requests"] for row in summary.values())
+    print(f"{'total':<15}{total_requests:>10}{'':>6}{'':>12}{format_bytes(total_bytes):>12}")
+    return total_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes transferred on a cold visit vs a repeat visit")
+    parser.add_argument("--app-url", default=DEFAULT_APP_URL, help=f"app to measure (default: {DEFAULT_APP_URL})")
+    parser.add_argument("--pages", default=",".join(DEFAULT_PAGES), help="comma-separated page paths")
+    parser.add_argument("--cards", action="store_true", help="also fetch every card imageUrl from tarot-cards.ts")
+    parser.add_argument("--after", type=float, default=3600, help="seconds between the visits (default: 3600)")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--json", help="write both visits' per-category totals to this file")
+    args = parser.parse_args()
+
+    pages = [p.strip() for p in args.pages.split(",") if p.strip()]
+    extra = [card["imageUrl"] for card in load_cards() if card.get("imageUrl", "").startswith("/")] if args.cards else []
+
+    browser = Browser(args.app_url.rstrip("/"), args.timeout)
+    cold = totals(visit(browser, pages, extra))
+    browser.clock += args.after
+    repeat = totals(visit(browser, pages, extra))
+
+    cold_bytes = print_table("Cold visit", cold)
+    repeat_bytes = print_table(f"Repeat visit after {args.after:g}s", repeat)
+    saved = 1 - repeat_bytes / cold_bytes if cold_bytes else 0
+    print(f"\nRepeat visit transfers {format_bytes(repeat_bytes)} of {format_bytes(cold_bytes)} ({saved:.0%} saved)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"afterSeconds": args.after, "cold": cold, "repeat": repeat}, f, indent=2)
+        print(f"Wrote {args.json}")
+
+
+if __name__ == "__main__":
+    main()
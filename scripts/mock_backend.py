@@ -0,0 +1,516 @@
+"""Local stand-in for the FastAPI backend documented in md/backend.md.
+
+Serves the endpoints the Next.js app proxies to (``/api/auth/*``,
+``/api/tarot/*``, ``/api/stripe/create-checkout-session`` and
+``/api/stripe/payment-status/{session_id}``; the ``/api`` prefix is optional)
+with configurable latency, error rate, payload size and streaming behaviour,
+so the proxy and checkout flow can be benchmarked without touching
+production::
+
+    python scripts/mock_backend.py --port 8901
+    python scripts/mock_backend.py --latency-ms 50 --error-rate 0.02 \\
+        --set interpret.chunks=80 --set interpret.chunk_interval_ms=25 \\
+        --set payment-status.pending_ms=5000
+
+Then point the app at it with ``INTERNAL_BACKEND_URL=http://127.0.0.1:8901``.
+``POST /llm/stream`` doubles as a stub LLM for the app's own interpret route
+(``LLM_STUB_URL=http://127.0.0.1:8901/llm/stream``), replaying canned text at a
+fixed chunk rate. ``POST /llm/chat/completions`` is an OpenAI-compatible stub
+for offline batch jobs (``scripts/build_suggestion_pools.py``): it answers with
+the ``count`` questions the prompt asks for, drawn from a small template set so
+repeats are common.
+``GET /`` and ``GET /health`` answer 200 for health checks.
+``GET /__mock/stats`` returns per-endpoint request counts and the number of
+TCP connections accepted; ``POST /__mock/reset`` clears them.
+``GET /__mock/blob?size=N[&gzip=1]`` and ``POST /__mock/echo`` (reads the body
+in chunks and returns its length and SHA-256) are raw payload endpoints for
+proxy benchmarks.
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import uuid
+import random
+import hashlib
+import argparse
+import threading
+import functools
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+DEFAULT_PORT = 8901
+
+# Every endpoint accepts these knobs; ``--latency-ms`` etc. change the defaults
+# and ``--set endpoint.key=value`` (or a ``--config`` JSON file) overrides one.
+BASE_PROFILE = {
+    "latency_ms": 10,       # delay before the response starts
+    "jitter_ms": 0,         # uniform +/- jitter added to latency_ms
+    "error_rate": 0.0,      # probability of answering with a 500 INTERNAL_ERROR
+    "payload_bytes": 0,     # padding added to JSON bodies (``data.padding``)
+    "chunks": 0,            # >0 streams the body in this many chunks
+    "chunk_interval_ms": 0,  # delay between streamed chunks
+    "chunk_bytes": 64,      # size of each streamed chunk
+}
+
+ENDPOINT_PROFILES = {
+    "login": {},
+    "register": {},
+    "quota": {},
+    "me": {},
+    "interpret": {"latency_ms": 300, "chunks": 60, "chunk_interval_ms": 30, "chunk_bytes": 48},
+    "suggest": {"latency_ms": 800},
+    "history": {},
+    "checkout": {"latency_ms": 150},
+    # Sessions report ``pending`` until this long after creation.
+    # Each session completes pending_ms (+ up to pending_jitter_ms) after it is created.
+    "payment-status": {"latency_ms": 80, "pending_ms": 3000, "pending_jitter_ms": 0},
+    # Stub LLM for the Next.js routes (LLM_STUB_URL=http://host:port/llm/stream):
+    # latency_ms is the time to first token, then chunks arrive at a fixed rate.
+    "llm": {"latency_ms": 400, "chunks": 80, "chunk_interval_ms": 25, "chunk_bytes": 24},
+    # OpenAI-compatible chat completions stub for batch jobs; returns the whole answer at once.
+    "llm-complete": {"latency_ms": 300},
+}
+
+ROUTES = [
+    ("POST", re.compile(r"^/auth/login$"), "login"),
+    ("POST", re.compile(r"^/auth/register$"), "register"),
+    ("GET", re.compile(r"^/auth/quota$"), "quota"),
+    ("GET", re.compile(r"^/auth/me$"), "me"),
+    ("POST", re.compile(r"^/tarot/interpret$"), "interpret"),
+    ("POST", re.compile(r"^/tarot/suggest$"), "suggest"),
+    ("GET", re.compile(r"^/tarot/suggest$"), "suggest"),
+    ("GET", re.compile(r"^/tarot/history$"), "history"),
+    ("POST", re.compile(r"^/stripe/create-checkout-session$"), "checkout"),
+    ("GET", re.compile(r"^/stripe/payment-status/(?P<session_id>[^/]+)$"), "payment-status"),
+    ("POST", re.compile(r"^/llm/stream$"), "llm"),
+    ("POST", re.compile(r"^/llm/chat/completions$"), "llm-complete"),
+]
+
+DEMO_USER = {
+    "id": "demo-user-id",
+    "username": "Demo User",
+    "email": "demo@mentobai.com",
+    "isActive": True,
+    "isDemo": True,
+    "unlimitedQuota": True,
+}
+
+INTERPRETATION_TEXT = (
+    "牌面显示你正站在一个新的起点上。过去的经历为你积累了经验，"
+    "现在的你需要相信自己的直觉，勇敢地迈出下一步。"
+    "未来的道路充满可能，保持开放的心态，机会会在你准备好时到来。\n\n"
+    "**相关追问**：\n1. 我应该如何把握眼前的机会？\n2. 有哪些需要注意的阻碍？\n"
+)
+
+# Subjects x question forms for the chat completions stub, per locale.
+STUB_QUESTIONS = {
+    "zh": (
+        ["我的感情", "这段关系", "我的事业", "下一份工作", "我的财运", "我的内在成长", "这个决定", "我和家人的关系",
+         "我的学业", "我的人际关系", "这次搬家", "我的创业计划"],
+        ["{}接下来会如何发展？", "我该如何改善{}？", "在{}中我忽略了什么？", "{}在未来三个月会有什么变化？",
+         "关于{}，我需要放下什么？"],
+    ),
+    "en": (
+        ["my love life", "this relationship", "my career", "my next job", "my finances", "my personal growth",
+         "this decision", "my family ties", "my studies", "my friendships", "this move", "my business idea"],
+        ["How will {} develop from here?", "How can I improve {}?", "What am I overlooking in {}?",
+         "What will change in {} over the next three months?", "What should I let go of regarding {}?"],
+    ),
+    "ja": (
+        ["私の恋愛", "この関係", "私の仕事", "次の職場", "私の金運", "私の内面の成長", "この決断", "家族との関係",
+         "私の勉強", "私の人間関係", "今回の引っ越し", "私の起業計画"],
+        ["{}はこれからどうなりますか？", "{}を良くするにはどうすればいいですか？", "{}で見落としていることは何ですか？",
+         "{}はこの三か月でどう変わりますか？", "{}について手放すべきものは何ですか？"],
+    ),
+}
+
+
+def build_profiles(args):
+    base = dict(BASE_PROFILE)
+    for key in ("latency_ms", "jitter_ms", "error_rate", "payload_bytes"):
+        value = getattr(args, key, None)
+        if value is not None:
+            base[key] = value
+
+    profiles = {}
+    for name, overrides in ENDPOINT_PROFILES.items():
+        profile = dict(base)
+        profile.update(overrides)
+        # Global flags win over built-in per-endpoint latency so that
+        # --latency-ms really sets the latency everywhere.
+        if args.latency_ms is not None:
+            profile["latency_ms"] = args.latency_ms
+        profiles[name] = profile
+
+    if args.config:
+        with open(args.config, encoding="utf-8") as f:
+            for name, overrides in json.load(f).items():
+                profiles.setdefault(name, dict(base)).update(overrides)
+
+    for item in args.set or []:
+        key, _, value = item.partition("=")
+        name, _, field = key.partition(".")
+        if name not in profiles or not field:
+            raise SystemExit(f"Unknown setting: {item} (endpoints: {', '.join(profiles)})")
+        profiles[name][field] = float(value) if "." in value or field == "error_rate" else int(value)
+    return profiles
+
+
+class MockState:
+    def __init__(self, profiles, seed=None):
+        self.profiles = profiles
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.sessions = {}
+        self.pending = {}
+        self.counts = {}
+        self.errors = {}
+        self.connections = 0
+
+    def count(self, name, error=False):
+        with self.lock:
+            self.counts[name] = self.counts.get(name, 0) + 1
+            if error:
+                self.errors[name] = self.errors.get(name, 0) + 1
+
+    def roll(self):
+        with self.lock:
+            return self.random.random()
+
+    def jitter(self, jitter_ms):
+        with self.lock:
+            return self.random.uniform(-jitter_ms, jitter_ms)
+
+    def stats(self):
+        with self.lock:
+            return {"requests": dict(self.counts), "errors": dict(self.errors), "sessions": len(self.sessions),
+                    "connections": self.connections}
+
+    def reset(self):
+        with self.lock:
+            self.counts.clear()
+            self.errors.clear()
+            self.connections = 0
+            self.sessions.clear()
+            self.pending.clear()
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MentobMockBackend/1.0"
+    # Headers and body go out as separate writes; without TCP_NODELAY the
+    # client's delayed ACK adds ~40 ms to every response and skews benchmarks.
+    disable_nagle_algorithm = True
+    state = None
+    quiet = False
+
+    def setup(self):
+        super().setup()
+        with self.state.lock:
+            self.state.connections += 1
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            sys.stderr.write("[mock] " + format % args + "\n")
+
+    def do_GET(self):
+        self.dispatch("GET")
+
+    def do_POST(self):
+        self.dispatch("POST")
+
+    # -- plumbing -------------------------------------------------------
+
+    def read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            return self.rfile.read(length)
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0], 16)
+                if size == 0:
+                    self.rfile.readline()
+                    break
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+            return b"".join(chunks)
+        return b""
+
+    def send_json(self, status, payload, profile=None):
+        if profile and profile.get("payload_bytes") and isinstance(payload.get("data"), dict):
+            payload["data"]["padding"] = "x" * int(profile["payload_bytes"])
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, status, code, message):
+        self.send_json(status, {"success": False, "error": {"code": code, "message": message}})
+
+    def send_stream(self, text, profile, content_type="text/event-stream; charset=utf-8"):
+        """Stream ``text`` as ``profile['chunks']`` chunked-encoding frames."""
+        data = text.encode()
+        chunks = max(1, int(profile["chunks"]))
+        chunk_bytes = int(profile.get("chunk_bytes") or 0)
+        if chunk_bytes:
+            # Repeat the canned text until the stream has the requested size.
+            target = chunks * chunk_bytes
+            data = (data * (target // max(1, len(data)) + 1))[:target]
+            data = data.decode("utf-8", "ignore").encode()
+        step = -(-len(data) // chunks)
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        interval = profile.get("chunk_interval_ms", 0) / 1000
+        for offset in range(0, len(data), step):
+            if offset and interval:
+                time.sleep(interval)
+            piece = data[offset:offset + step]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def send_blob(self, size, compress):
+        body = blob(size, compress)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def echo_body(self):
+        """Consume the request body in 64 KiB reads; reply with its size and SHA-256."""
+        digest, received = hashlib.sha256(), 0
+        length = self.headers.get("Content-Length")
+        if length is not None:
+            remaining = int(length)
+            while remaining:
+                piece = self.rfile.read(min(remaining, 1 << 16))
+                if not piece:
+                    break
+                digest.update(piece)
+                received += len(piece)
+                remaining -= len(piece)
+        else:
+            body = self.read_body()
+            digest.update(body)
+            received = len(body)
+        self.send_json(200, {"success": True, "data": {"bytes": received, "sha256": digest.hexdigest()}})
+
+    def dispatch(self, method):
+        path, _, query = self.path.partition("?")
+        if path in ("/", "/health") and method == "GET":
+            # Health check, e.g. test-stripe-api.py probes GET / before running.
+            return self.send_json(200, {"success": True, "data": {"status": "ok", "service": "mock-backend"}})
+        if path == "/__mock/stats":
+            return self.send_json(200, {"success": True, "data": self.state.stats()})
+        if path == "/__mock/reset" and method == "POST":
+            self.state.reset()
+            return self.send_json(200, {"success": True, "data": {}})
+        if path == "/__mock/blob" and method == "GET":
+            params = dict(p.partition("=")[::2] for p in query.split("&") if p)
+            return self.send_blob(int(params.get("size") or 0), params.get("gzip") == "1")
+        if path == "/__mock/echo" and method == "POST":
+            return self.echo_body()
+        if path.startswith("/api/"):
+            path = path[4:]
+
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                break
+        else:
+            self.read_body()
+            return self.send_error_json(404, "NOT_FOUND", f"No mock for {method} {path}")
+
+        body = self.read_body()
+        profile = self.state.profiles[name]
+        delay = profile["latency_ms"] + (self.state.jitter(profile["jitter_ms"]) if profile["jitter_ms"] else 0)
+        if delay > 0:
+            time.sleep(delay / 1000)
+
+        if profile["error_rate"] and self.state.roll() < profile["error_rate"]:
+            self.state.count(name, error=True)
+            return self.send_error_json(500, "INTERNAL_ERROR", "Injected mock failure")
+
+        self.state.count(name)
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            return self.send_error_json(400, "INVALID_REQUEST", "Body is not valid JSON")
+        params = dict(p.partition("=")[::2] for p in query.split("&") if p)
+        getattr(self, "handle_" + name.replace("-", "_"))(payload, params, profile, **match.groupdict())
+
+    # -- endpoints ------------------------------------------------------
+
+    def handle_login(self, payload, params, profile):
+        if not payload.get("email") or not payload.get("password"):
+            return self.send_error_json(400, "INVALID_REQUEST", "Email and password are required")
+        user = dict(DEMO_USER, email=payload["email"])
+        self.send_json(200, {"success": True, "data": user, "message": "Login successful"}, profile)
+
+    def handle_register(self, payload, params, profile):
+        email = payload.get("email") or "user@example.com"
+        user = {"id": f"user-{uuid.uuid4().hex[:8]}", "username": email.split("@")[0], "email": email, "isActive": True}
+        self.send_json(200, {"success": True, "data": user, "message": "Registration successful"}, profile)
+
+    def handle_quota(self, payload, params, profile):
+        data = {"remaining": 999999, "used": 0, "total": "Unlimited", "isDemo": True}
+        self.send_json(200, {"success": True, "data": data}, profile)
+
+    def handle_me(self, payload, params, profile):
+        self.send_json(200, {"success": True, "data": dict(DEMO_USER)}, profile)
+
+    def handle_interpret(self, payload, params, profile):
+        if not payload.get("cards"):
+            return self.send_error_json(400, "INVALID_REQUEST", "Missing required fields")
+        if profile["chunks"]:
+            return self.send_stream(INTERPRETATION_TEXT, profile)
+        self.send_json(200, {"success": True, "data": {"interpretation": INTERPRETATION_TEXT}}, profile)
+
+    def handle_llm(self, payload, params, profile):
+        if not payload.get("messages"):
+            return self.send_error_json(400, "INVALID_REQUEST", "messages is required")
+        self.send_stream(INTERPRETATION_TEXT, profile, content_type="text/plain; charset=utf-8")
+
+    def handle_llm_complete(self, payload, params, profile):
+        messages = payload.get("messages") or []
+        if not messages:
+            return self.send_error_json(400, "INVALID_REQUEST", "messages is required")
+        prompt = str(messages[-1].get("content", ""))
+        locale = re.search(r"locale:\s*(zh|en|ja)", prompt)
+        count = re.search(r"count:\s*(\d+)", prompt)
+        subjects, forms = STUB_QUESTIONS[locale.group(1) if locale else "zh"]
+        with self.state.lock:
+            lines = [self.state.random.choice(forms).format(self.state.random.choice(subjects))
+                     for _ in range(min(int(count.group(1)) if count else 5, 50))]
+        content = "\n".join(lines)
+        self.send_json(200, {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion",
+            "model": payload.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+        }, profile)
+
+    def handle_suggest(self, payload, params, profile):
+        data = {"suggestion": "1. 职业技能提升\n2. 人际关系\n3. 内在成长"}
+        self.send_json(200, {"success": True, "data": data}, profile)
+
+    def handle_history(self, payload, params, profile):
+        limit = int(params.get("limit") or 20)
+        now = time.time()
+        interpretations = [
+            {
+                "id": f"interpretation-{i}",
+                "userId": params.get("userId", "demo-user-id"),
+                "question": "我的工作发展前景如何？",
+                "spreadType": "three",
+                "cards": '[{"id":0,"name":"愚人","isReversed":false}]',
+                "interpretation": INTERPRETATION_TEXT,
+                "createdAt": time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime(now - i * 3600)),
+            }
+            for i in range(limit)
+        ]
+        self.send_json(200, {"success": True, "data": {"interpretations": interpretations}}, profile)
+
+    def handle_checkout(self, payload, params, profile):
+        price_id = payload.get("price_id") or payload.get("priceId")
+        if not price_id:
+            return self.send_error_json(400, "INVALID_REQUEST", "price_id is required")
+        session_id = f"cs_test_{uuid.uuid4().hex}"
+        with self.state.lock:
+            self.state.sessions[session_id] = time.monotonic()
+        data = {"sessionId": session_id, "url": f"https://checkout.stripe.com/c/pay/{session_id}"}
+        self.send_json(200, {"success": True, "data": data}, profile)
+
+    def handle_payment_status(self, payload, params, profile, session_id):
+        with self.state.lock:
+            created = self.state.sessions.get(session_id)
+            if created is None and session_id.startswith("cs_"):
+                # Unknown sessions (e.g. from a load script) start pending now.
+                created = self.state.sessions[session_id] = time.monotonic()
+            if created is not None and session_id not in self.state.pending:
+                jitter = self.state.random.uniform(0, profile.get("pending_jitter_ms", 0))
+                self.state.pending[session_id] = profile.get("pending_ms", 0) + jitter
+            pending_ms = self.state.pending.get(session_id, 0)
+        if created is None:
+            return self.send_error_json(404, "NOT_FOUND", "Session not found")
+        elapsed_ms = (time.monotonic() - created) * 1000
+        status = "completed" if elapsed_ms >= pending_ms else "pending"
+        # pendingMs lets load scripts measure how quickly clients notice completion.
+        body = {"success": True, "status": status, "sessionId": session_id, "pendingMs": round(pending_ms)}
+        self.send_json(200, body, profile)
+
+
+@functools.lru_cache(maxsize=16)
+def blob(size, compress):
+    """``size`` bytes of mildly compressible JSON-ish text (gzipped when ``compress``)."""
+    unit = b'{"id":12345,"text":"\xe7\x89\x8c\xe9\x9d\xa2 reading","score":0.87},'
+    data = (unit * (size // len(unit) + 1))[:size]
+    return gzip.compress(data, 6) if compress else data
+
+
+def make_server(host="127.0.0.1", port=DEFAULT_PORT, profiles=None, seed=None, quiet=True):
+    """Create (but don't start) a mock server; handy for benchmarks that embed it."""
+    if profiles is None:
+        profiles = build_profiles(parse_args([]))
+    handler = type("Handler", (MockHandler,), {"state": MockState(profiles, seed), "quiet": quiet})
+    server_class = type("MockServer", (ThreadingHTTPServer,), {
+        # The default backlog of 5 drops SYNs under load scripts' bursts,
+        # adding ~1 s retransmit stalls that are not the app's fault.
+        "request_queue_size": 256,
+    })
+    server = server_class((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local mock of the Mentob FastAPI backend")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("MOCK_BACKEND_PORT", DEFAULT_PORT)))
+    parser.add_argument("--latency-ms", dest="latency_ms", type=float,
+                        help="latency for every endpoint (default: per-endpoint profile)")
+    parser.add_argument("--jitter-ms", dest="jitter_ms", type=float, help="uniform latency jitter")
+    parser.add_argument("--error-rate", dest="error_rate", type=float, help="probability of a 500 response")
+    parser.add_argument("--payload-bytes", dest="payload_bytes", type=int, help="padding added to JSON bodies")
+    parser.add_argument("--config", help="JSON file of {endpoint: {setting: value}} overrides")
+    parser.add_argument("--set", action="append", metavar="ENDPOINT.KEY=VALUE",
+                        help="override one endpoint setting, e.g. interpret.chunks=100")
+    parser.add_argument("--seed", type=int, help="seed for jitter and injected errors")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every request")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    profiles = build_profiles(args)
+    server = make_server(args.host, args.port, profiles, args.seed, quiet=not args.verbose)
+    print(f"Mock backend listening on http://{args.host}:{args.port}")
+    for name, profile in profiles.items():
+        settings = ", ".join(
+            f"{k}={v}" for k, v in profile.items()
+            if v and (profile["chunks"] or not k.startswith("chunk"))
+        )
+        print(f"  {name:<16}{settings}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopped")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
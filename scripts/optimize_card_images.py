@@ -0,0 +1,241 @@
+"""Build WebP/AVIF responsive variants of the tarot card art.
+
+Every source PNG under public/tarot-cards/result is resized to a few fixed
+widths and re-encoded in modern formats. The result is written to
+public/tarot-cards/variants together with a manifest.json keyed by the source
+path, so card data can map an ``imageUrl`` to its variants::
+
+    python scripts/optimize_card_images.py            # incremental
+    python scripts/optimize_card_images.py --force    # re-encode everything
+
+Requires Pillow (``pip install Pillow``); AVIF output needs Pillow >= 11.2 or
+the pillow-avif-plugin and is skipped with a warning when unavailable.
+"""
+
+import os
+import json
+import time
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+
+SOURCE_DIR = os.environ.get("TAROT_PUBLIC_DIR", "public/tarot-cards/result")
+OUTPUT_DIR = os.path.join(os.path.dirname(SOURCE_DIR.rstrip("/")), "variants")
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+URL_PREFIX = "/tarot-cards/variants"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 64 * 1024
+
+# Widths are capped at the source width; art is never upscaled.
+WIDTHS = (120, 240, 480)
+FORMATS = {
+    "webp": {"quality": 80, "method": 6},
+    "avif": {"quality": 55, "speed": 6},
+}
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def settings_key(formats):
+    """Fingerprint of the encoder settings; changing them invalidates every entry."""
+    settings = {"widths": WIDTHS, "formats": {fmt: FORMATS[fmt] for fmt in formats}}
+    return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def available_formats():
+    formats = []
+    for fmt in FORMATS:
+        if features.check(fmt):
+            formats.append(fmt)
+        else:
+            print(f"Warning: Pillow was built without {fmt.upper()} support, skipping it")
+    return formats
+
+
+def list_sources():
+    sources = []
+    for folder in sorted(os.listdir(SOURCE_DIR)):
+        folder_path = os.path.join(SOURCE_DIR, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for name in sorted(os.listdir(folder_path)):
+            if name.endswith(".png"):
+                sources.append(f"{folder}/{name}")
+    return sources
+
+
+def variant_path(rel_path, width, fmt):
+    stem = os.path.splitext(rel_path)[0]
+    return f"{stem}-{width}w.{fmt}"
+
+
+def encode(rel_path, sha256, formats):
+    """Encode all variants of one source image. Runs in a worker process."""
+    source_path = os.path.join(SOURCE_DIR, rel_path)
+    entry = {
+        "sha256": sha256,
+        "bytes": os.path.getsize(source_path),
+        "variants": [],
+    }
+
+    with Image.open(source_path) as image:
+        image.load()
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        entry["width"], entry["height"] = image.size
+
+        widths = sorted({min(width, image.width) for width in WIDTHS})
+        for width in widths:
+            height = round(image.height * width / image.width)
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                rel_variant = variant_path(rel_path, width, fmt)
+                out_path = os.path.join(OUTPUT_DIR, rel_variant)
+                os.makedirs(os.path.dirname(out_path), exist_ok=True)
+                tmp_path = out_path + ".tmp"
+                resized.save(tmp_path, format=fmt.upper(), **FORMATS[fmt])
+                os.replace(tmp_path, out_path)
+                entry["variants"].append({
+                    "url": f"{URL_PREFIX}/{rel_variant}",
+                    "format": fmt,
+                    "width": width,
+                    "height": height,
+                    "bytes": os.path.getsize(out_path),
+                })
+    return entry
+
+
+def is_current(entry, sha256):
+    if not entry or entry.get("sha256") != sha256:
+        return False
+    for variant in entry.get("variants", []):
+        rel_variant = variant["url"][len(URL_PREFIX) + 1:]
+        if not os.path.exists(os.path.join(OUTPUT_DIR, rel_variant)):
+            return False
+    return True
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def save_manifest(manifest):
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    tmp_path = MANIFEST_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(tmp_path, MANIFEST_PATH)
+
+
+def remove_stale(files, sources):
+    """Delete variants whose source PNG no longer exists."""
+    removed = 0
+    for rel_path in list(files):
+        if rel_path in sources:
+            continue
+        for variant in files.pop(rel_path).get("variants", []):
+            path = os.path.join(OUTPUT_DIR, variant["url"][len(URL_PREFIX) + 1:])
+            if os.path.exists(path):
+                os.remove(path)
+        removed += 1
+    return removed
+
+
+def print_report(files, formats):
+    source_total = sum(entry["bytes"] for entry in files.values())
+    print(f"\n{'format':<8}{'width':>8}{'files':>8}{'bytes':>14}{'vs source':>12}")
+    rows = {}
+    for entry in files.values():
+        for variant in entry["variants"]:
+            # Bucket by the requested width so capped variants line up.
+            bucket = min((w for w in WIDTHS if w >= variant["width"]), default=variant["width"])
+            row = rows.setdefault((variant["format"], bucket), [0, 0])
+            row[0] += 1
+            row[1] += variant["bytes"]
+    for (fmt, width), (count, size) in sorted(rows.items()):
+        ratio = size / source_total * 100 if source_total else 0
+        print(f"{fmt:<8}{width:>8}{count:>8}{size:>14,}{ratio:>11.1f}%")
+
+    # Savings for the largest variant of each card in the smallest format,
+    # i.e. what a full-size view costs once browsers pick the best source.
+    best_total = 0
+    for entry in files.values():
+        full = [v for v in entry["variants"] if v["width"] == entry["width"] and v["format"] in formats]
+        best_total += min((v["bytes"] for v in full), default=entry["bytes"])
+    saved = source_total - best_total
+    pct = saved / source_total * 100 if source_total else 0
+    print(f"\nSource PNGs: {source_total:,} bytes; best full-size variants: {best_total:,} bytes "
+          f"(saved {saved:,} bytes, {pct:.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build WebP/AVIF variants of the tarot card art")
+    parser.add_argument("--force", action="store_true", help="re-encode every source image")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    if Image is None:
+        raise SystemExit("Pillow is required: pip install Pillow")
+
+    started = time.perf_counter()
+    formats = available_formats()
+    manifest = load_manifest()
+    settings = settings_key(formats)
+    files = manifest.get("files", {}) if manifest.get("settings") == settings else {}
+
+    sources = list_sources()
+    pending = []
+    for rel_path in sources:
+        sha256 = sha256_file(os.path.join(SOURCE_DIR, rel_path))
+        if args.force or not is_current(files.get(rel_path), sha256):
+            pending.append((rel_path, sha256))
+
+    removed = remove_stale(files, set(sources))
+    failed = 0
+    if pending:
+        with ProcessPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = {
+                executor.submit(encode, rel_path, sha256, formats): rel_path
+                for rel_path, sha256 in pending
+            }
+            for future in as_completed(futures):
+                rel_path = futures[future]
+                try:
+                    files[rel_path] = future.result()
+                    print(f"Encoded: {rel_path}")
+                except Exception as e:
+                    failed += 1
+                    files.pop(rel_path, None)
+                    print(f"Error encoding {rel_path}: {e}")
+
+    save_manifest({"version": MANIFEST_VERSION, "settings": settings, "files": files})
+    elapsed = time.perf_counter() - started
+    print(f"\nEncoded {len(pending) - failed} of {len(sources)} sources "
+          f"({len(sources) - len(pending)} unchanged, {removed} removed, {failed} failed) in {elapsed:.2f}s")
+    print_report(files, formats)
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Profile interpretation prompt sizes against a token budget.
+
+For every spread and tone, this builds the prompt that
+``/api/tarot/interpret`` would send (system prompt plus user prompt) for the
+worst-case draw, that is, the cards whose name and longest meaning add the
+most text, and for a typical draw. It reports character and estimated token
+counts and flags anything over budget::
+
+    python scripts/prompt_budget.py
+    python scripts/prompt_budget.py --budget 1500 --fail-over-budget
+    python scripts/prompt_budget.py --json prompt-report.json --baseline old-report.json
+
+The system prompt, tone instructions and user prompt template are read
+straight from ``src/config/llm.ts`` and the route, so the report follows the
+code. The per-card line is mirrored here and checked against the route
+source; if the route changes its format, the tool stops rather than report
+stale numbers.
+
+Token counts are estimates, since the model's tokenizer is not available
+offline. CJK characters count ``--cjk-ratio`` tokens each (default 1.0, which
+is deliberately pessimistic) and other text one token per four characters.
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import statistics
+
+from tarot_ts import REPO_ROOT, load_spreads, load_cards
+
+ROUTE_TS = os.path.join(REPO_ROOT, "src", "app", "api", "tarot", "interpret", "route.ts")
+LLM_TS = os.path.join(REPO_ROOT, "src", "config", "llm.ts")
+REPORT_VERSION = 1
+
+DEFAULT_BUDGET = 2000
+# appConfig.limits.maxQuestionLength
+DEFAULT_QUESTION_CHARS = 500
+TYPICAL_QUESTION = "我最近的工作发展前景如何？接下来三个月需要注意什么？"
+
+# The route's per-card line, verbatim. ``card_line`` below must render it.
+CARD_LINE_TEMPLATE = (
+    "`${index + 1}. ${position?.name}（${position?.description}）：${card.name} "
+    "${card.isReversed ? '（逆位）' : ''} - ${card.isReversed ? card.reversedMeaning : card.meaning}`"
+)
+REVERSED_MARK = "（逆位）"
+
+CJK_RE = re.compile(r"[⺀-鿿가-힯豈-﫿＀-￯　-〿]")
+PLACEHOLDER_RE = re.compile(r"\$\{([\w.]+)\}")
+
+
+def read(path):
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def load_templates():
+    """Extract the system prompt, tone map and user prompt template from the TS sources."""
+    route = read(ROUTE_TS)
+    llm = read(LLM_TS)
+
+    system = re.search(r"systemPrompt: `(.*?)`", llm, re.DOTALL)
+    user = re.search(r"const userPrompt = `(.*?)`;", route, re.DOTALL)
+    tones = re.search(r"toneInstructionMap[^{]*\{(.*?)\};", route, re.DOTALL)
+    if not (system and user and tones):
+        raise SystemExit("Could not find the prompt templates in llm.ts / interpret route.ts")
+    if CARD_LINE_TEMPLATE not in route:
+        raise SystemExit("The route's per-card prompt line changed; update CARD_LINE_TEMPLATE and card_line()")
+
+    return {
+        "system": system.group(1),
+        "user": user.group(1),
+        "tones": dict(re.findall(r"(\w+): '([^']*)'", tones.group(1))),
+    }
+
+
+def card_line(index, position, card, is_reversed):
+    meaning = card.get("reversedMeaning", "") if is_reversed else card.get("meaning", "")
+    return (f"{index + 1}. {position['name']}（{position['description']}）：{card.get('name', '')} "
+            f"{REVERSED_MARK if is_reversed else ''} - {meaning}")
+
+
+def render(template, values):
+    def substitute(match):
+        if match.group(1) not in values:
+            raise SystemExit(f"Unknown placeholder ${{{match.group(1)}}} in the user prompt template")
+        return values[match.group(1)]
+    rendered = PLACEHOLDER_RE.sub(substitute, template)
+    if "${" in rendered:
+        raise SystemExit("Unrendered ${...} expression in the user prompt template; update render() and build_prompt()")
+    return rendered
+
+
+def estimate_tokens(text, cjk_ratio):
+    cjk = len(CJK_RE.findall(text))
+    return round(cjk * cjk_ratio + (len(text) - cjk) / 4)
+
+
+def card_cost(card):
+    """Return ``(chars, is_reversed)`` for the orientation that adds the most text."""
+    upright = len(card.get("meaning", ""))
+    reversed_ = len(card.get("reversedMeaning", "")) + len(REVERSED_MARK)
+    return (len(card.get("name", "")) + max(upright, reversed_), reversed_ > upright)
+
+
+def worst_draw(cards, count):
+    """The ``count`` distinct cards (with orientation) producing the longest lines."""
+    ranked = sorted(cards, key=lambda card: (-card_cost(card)[0], card["id"]))
+    return [(card, card_cost(card)[1]) for card in ranked[:count]]
+
+
+def typical_draw(cards, count):
+    """``count`` cards of median length, upright."""
+    ranked = sorted(cards, key=lambda card: (len(card.get("name", "")) + len(card.get("meaning", "")), card["id"]))
+    middle = max(0, len(ranked) // 2 - count // 2)
+    return [(card, False) for card in ranked[middle:middle + count]]
+
+
+def build_prompt(templates, spread, draw, tone, question):
+    lines = [card_line(i, spread["positions"][i], card, rev) for i, (card, rev) in enumerate(draw)]
+    return render(templates["user"], {
+        "question": question,
+        "spread.name": spread["name"],
+        "cardsInfo": "\n".join(lines),
+        "toneInstruction": templates["tones"].get(tone, ""),
+    })
+
+
+def profile(templates, budget, question_chars, cjk_ratio):
+    cards = load_cards()
+    system = templates["system"]
+    worst_question = (TYPICAL_QUESTION * (question_chars // len(TYPICAL_QUESTION) + 1))[:question_chars]
+    rows = []
+    for spread in load_spreads():
+        count = len(spread["positions"])
+        for tone in ["none"] + sorted(templates["tones"]):
+            row = {"spread": spread["id"], "cards": count, "tone": tone}
+            for case, draw, question in (
+                ("typical", typical_draw(cards, count), TYPICAL_QUESTION),
+                ("worst", worst_draw(cards, count), worst_question),
+            ):
+                user = build_prompt(templates, spread, draw, tone, question)
+                row[case] = {
+                    "userChars": len(user),
+                    "totalChars": len(system) + len(user),
+                    "tokens": estimate_tokens(system, cjk_ratio) + estimate_tokens(user, cjk_ratio),
+                }
+            row["overBudget"] = row["worst"]["tokens"] > budget
+            rows.append(row)
+    return rows
+
+
+def print_report(rows, budget, system_tokens, baseline):
+    previous = {}
+    if baseline:
+        previous = {(row["spread"], row["tone"]): row for row in baseline["rows"]}
+
+    print(f"Budget: {budget} tokens (system prompt alone: ~{system_tokens})\n")
+    header = f"{'spread':<16}{'cards':>6}  {'tone':<10}{'typical ch':>11}{'~tok':>7}{'worst ch':>10}{'~tok':>7}"
+    if previous:
+        header += f"{'Δtok':>7}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        line = (f"{row['spread']:<16}{row['cards']:>6}  {row['tone']:<10}"
+                f"{row['typical']['totalChars']:>11}{row['typical']['tokens']:>7}"
+                f"{row['worst']['totalChars']:>10}{row['worst']['tokens']:>7}")
+        if previous:
+            old = previous.get((row["spread"], row["tone"]))
+            delta = row["worst"]["tokens"] - old["worst"]["tokens"] if old else None
+            line += f"{'new' if delta is None else f'{delta:+d}':>7}"
+        if row["overBudget"]:
+            line += "  OVER BUDGET"
+        print(line)
+
+    largest = max(rows, key=lambda row: row["worst"]["tokens"])
+    over = sorted({row["spread"] for row in rows if row["overBudget"]})
+    print(f"\nLargest: {largest['spread']} / {largest['tone']} at ~{largest['worst']['tokens']} tokens")
+    print(f"Over budget: {', '.join(over) if over else 'none'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report interpretation prompt sizes against a token budget")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET,
+                        help=f"estimated token budget per prompt (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--question-chars", type=int, default=DEFAULT_QUESTION_CHARS,
+                        help=f"question length for the worst case (default: {DEFAULT_QUESTION_CHARS})")
+    parser.add_argument("--cjk-ratio", type=float, default=1.0, help="estimated tokens per CJK character")
+    parser.add_argument("--json", help="write the report to this file")
+    parser.add_argument("--baseline", help="earlier --json report to compare against")
+    parser.add_argument("--fail-over-budget", action="store_true",
+                        help="exit with status 1 if any prompt exceeds the budget")
+    args = parser.parse_args()
+
+    templates = load_templates()
+    rows = profile(templates, args.budget, args.question_chars, args.cjk_ratio)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    system_tokens = estimate_tokens(templates["system"], args.cjk_ratio)
+    print_report(rows, args.budget, system_tokens, baseline)
+
+    if args.json:
+        report = {
+            "version": REPORT_VERSION,
+            "budget": args.budget,
+            "questionChars": args.question_chars,
+            "cjkRatio": args.cjk_ratio,
+            "systemPrompt": {"chars": len(templates["system"]), "tokens": system_tokens},
+            "tones": sorted(templates["tones"]),
+            "summary": {
+                "maxTokens": max(row["worst"]["tokens"] for row in rows),
+                "medianTypicalTokens": statistics.median(row["typical"]["tokens"] for row in rows),
+                "overBudget": sorted({row["spread"] for row in rows if row["overBudget"]}),
+            },
+            "rows": rows,
+        }
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nWrote {args.json}")
+
+    if args.fail_over_budget and any(row["overBudget"] for row in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,304 @@
+"""Pre-render share-page preview images (1200x630 Open Graph cards) for readings.
+
+Each preview is a composite of the reading's card art laid out in its spread
+shape, with reversed cards turned upside down. Previews are content-addressed
+by the draw: the key hashes the spread id and the card ids and orientations in
+order. So every reading with the same draw shares one file, and a file that
+exists never needs rendering again::
+
+    <out>/<key[:2]>/<key>.jpg          default out: .cache/share-previews (or $SHARE_PREVIEW_DIR)
+
+``src/app/share/[id]/opengraph-image.ts`` computes the same key from the stored
+reading and serves the file. Backfill existing readings from a JSON Lines
+export of ``tarot_interpretations`` (``id``, ``spreadType``, ``cards``: the
+stored JSON string or a list)::
+
+    python scripts/render_share_previews.py --input readings.jsonl -j 4
+    python scripts/render_share_previews.py --synthetic 500 --seed 1   # sizing run on random draws
+
+Readings without a rendered preview (new ones, or before the backfill) get a
+generic card instead of a 404. It is committed as
+``public/share-preview-fallback.jpg``; regenerate it after styling changes::
+
+    python scripts/render_share_previews.py --fallback
+
+Renders run on a process pool; each worker keeps the card art it has already
+decoded and scaled. The report gives unique draws, cache hits, renders/sec
+and per-render time to size the job. Requires Pillow.
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    from PIL import Image, ImageDraw
+except ImportError:
+    raise SystemExit("Pillow is required: pip install Pillow")
+
+from tarot_ts import REPO_ROOT
+from tarot_registry import CARDS_BY_ID
+from bench_stats import summarize, format_bytes
+
+PUBLIC_DIR = os.path.join(REPO_ROOT, "public")
+CARD_ART_DIR = os.path.join(PUBLIC_DIR, "tarot-cards", "result")
+DEFAULT_OUT = os.environ.get("SHARE_PREVIEW_DIR", os.path.join(REPO_ROOT, ".cache", "share-previews"))
+LOGO_PATH = os.path.join(PUBLIC_DIR, "logo.jpeg")
+FALLBACK_PATH = os.path.join(PUBLIC_DIR, "share-preview-fallback.jpg")
+
+# Part of every key: bump when layouts or styling change so old previews are not reused.
+# Keep in sync with src/lib/share-preview.ts.
+LAYOUT_VERSION = "v1"
+WIDTH, HEIGHT = 1200, 630
+MARGIN = 48
+CARD_RATIO = 1.75          # card art is ~300x525
+PITCH_X, PITCH_Y = 1.15, 1.08  # slot spacing in card widths / heights
+JPEG_OPTIONS = {"format": "JPEG", "quality": 82, "optimize": True, "progressive": True}
+TOP_COLOR, BOTTOM_COLOR = (46, 16, 101), (8, 4, 20)  # purple-950 fading to near black
+
+# Slot centres per spread id, in (card widths, card heights) before pitch. A third
+# value of 90 lays the card sideways (the crossing card of the Celtic cross).
+SPREAD_LAYOUTS = {
+    "single": [(0, 0)],
+    "cross": [(0, 0), (0, 0, 90), (0, 1), (-1, 0), (0, -1), (1, 0),
+              (2.1, 1.5), (2.1, 0.5), (2.1, -0.5), (2.1, -1.5)],
+    "holyTriangle": [(0, 0), (-0.6, 1), (0.6, 1)],
+    "loverPyramid": [(-0.6, 1), (0.6, 1), (0, 0)],
+    "loveTree": [(0, 1), (-0.6, 0), (0.6, 0)],
+    "wealthTree": [(0, 1), (-0.6, 0), (0.6, 0)],
+    "loveCross": [(-1, 0), (1, 0), (0, -0.55), (0, 0.55)],
+    "fourElements": [(0, -0.55), (1, 0), (0, 0.55), (-1, 0)],
+    "weeklyFortune": [(-1.5, -0.5), (-0.5, -0.5), (0.5, -0.5), (1.5, -0.5), (-1, 0.5), (0, 0.5), (1, 0.5)],
+    "hexagram": [(0, -1), (1, -0.5), (1, 0.5), (0, 1), (-1, 0.5), (-1, -0.5)],
+}
+ROW_WRAP = 5
+
+
+def preview_key(spread_type, cards):
+    """Content address of a draw: ``cards`` is ``[(card_id, is_reversed), ...]`` in position order."""
+    draw = ",".join(f"{card_id}{'r' if reversed_ else 'u'}" for card_id, reversed_ in cards)
+    return hashlib.sha256(f"share-preview/{LAYOUT_VERSION}|{spread_type}|{draw}".encode()).hexdigest()[:20]
+
+
+def preview_path(out_dir, key):
+    return os.path.join(out_dir, key[:2], f"{key}.jpg")
+
+
+def slots_for(spread_type, count):
+    slots = SPREAD_LAYOUTS.get(spread_type)
+    if slots is not None and len(slots) == count:
+        return [slot if len(slot) == 3 else (*slot, 0) for slot in slots]
+    # Unknown spread or a card count the layout does not fit: centred rows.
+    rows = [list(range(start, min(start + ROW_WRAP, count))) for start in range(0, count, ROW_WRAP)]
+    return [(i - (len(row) - 1) / 2, r - (len(rows) - 1) / 2, 0)
+            for r, row in enumerate(rows) for i in range(len(row))]
+
+
+def place(slots, canvas_w, canvas_h):
+    """Card width and pixel centres that fit every slot inside the canvas margins."""
+    # Extents at card width 1; everything scales linearly with the width.
+    boxes = []
+    for x, y, rotation in slots:
+        half_w, half_h = (CARD_RATIO / 2, 0.5) if rotation == 90 else (0.5, CARD_RATIO / 2)
+        cx, cy = x * PITCH_X, y * PITCH_Y * CARD_RATIO
+        boxes.append((cx - half_w, cy - half_h, cx + half_w, cy + half_h))
+    left, top = min(b[0] for b in boxes), min(b[1] for b in boxes)
+    right, bottom = max(b[2] for b in boxes), max(b[3] for b in boxes)
+    card_w = min((canvas_w - 2 * MARGIN) / (right - left), (canvas_h - 2 * MARGIN) / (bottom - top))
+    offset_x = canvas_w / 2 - (left + right) / 2 * card_w
+    offset_y = canvas_h / 2 - (top + bottom) / 2 * card_w
+    centres = [(offset_x + x * PITCH_X * card_w, offset_y + y * PITCH_Y * CARD_RATIO * card_w) for x, y, _ in slots]
+    return card_w, centres
+
+
+@functools.lru_cache(maxsize=1)
+def background():
+    mask = Image.linear_gradient("L").resize((WIDTH, HEIGHT))
+    return Image.composite(Image.new("RGB", (WIDTH, HEIGHT), BOTTOM_COLOR),
+                           Image.new("RGB", (WIDTH, HEIGHT), TOP_COLOR), mask)
+
+
+@functools.lru_cache(maxsize=512)
+def card_image(card_id, width, height, rotation):
+    """Card art scaled to ``width x height`` and rotated; cached per worker process."""
+    with Image.open(os.path.join(CARD_ART_DIR, CARDS_BY_ID[card_id].path)) as source:
+        source.draft("RGB", (width, height))  # JPEG: decode at reduced scale when possible
+        image = source.convert("RGB").resize((width, height), Image.LANCZOS)
+    return image.rotate(rotation, expand=True) if rotation else image
+
+
+def render(spread_type, cards):
+    """Composite one preview; returns the encoded JPEG bytes."""
+    slots = slots_for(spread_type, len(cards))
+    card_w, centres = place(slots, WIDTH, HEIGHT)
+    width, height = max(1, round(card_w)), max(1, round(card_w * CARD_RATIO))
+    canvas = background().copy()
+    draw = ImageDraw.Draw(canvas)
+    for (card_id, reversed_), (_, _, slot_rotation), (cx, cy) in zip(cards, slots, centres):
+        image = card_image(card_id, width, height, (slot_rotation + (180 if reversed_ else 0)) % 360)
+        left, top = round(cx - image.width / 2), round(cy - image.height / 2)
+        draw.rectangle((left - 2, top - 2, left + image.width + 1, top + image.height + 1), fill=(0, 0, 0))
+        canvas.paste(image, (left, top))
+    buffer = io.BytesIO()
+    canvas.save(buffer, **JPEG_OPTIONS)
+    return buffer.getvalue()
+
+
+def render_fallback():
+    """Generic preview for readings that have none yet: the site logo on the preview background."""
+    canvas = background().copy()
+    side = HEIGHT - 4 * MARGIN
+    with Image.open(LOGO_PATH) as source:
+        logo = source.convert("RGB").resize((side, side), Image.LANCZOS)
+    canvas.paste(logo, ((WIDTH - side) // 2, (HEIGHT - side) // 2))
+    buffer = io.BytesIO()
+    canvas.save(buffer, **JPEG_OPTIONS)
+    return buffer.getvalue()
+
+
+def render_to_file(key, spread_type, cards, out_dir):
+    """Worker entry point: returns ``(key, seconds, bytes, error)``."""
+    started = time.perf_counter()
+    try:
+        data = render(spread_type, cards)
+        path = preview_path(out_dir, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        return key, time.perf_counter() - started, len(data), None
+    except Exception as error:  # noqa: BLE001 - reported per draw, the batch carries on
+        return key, time.perf_counter() - started, 0, f"{type(error).__name__}: {error}"
+
+
+def parse_reading(record):
+    """``(spread_type, [(card_id, is_reversed)])`` from an exported row; raises ValueError."""
+    cards = record.get("cards")
+    if isinstance(cards, str):
+        cards = json.loads(cards)
+    if not record.get("spreadType") or not isinstance(cards, list) or not cards:
+        raise ValueError("needs spreadType and a non-empty cards list")
+    draw = []
+    for card in cards:
+        card_id = card.get("id") if isinstance(card, dict) else None
+        if isinstance(card_id, str) and card_id.isdigit():
+            card_id = int(card_id)
+        if card_id not in CARDS_BY_ID:
+            raise ValueError(f"unknown card id {card_id!r}")
+        draw.append((card_id, bool(card.get("isReversed"))))
+    return record["spreadType"], draw
+
+
+def read_readings(path):
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    with stream:
+        for number, line in enumerate(stream, start=1):
+            if line.strip():
+                yield number, json.loads(line)
+
+
+def synthetic_readings(count, seed):
+    rng = random.Random(seed)
+    layouts = sorted(SPREAD_LAYOUTS.items())
+    for number in range(1, count + 1):
+        spread_type, slots = rng.choice(layouts)
+        ids = rng.sample(sorted(CARDS_BY_ID), len(slots))
+        yield number, {"id": f"synthetic-{number}", "spreadType": spread_type,
+                       "cards": [{"id": i, "isReversed": rng.random() < 0.5} for i in ids]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch-render share preview images for tarot readings")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="JSON Lines export of readings (id, spreadType, cards), or - for stdin")
+    source.add_argument("--synthetic", type=int, metavar="N", help="render N random draws instead")
+    source.add_argument("--fallback", action="store_true",
+                        help=f"write the generic preview to {os.path.relpath(FALLBACK_PATH, REPO_ROOT)} and exit")
+    parser.add_argument("--seed", type=int, default=0, help="seed for --synthetic (default: 0)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help=f"preview directory (default: {DEFAULT_OUT})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-render previews that already exist")
+    parser.add_argument("--json", help="write the report to this file")
+    args = parser.parse_args()
+
+    if args.fallback:
+        data = render_fallback()
+        with open(FALLBACK_PATH, "wb") as f:
+            f.write(data)
+        print(f"Wrote {os.path.relpath(FALLBACK_PATH, REPO_ROOT)} ({format_bytes(len(data))})")
+        return
+
+    readings = read_readings(args.input) if args.input else synthetic_readings(args.synthetic, args.seed)
+    draws, total, invalid = {}, 0, 0
+    for number, record in readings:
+        total += 1
+        try:
+            spread_type, cards = parse_reading(record)
+        except (ValueError, TypeError, AttributeError) as error:
+            invalid += 1
+            print(f"  skipping reading {record.get('id', f'#{number}')}: {error}", file=sys.stderr)
+            continue
+        draws.setdefault(preview_key(spread_type, cards), (spread_type, cards))
+
+    cached = set() if args.force else {key for key in draws if os.path.exists(preview_path(args.out, key))}
+    todo = [(key, *draws[key]) for key in draws if key not in cached]
+    print(f"{total} reading(s), {invalid} invalid, {len(draws)} unique draw(s), "
+          f"{len(cached)} already rendered, {len(todo)} to render with {args.jobs} worker(s)")
+
+    timings, sizes, failures = [], [], []
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futures = [pool.submit(render_to_file, key, spread_type, cards, args.out) for key, spread_type, cards in todo]
+        for done, future in enumerate(as_completed(futures), start=1):
+            key, seconds, size, error = future.result()
+            if error:
+                failures.append((key, error))
+                print(f"  {key}: {error}", file=sys.stderr)
+            else:
+                timings.append(seconds)
+                sizes.append(size)
+            if done % 100 == 0:
+                print(f"  {done}/{len(todo)}")
+    elapsed = time.perf_counter() - started
+
+    per_render = summarize(timings)
+    report = {
+        "readings": total,
+        "invalid": invalid,
+        "uniqueDraws": len(draws),
+        "cacheHits": len(cached),
+        "rendered": len(timings),
+        "failed": len(failures),
+        "jobs": args.jobs,
+        "seconds": elapsed,
+        "rendersPerSecond": len(timings) / elapsed if elapsed else 0.0,
+        "renderMsP50": per_render["p50"] * 1000,
+        "renderMsP95": per_render["p95"] * 1000,
+        "averageBytes": sum(sizes) / len(sizes) if sizes else 0,
+    }
+    print(f"\nRendered {report['rendered']} preview(s) in {elapsed:.1f}s: "
+          f"{report['rendersPerSecond']:.1f} renders/sec across {args.jobs} worker(s), "
+          f"{report['renderMsP50']:.0f} ms p50 / {report['renderMsP95']:.0f} ms p95 per render, "
+          f"{format_bytes(report['averageBytes'])} average; {len(failures)} failed")
+    if total:
+        print(f"Identical draws shared previews for {total - invalid - len(draws)} reading(s); "
+              f"{len(cached)} draw(s) were already cached")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Wrote {args.json}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""Single source of truth for the 78 tarot cards used by the Python tooling.
+
+Every tool that needs the card -> image mapping imports this module instead of
+carrying its own copy of the dicts. Lookups by id, by (suit, number), by file
+stem and by relative path are precomputed once at import time.
+
+The same data is published for the TypeScript side as a compact JSON artifact::
+
+    python scripts/tarot_registry.py            # regenerate src/data/tarot-card-registry.json
+    python scripts/tarot_registry.py --check    # exit non-zero if the artifact is stale
+"""
+
+import os
+import sys
+import json
+import argparse
+from collections import namedtuple
+
+# 图片URL映射 - 基于GitHub仓库的文件名
+BASE_URL = "https://raw.githubusercontent.com/ricarvy/tarot_source/main/result/"
+LOCAL_URL_PREFIX = "/tarot-cards/result/"
+ARTIFACT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src", "data", "tarot-card-registry.json"
+)
+ARTIFACT_VERSION = 1
+CARD_COUNT = 78
+
+SUITS = ("Wands", "Cups", "Swords", "Pentacles")
+
+# 大阿卡纳 - id: 0-21，牌号即 id
+MAJOR_FILES = [
+    "The_Fool_New_beginnings",
+    "The_Magician_Creativity",
+    "The_High_Priestess_Intuition",
+    "The_Empress_Abundance",
+    "The_Emperor_Authority",
+    "The_Hierophant_Tradition",
+    "The_Lovers_Love",
+    "The_Chariot_Victory",
+    "Strength_Strength",
+    "The_Hermit_Introspection",
+    "Wheel_of_Fortune_Destiny",
+    "Justice_Justice",
+    "The_Hanged_Man_Sacrifice",
+    "Death_Change",
+    "Temperance_Balance",
+    "The_Devil_Temptation",
+    "The_Tower_Sudden_change",
+    "The_Star_Hope",
+    "The_Moon_Illusion",
+    "The_Sun_Success",
+    "Judgement_Rebirth",
+    "The_World_Completion",
+]
+
+# 小阿卡纳 - 每个花色 14 张，牌号 1 (Ace) 到 14 (King)
+# 权杖 id: 22-35，圣杯 id: 36-49，宝剑 id: 50-63，星币 id: 64-77
+MINOR_FILES = {
+    "Wands": [
+        "Ace_of_Wands_Creativity",
+        "Two_of_Wands_Planning",
+        "Three_of_Wands_Expansion",
+        "Four_of_Wands_Stability",
+        "Five_of_Wands_Competition",
+        "Six_of_Wands_Victory",
+        "Seven_of_Wands_Challenge",
+        "Eight_of_Wands_Speed",
+        "Nine_of_Wands_Persistence",
+        "Ten_of_Wands_Burden",
+        "Page_of_Wands_Exploration",
+        "Knight_of_Wands_Adventure",
+        "Queen_of_Wands_Confidence",
+        "King_of_Wands_Leadership",
+    ],
+    "Cups": [
+        "Ace_of_Cups_New_feelings",
+        "Two_of_Cups_Partnership",
+        "Three_of_Cups_Friendship",
+        "Four_of_Cups_Apathy",
+        "Five_of_Cups_Disappointment",
+        "Six_of_Cups_Nostalgia",
+        "Seven_of_Cups_Fantasy",
+        "Eight_of_Cups_Abandonment",
+        "Nine_of_Cups_Satisfaction",
+        "Ten_of_Cups_Happiness",
+        "Page_of_Cups_Sensitivity",
+        "Knight_of_Cups_Romance",
+        "Queen_of_Cups_Intuition",
+        "King_of_Cups_Emotional_maturity",
+    ],
+    "Swords": [
+        "Ace_of_Swords_Clarity",
+        "Two_of_Swords_Indecision",
+        "Three_of_Swords_Heartbreak",
+        "Four_of_Swords_Rest",
+        "Five_of_Swords_Defeat",
+        "Six_of_Swords_Transition",
+        "Seven_of_Swords_Deception",
+        "Eight_of_Swords_Restriction",
+        "Nine_of_Swords_Anxiety",
+        "Ten_of_Swords_Ruin",
+        "Page_of_Swords_Curiosity",
+        "Knight_of_Swords_Impulsiveness",
+        "Queen_of_Swords_Independence",
+        "King_of_Swords_Logic",
+    ],
+    "Pentacles": [
+        "Ace_of_Pentacles_Material_opportunity",
+        "Two_of_Pentacles_Balance",
+        "Three_of_Pentacles_Teamwork",
+        "Four_of_Pentacles_Security",
+        "Five_of_Pentacles_Hardship",
+        "Six_of_Pentacles_Generosity",
+        "Seven_of_Pentacles_Assessment",
+        "Eight_of_Pentacles_Dedication",
+        "Nine_of_Pentacles_Independence",
+        "Ten_of_Pentacles_Wealth",
+        "Page_of_Pentacles_Learning",
+        "Knight_of_Pentacles_Responsibility",
+        "Queen_of_Pentacles_Abundance",
+        "King_of_Pentacles_Wealth",
+    ],
+}
+
+# suit is None for the Major Arcana; path is relative to result/ upstream and
+# public/tarot-cards/result locally.
+Card = namedtuple("Card", ["id", "suit", "number", "stem", "path"])
+
+
+def _build_cards():
+    cards = [Card(i, None, i, stem, f"Major/{stem}.png") for i, stem in enumerate(MAJOR_FILES)]
+    for suit in SUITS:
+        for number, stem in enumerate(MINOR_FILES[suit], start=1):
+            cards.append(Card(len(cards), suit, number, stem, f"Minor/{stem}.png"))
+    return tuple(cards)
+
+
+CARDS = _build_cards()
+CARDS_BY_ID = {card.id: card for card in CARDS}
+CARDS_BY_SUIT_NUMBER = {(card.suit, card.number): card for card in CARDS}
+CARDS_BY_STEM = {card.stem: card for card in CARDS}
+CARDS_BY_PATH = {card.path: card for card in CARDS}
+
+
+def get_card(card_id):
+    return CARDS_BY_ID.get(card_id)
+
+
+def find_by_suit(suit, number):
+    """Look a card up by suit and number; use ``None`` or ``"Major"`` for the Major Arcana."""
+    return CARDS_BY_SUIT_NUMBER.get((None if suit == "Major" else suit, number))
+
+
+def find_by_stem(stem):
+    """Look a card up by file stem, with or without the ``.png`` extension."""
+    return CARDS_BY_STEM.get(stem[:-4] if stem.endswith(".png") else stem)
+
+
+def find_by_path(path):
+    """Look a card up by ``Major/...png`` / ``Minor/...png`` path."""
+    return CARDS_BY_PATH.get(path)
+
+
+def image_url(card, base_url=BASE_URL):
+    return base_url + card.path
+
+
+def missing_ids():
+    return sorted(set(range(CARD_COUNT)) - set(CARDS_BY_ID))
+
+
+def to_artifact():
+    cards = [
+        {"id": card.id, "suit": card.suit, "number": card.number, "path": card.path}
+        for card in CARDS
+    ]
+    payload = {"version": ARTIFACT_VERSION, "baseUrl": BASE_URL, "localUrlPrefix": LOCAL_URL_PREFIX, "cards": cards}
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate the tarot card registry JSON artifact")
+    parser.add_argument("--check", action="store_true", help="exit non-zero if the artifact is out of date")
+    args = parser.parse_args()
+
+    artifact = to_artifact()
+    try:
+        with open(ARTIFACT_PATH, encoding="utf-8") as f:
+            current = f.read()
+    except OSError:
+        current = None
+
+    if args.check:
+        if current != artifact:
+            print(f"✗ {os.path.relpath(ARTIFACT_PATH)} is out of date, run: python scripts/tarot_registry.py")
+            sys.exit(1)
+        print(f"✓ {os.path.relpath(ARTIFACT_PATH)} is up to date")
+        return
+
+    if current != artifact:
+        with open(ARTIFACT_PATH, "w", encoding="utf-8") as f:
+            f.write(artifact)
+    print(f"✓ Wrote {len(CARDS)} cards to {os.path.relpath(ARTIFACT_PATH)} ({len(artifact.encode())} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,269 @@
+"""Shared access to the ricarvy/tarot_source card art repository.
+
+Holds the keep-alive connection pool used by the asset tools and a listing
+layer that resolves every card image with a single recursive git tree lookup
+instead of one contents API call per folder. The listing is cached on disk and
+revalidated with ``If-None-Match``, so an unchanged repository costs one
+conditional request (which GitHub does not count against the rate limit), and
+``offline=True`` serves the last known listing without touching the network.
+"""
+
+import os
+import ssl
+import json
+import time
+import contextlib
+import threading
+import http.client
+import urllib.parse
+
+# Create unverified context to bypass SSL errors
+ssl_context = ssl._create_unverified_context()
+
+# Both hosts can be overridden so the tools can run against a local stand-in
+# for the GitHub API / raw file host.
+API_URL = os.environ.get("TAROT_SOURCE_API", "https://api.github.com/repos/ricarvy/tarot_source")
+RAW_URL = os.environ.get("TAROT_SOURCE_RAW", "https://raw.githubusercontent.com/ricarvy/tarot_source")
+REF = os.environ.get("TAROT_SOURCE_REF", "main")
+ROOT = "result"
+FOLDERS = ["Major", "Minor"]
+CACHE_PATH = os.environ.get("TAROT_LISTING_CACHE", ".cache/tarot-source/listing.json")
+CACHE_VERSION = 1
+USER_AGENT = "mentob-asset-sync"
+MAX_REDIRECTS = 5
+
+
+def offline_default():
+    return os.environ.get("TAROT_SOURCE_OFFLINE", "").lower() in ("1", "true", "yes")
+
+
+def api_headers():
+    headers = {"Accept": "application/vnd.github+json"}
+    token = os.environ.get("GITHUB_TOKEN")
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+class ConnectionPool:
+    """Keep-alive HTTP(S) connections, one per (thread, host).
+
+    Each worker thread reuses its own connection to a host for every file it
+    downloads instead of opening a new TCP/TLS session per request.
+    """
+
+    def __init__(self, timeout=30):
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._all = []
+        self.opened = 0
+
+    def _connection(self, scheme, netloc):
+        conns = getattr(self._local, "conns", None)
+        if conns is None:
+            conns = self._local.conns = {}
+        key = (scheme, netloc)
+        conn = conns.get(key)
+        if conn is None:
+            if scheme == "https":
+                conn = http.client.HTTPSConnection(netloc, timeout=self.timeout, context=ssl_context)
+            else:
+                conn = http.client.HTTPConnection(netloc, timeout=self.timeout)
+            conns[key] = conn
+            with self._lock:
+                self._all.append(conn)
+                self.opened += 1
+        return conn
+
+    def _drop(self, scheme, netloc):
+        conn = self._local.conns.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    @contextlib.contextmanager
+    def stream(self, url, headers=None):
+        """GET ``url`` and yield the unread response for chunked reads.
+
+        Redirects are followed; a connection the server has already closed is
+        reopened once before giving up. The connection goes back to the pool
+        only if the body was read to the end; otherwise it is discarded.
+        """
+        for _ in range(MAX_REDIRECTS):
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path or "/"
+            if parts.query:
+                path += "?" + parts.query
+            req_headers = {"User-Agent": USER_AGENT, "Accept-Encoding": "identity"}
+            req_headers.update(headers or {})
+
+            for attempt in range(2):
+                conn = self._connection(parts.scheme, parts.netloc)
+                try:
+                    conn.request("GET", path, headers=req_headers)
+                    response = conn.getresponse()
+                    break
+                except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                    self._drop(parts.scheme, parts.netloc)
+                    if attempt:
+                        raise
+                except Exception:
+                    self._drop(parts.scheme, parts.netloc)
+                    raise
+
+            if response.status in (301, 302, 303, 307, 308) and response.getheader("Location"):
+                response.read()
+                if response.will_close:
+                    self._drop(parts.scheme, parts.netloc)
+                url = urllib.parse.urljoin(url, response.getheader("Location"))
+                continue
+
+            try:
+                yield response
+            except BaseException:
+                self._drop(parts.scheme, parts.netloc)
+                raise
+            if response.will_close or not response.isclosed():
+                self._drop(parts.scheme, parts.netloc)
+            return
+        raise RuntimeError(f"Too many redirects for {url}")
+
+    def request(self, url, headers=None):
+        """GET ``url`` and return ``(status, headers, body)``."""
+        with self.stream(url, headers) as response:
+            return response.status, response.headers, response.read()
+
+    def close(self):
+        with self._lock:
+            for conn in self._all:
+                conn.close()
+            self._all = []
+
+
+def fetch_json(pool, url):
+    try:
+        status, _, body = pool.request(url, api_headers())
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+        return json.loads(body.decode())
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        return None
+
+
+def _file_item(path, sha, size, download_url=None):
+    return {
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "type": "file",
+        "sha": sha,
+        "size": size,
+        "download_url": download_url or f"{RAW_URL}/{REF}/{path}",
+    }
+
+
+def _tree_entries(tree):
+    """Map ``Major/x.png``-style paths to contents-API-shaped items."""
+    prefix = ROOT + "/"
+    entries = {}
+    for node in tree.get("tree", []):
+        path = node.get("path", "")
+        if node.get("type") == "blob" and path.startswith(prefix) and path.endswith(".png"):
+            entries[path[len(prefix):]] = _file_item(path, node.get("sha"), node.get("size"))
+    return entries
+
+
+def _contents_entries(pool):
+    """Per-folder contents API fallback for trees GitHub reports as truncated."""
+    entries = {}
+    for folder in FOLDERS:
+        files = fetch_json(pool, f"{API_URL}/contents/{ROOT}/{folder}?ref={REF}")
+        if not isinstance(files, list):
+            return None
+        for item in files:
+            if item.get("type") == "file" and item["name"].endswith(".png"):
+                entries[f"{folder}/{item['name']}"] = _file_item(
+                    item["path"], item.get("sha"), item.get("size"), item.get("download_url")
+                )
+    return entries
+
+
+def load_cache(path=CACHE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cache.get("version") != CACHE_VERSION or cache.get("source") != f"{API_URL}@{REF}":
+        return None
+    return cache
+
+
+def save_cache(entries, etag, path=CACHE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    cache = {
+        "version": CACHE_VERSION,
+        "source": f"{API_URL}@{REF}",
+        "etag": etag,
+        "fetchedAt": int(time.time()),
+        "entries": dict(sorted(entries.items())),
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, path)
+
+
+def fetch_listing(pool=None, offline=None, cache_path=CACHE_PATH):
+    """Return ``{"Major/x.png": item, ...}`` for every card image, or None.
+
+    Items look like contents API entries (name, path, sha, size, download_url).
+    The cached listing is revalidated with its ETag; a 304 reuses it as-is.
+    In offline mode, or when GitHub can't be reached, the cached listing is
+    served instead; None means there is neither a fresh nor a cached listing.
+    """
+    if offline is None:
+        offline = offline_default()
+    cache = load_cache(cache_path)
+
+    if offline:
+        if cache is None:
+            print(f"Offline mode: no cached listing at {cache_path}")
+            return None
+        print(f"Offline mode: using cached listing from {time.ctime(cache['fetchedAt'])}")
+        return cache["entries"]
+
+    own_pool = pool is None
+    pool = pool or ConnectionPool()
+    url = f"{API_URL}/git/trees/{REF}?recursive=1"
+    headers = api_headers()
+    if cache and cache.get("etag"):
+        headers["If-None-Match"] = cache["etag"]
+
+    try:
+        status, response_headers, body = pool.request(url, headers)
+        if status == 304 and cache:
+            print("Listing unchanged (304), using cache")
+            return cache["entries"]
+        if status != 200:
+            raise RuntimeError(f"HTTP {status}")
+
+        tree = json.loads(body.decode())
+        entries = None if tree.get("truncated") else _tree_entries(tree)
+        if entries is None:
+            print("Tree listing truncated, falling back to per-folder contents API")
+            entries = _contents_entries(pool)
+            if entries is None:
+                raise RuntimeError("contents API listing failed")
+        save_cache(entries, response_headers.get("ETag"), cache_path)
+        return entries
+    except Exception as e:
+        print(f"Error fetching {url}: {e}")
+        if cache is None:
+            return None
+        print(f"Using cached listing from {time.ctime(cache['fetchedAt'])}")
+        return cache["entries"]
+    finally:
+        if own_pool:
+            pool.close()
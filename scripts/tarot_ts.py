@@ -0,0 +1,78 @@
+"""Read spread and card data straight out of the TypeScript sources.
+
+The benchmark and profiling tools need the same spreads and card meanings the
+app ships, without a Node toolchain. Both files are plain object literals with
+a stable layout, so a couple of regular expressions are enough; each file is
+parsed once per process.
+"""
+
+import os
+import re
+import functools
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TAROT_TS = os.path.join(REPO_ROOT, "src", "lib", "tarot.ts")
+CARDS_TS = os.path.join(REPO_ROOT, "src", "lib", "tarot-cards.ts")
+
+SPREAD_RE = re.compile(
+    r"\n  \{\n    id: '([^']+)',\n    name: '([^']*)',\n    description: '([^']*)',(.*?)\n  \}",
+    re.DOTALL,
+)
+POSITION_RE = re.compile(r"id: '([^']+)',\s*name: '([^']*)',\s*description: '([^']*)'")
+CATEGORY_RE = re.compile(r"category: '([^']+)'")
+CARD_RE = re.compile(r"\{\s*id:\s*(\d+),(.*?)\n  \}", re.DOTALL)
+STRING_FIELD_RE = re.compile(r"\b(name|nameEn|nameJa|meaning|reversedMeaning|imageUrl|suit):\s*'([^']*)'")
+
+
+@functools.lru_cache(maxsize=None)
+def load_spreads(path=TAROT_TS):
+    """Return the ``spreads`` array as a list of dicts shaped like the TS ``Spread``."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    start = content.index("export const spreads")
+    end = content.index("\n];", start)
+
+    spreads = []
+    for match in SPREAD_RE.finditer(content[start:end]):
+        spread_id, name, description, body = match.groups()
+        category = CATEGORY_RE.search(body)
+        spreads.append({
+            "id": spread_id,
+            "name": name,
+            "description": description,
+            "category": category.group(1) if category else None,
+            "positions": [
+                {"id": pid, "name": pname, "description": pdesc}
+                for pid, pname, pdesc in POSITION_RE.findall(body)
+            ],
+        })
+    return spreads
+
+
+@functools.lru_cache(maxsize=None)
+def load_cards(path=CARDS_TS):
+    """Return every card in ``tarot-cards.ts`` as a dict, sorted by id."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+
+    cards = []
+    for match in CARD_RE.finditer(content):
+        card = {"id": int(match.group(1))}
+        card.update(STRING_FIELD_RE.findall(match.group(2)))
+        cards.append(card)
+    return sorted(cards, key=lambda card: card["id"])
+
+
+def request_card(card, is_reversed=False):
+    """Shape a card the way the client sends it to ``/api/tarot/interpret``."""
+    return {
+        "id": card["id"],
+        "name": card.get("name", ""),
+        "nameEn": card.get("nameEn", ""),
+        "nameJa": card.get("nameJa", ""),
+        "meaning": card.get("meaning", ""),
+        "reversedMeaning": card.get("reversedMeaning", ""),
+        "image": card.get("imageUrl", ""),
+        "imageUrl": card.get("imageUrl", ""),
+        "isReversed": is_reversed,
+    }
@@ -0,0 +1,109 @@
+"""Turn route timing traces into per-stage latency tables.
+
+The interpret route records how long each stage of a request takes (body
+parse, quota check, prompt build, LLM first chunk, streaming, DB write).
+Start the app with ``TRACE_LOG_FILE`` set to append them as JSONL, put it
+under load, then summarise::
+
+    TRACE_LOG_FILE=/tmp/traces.jsonl pnpm dev
+    python scripts/bench_interpret.py -n 50 -c 8
+    python scripts/trace_report.py /tmp/traces.jsonl
+    python scripts/trace_report.py /tmp/traces.jsonl --by spread
+
+Stages are listed in the order the route completes them; ``share`` is each
+stage's part of the summed mean time, which shows at a glance where requests
+spend it.
+"""
+
+import sys
+import json
+import argparse
+from collections import defaultdict
+
+from bench_stats import summarize
+
+
+def read_traces(paths):
+    """Yield trace records from JSONL files (``-`` for stdin), skipping bad lines."""
+    skipped = 0
+    for path in paths:
+        f = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        with f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    skipped += 1
+    if skipped:
+        print(f"Skipped {skipped} malformed line(s)", file=sys.stderr)
+
+
+def aggregate(traces):
+    """Return ``(stage_order, {stage: [ms]}, total_ms, errors)`` for a group of traces."""
+    order = []
+    stages = defaultdict(list)
+    totals = []
+    errors = defaultdict(int)
+    for trace in traces:
+        for stage, ms in trace.get("stages", {}).items():
+            if stage not in stages:
+                order.append(stage)
+            stages[stage].append(ms)
+        totals.append(trace.get("totalMs", 0))
+        if trace.get("status") == "error":
+            errors[trace.get("error") or "unknown"] += 1
+    return order, stages, totals, errors
+
+
+def print_group(title, traces):
+    order, stages, totals, errors = aggregate(traces)
+    summaries = {stage: summarize(stages[stage]) for stage in order}
+    summed_mean = sum(summary["mean"] for summary in summaries.values()) or 1
+
+    print(f"{title}: {len(traces)} requests, {sum(errors.values())} errors")
+    header = f"  {'stage':<18}{'count':>7}{'mean':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}{'share':>8}"
+    print(header)
+    print("  " + "-" * (len(header) - 2))
+    for stage in order:
+        s = summaries[stage]
+        print(f"  {stage:<18}{s['count']:>7}{s['mean']:>9.1f}{s['p50']:>9.1f}{s['p95']:>9.1f}"
+              f"{s['p99']:>9.1f}{s['max']:>9.1f}{s['mean'] / summed_mean:>8.0%}")
+    s = summarize(totals)
+    print(f"  {'total':<18}{s['count']:>7}{s['mean']:>9.1f}{s['p50']:>9.1f}{s['p95']:>9.1f}"
+          f"{s['p99']:>9.1f}{s['max']:>9.1f}")
+    for error, count in sorted(errors.items(), key=lambda item: -item[1])[:5]:
+        print(f"  ! {count} x {error}")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarise route timing traces (JSONL)")
+    parser.add_argument("files", nargs="+", help="trace JSONL files, or - for stdin")
+    parser.add_argument("--route", help="only include this route, e.g. /api/tarot/interpret")
+    parser.add_argument("--by", help="group by a meta field, e.g. spread, tone or cards")
+    parser.add_argument("--ok-only", action="store_true", help="ignore failed requests")
+    args = parser.parse_args()
+
+    groups = defaultdict(list)
+    for trace in read_traces(args.files):
+        if args.route and trace.get("route") != args.route:
+            continue
+        if args.ok_only and trace.get("status") != "ok":
+            continue
+        key = trace.get("route", "?")
+        if args.by:
+            key += f" [{args.by}={trace.get('meta', {}).get(args.by, '-')}]"
+        groups[key].append(trace)
+
+    if not groups:
+        raise SystemExit("No traces found")
+    print("(all times in ms)\n")
+    for key in sorted(groups):
+        print_group(key, groups[key])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+"""Verify the tarot card art on disk before it is baked into an image.
+
+Every file under public/tarot-cards/result is memory-mapped and checked in
+parallel, then cross-checked against the card data. The format comes from the
+file's magic bytes, not its extension.
+
+* PNG: signature, IHDR, every chunk's CRC and the IEND trailer. Unless
+  ``--fast`` is given, the IDAT stream must also inflate to exactly the bytes
+  the header promises.
+* JPEG: SOI, segment lengths, the SOF frame header, the entropy-coded scans
+  and the EOI trailer. Unless ``--fast`` is given, Pillow (when installed)
+  also decodes the image fully.
+
+::
+
+    python scripts/verify_card_assets.py           # exit 1 on any problem
+    python scripts/verify_card_assets.py --json report.json
+
+Problems reported, each with the card id and path:
+
+* missing    - an ``imageUrl`` in tarot-cards.ts (or a registry path) has no file
+* corrupt    - the file does not parse or decode as an image
+* mismatched - tarot-cards.ts and tarot_registry.py disagree on a card's image,
+               the file only exists with different letter case (breaks on Linux),
+               two cards share identical bytes, or the aspect ratio is off from
+               the rest of the deck
+* orphaned   - a file no card references
+
+Two things are warnings only:
+
+* A file whose content does not match its extension. The current card art is
+  JPEG saved as ``.png``. This fails only with ``--strict-format``.
+* An image of the right shape but a different width from the deck.
+The structural checks are stdlib only, so the gate runs anywhere ``deploy.sh``
+does.
+"""
+
+import io
+import os
+import sys
+import json
+import mmap
+import time
+import zlib
+import struct
+import hashlib
+import argparse
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from tarot_ts import REPO_ROOT, load_cards
+from tarot_registry import CARDS, LOCAL_URL_PREFIX
+from fingerprint_assets import source_url
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+PUBLIC_ROOT = os.environ.get("TAROT_PUBLIC_ROOT", os.path.join(REPO_ROOT, "public"))
+RESULT_DIR = os.path.join(PUBLIC_ROOT, LOCAL_URL_PREFIX.strip("/"))
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+JPEG_SIGNATURE = b"\xff\xd8\xff"
+EXTENSIONS = {"png": (".png",), "jpeg": (".jpg", ".jpeg")}
+# Frame headers carrying the image size: SOF0-3, 5-7, 9-11, 13-15 (C4, C8, CC are DHT/JPG/DAC).
+JPEG_SOF = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+# Inside entropy-coded data only stuffed bytes (FF00) and restart markers (FFD0-FFD7) may appear.
+JPEG_SCAN_END = re.compile(rb"\xff[^\x00\xd0-\xd7]")
+# Bits per pixel for each IHDR colour type, per bit of bit depth.
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}
+# Cards may differ slightly in height; flag anything further than this from the median aspect ratio.
+ASPECT_TOLERANCE = 0.05
+
+
+class CorruptImage(Exception):
+    pass
+
+
+def expected_raw_size(width, height, bit_depth, color_type, interlace):
+    """Bytes the inflated IDAT stream must contain (filter byte + scanline per row, per pass)."""
+    bits = CHANNELS[color_type] * bit_depth
+    if not interlace:
+        return height * (1 + (width * bits + 7) // 8)
+    total = 0
+    # Adam7 passes: (x start, y start, x step, y step)
+    for x0, y0, dx, dy in ((0, 0, 8, 8), (4, 0, 8, 8), (0, 4, 4, 8), (2, 0, 4, 4),
+                           (0, 2, 2, 4), (1, 0, 2, 2), (0, 1, 1, 2)):
+        pass_width = (width - x0 + dx - 1) // dx
+        pass_height = (height - y0 + dy - 1) // dy
+        if pass_width and pass_height:
+            total += pass_height * (1 + (pass_width * bits + 7) // 8)
+    return total
+
+
+def check_png(data, inflate=True):
+    """Validate PNG structure in ``data``; returns ``(width, height)`` or raises ``CorruptImage``."""
+    if data[:8] != PNG_SIGNATURE:
+        raise CorruptImage("bad PNG signature")
+    view = memoryview(data)
+    offset, header, seen_iend = 8, None, False
+    inflater = zlib.decompressobj() if inflate else None
+    inflated = 0
+    while offset + 12 <= len(data):
+        length, kind = struct.unpack_from(">I4s", data, offset)
+        end = offset + 12 + length
+        if end > len(data):
+            raise CorruptImage(f"truncated {kind.decode('latin-1')} chunk at byte {offset}")
+        (crc,) = struct.unpack_from(">I", data, end - 4)
+        if zlib.crc32(view[offset + 4:end - 4]) != crc:
+            raise CorruptImage(f"CRC mismatch in {kind.decode('latin-1')} chunk at byte {offset}")
+        body = view[offset + 8:end - 4]
+        if header is None:
+            if kind != b"IHDR" or length != 13:
+                raise CorruptImage("first chunk is not IHDR")
+            header = struct.unpack(">IIBBBBB", body)
+            width, height, bit_depth, color_type, _, _, interlace = header
+            if not width or not height or color_type not in CHANNELS:
+                raise CorruptImage(f"invalid IHDR {header}")
+        elif kind == b"IDAT" and inflater:
+            try:
+                # Count the output in bounded slices instead of materialising whole images.
+                chunk = inflater.decompress(body, 1 << 20)
+                inflated += len(chunk)
+                while inflater.unconsumed_tail:
+                    chunk = inflater.decompress(inflater.unconsumed_tail, 1 << 20)
+                    inflated += len(chunk)
+            except zlib.error as e:
+                raise CorruptImage(f"IDAT does not inflate: {e}")
+        elif kind == b"IEND":
+            seen_iend = True
+            offset = end
+            break
+        offset = end
+    if header is None:
+        raise CorruptImage("no IHDR chunk")
+    if not seen_iend:
+        raise CorruptImage("missing IEND (file truncated?)")
+    if offset != len(data):
+        raise CorruptImage(f"{len(data) - offset} trailing bytes after IEND")
+    width, height, bit_depth, color_type, _, _, interlace = header
+    if inflater:
+        inflated += len(inflater.flush())
+        expected = expected_raw_size(width, height, bit_depth, color_type, interlace)
+        if not inflater.eof or inflated != expected:
+            raise CorruptImage(f"image data inflates to {inflated} bytes, header implies {expected}")
+    return width, height
+
+
+def check_jpeg(data, decode=True):
+    """Validate JPEG structure in ``data``; returns ``(width, height)`` or raises ``CorruptImage``."""
+    offset, size, scans = 2, None, 0
+    while True:
+        if offset + 2 > len(data):
+            raise CorruptImage("missing EOI (file truncated?)")
+        if data[offset] != 0xFF:
+            raise CorruptImage(f"expected a marker at byte {offset}")
+        marker = data[offset + 1]
+        if marker == 0xFF:  # fill byte
+            offset += 1
+            continue
+        if marker == 0xD9:
+            offset += 2
+            break
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            offset += 2
+            continue
+        if offset + 4 > len(data):
+            raise CorruptImage(f"truncated segment FF{marker:02X} at byte {offset}")
+        (length,) = struct.unpack_from(">H", data, offset + 2)
+        end = offset + 2 + length
+        if length < 2 or end > len(data):
+            raise CorruptImage(f"segment FF{marker:02X} at byte {offset} overruns the file")
+        if marker in JPEG_SOF:
+            if length < 8:
+                raise CorruptImage("short SOF header")
+            height, width = struct.unpack_from(">HH", data, offset + 5)
+            if not width or not height:
+                raise CorruptImage(f"invalid frame size {width}x{height}")
+            size = (width, height)
+        offset = end
+        if marker == 0xDA:
+            if size is None:
+                raise CorruptImage("scan before frame header")
+            match = JPEG_SCAN_END.search(data, offset)
+            if not match:
+                raise CorruptImage("scan data runs to end of file (no EOI)")
+            if match.start() == offset:
+                raise CorruptImage(f"empty scan at byte {offset}")
+            scans += 1
+            offset = match.start()
+    if size is None or not scans:
+        raise CorruptImage("no frame header or scan data")
+    if offset != len(data):
+        raise CorruptImage(f"{len(data) - offset} trailing bytes after EOI")
+    if decode and Image is not None:
+        if hasattr(data, "seek"):
+            data.seek(0)
+        try:
+            with Image.open(data if hasattr(data, "seek") else io.BytesIO(data)) as image:
+                image.load()
+        except Exception as e:
+            raise CorruptImage(f"does not decode: {e}")
+    return size
+
+
+def check_image(data, decode=True):
+    """Return ``(format, width, height)`` for a PNG or JPEG in ``data``."""
+    if data[:8] == PNG_SIGNATURE:
+        return ("png",) + check_png(data, decode)
+    if data[:3] == JPEG_SIGNATURE:
+        return ("jpeg",) + check_jpeg(data, decode)
+    raise CorruptImage(f"not a PNG or JPEG (starts with {bytes(data[:4]).hex()})")
+
+
+def inspect(path, decode):
+    """Hash and check one file through a read-only memory map; runs on the thread pool."""
+    result = {"size": os.path.getsize(path)}
+    if not result["size"]:
+        result["error"] = "empty file"
+        return result
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            result["sha256"] = hashlib.sha256(data).hexdigest()
+            # Handle the error inside the with block: once the except clause ends the traceback,
+            # and with it every memoryview into the map, is released before the map closes.
+            try:
+                result["format"], result["width"], result["height"] = check_image(data, decode)
+            except CorruptImage as e:
+                result["error"] = str(e)
+    except OSError as e:
+        result["error"] = str(e)
+    return result
+
+
+def list_files():
+    files = []
+    for root, _, names in os.walk(RESULT_DIR):
+        for name in names:
+            files.append(os.path.relpath(os.path.join(root, name), RESULT_DIR).replace(os.sep, "/"))
+    return sorted(files)
+
+
+def referenced_paths():
+    """``{path: card id}`` from tarot-cards.ts, and the problems found reading it."""
+    problems, references = [], {}
+    registry = {card.id: card.path for card in CARDS}
+    for card in load_cards():
+        # Fingerprinted URLs (/assets/...<hash>.png) are checked against their source file.
+        url = source_url(card.get("imageUrl") or "")
+        if not url:
+            problems.append(("missing", card["id"], None, "no imageUrl in tarot-cards.ts"))
+            continue
+        if not url.startswith(LOCAL_URL_PREFIX):
+            problems.append(("mismatched", card["id"], url, f"imageUrl is outside {LOCAL_URL_PREFIX}"))
+            continue
+        path = url[len(LOCAL_URL_PREFIX):]
+        references[path] = card["id"]
+        expected = registry.get(card["id"])
+        if expected != path:
+            problems.append(("mismatched", card["id"], path, f"tarot_registry.py has {expected}"))
+    for card_id, path in registry.items():
+        if path not in references:
+            references.setdefault(path, card_id)
+    return references, problems
+
+
+def verify(args):
+    started = time.perf_counter()
+    references, problems = referenced_paths()
+    files = list_files()
+    with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as pool:
+        results = dict(zip(files, pool.map(
+            lambda rel: inspect(os.path.join(RESULT_DIR, rel), not args.fast), files)))
+
+    by_lower = {rel.lower(): rel for rel in files}
+    for path, card_id in sorted(references.items(), key=lambda item: item[1]):
+        if path in results:
+            continue
+        actual = by_lower.get(path.lower())
+        if actual:
+            problems.append(("mismatched", card_id, path, f"only {actual} exists (case differs)"))
+        else:
+            problems.append(("missing", card_id, path, "file not found"))
+
+    matched_case = {by_lower[path.lower()] for path in references if path.lower() in by_lower}
+    for rel in files:
+        if rel not in references and rel not in matched_case:
+            problems.append(("orphaned", None, rel, "not referenced by any card"))
+
+    good = {rel: r for rel, r in results.items() if "error" not in r}
+    for rel, r in results.items():
+        if "error" in r:
+            problems.append(("corrupt", references.get(rel), rel, r["error"]))
+
+    by_hash = defaultdict(list)
+    for rel, r in good.items():
+        by_hash[r["sha256"]].append(rel)
+    for paths in by_hash.values():
+        if len(paths) > 1:
+            for rel in paths:
+                problems.append(("mismatched", references.get(rel), rel,
+                                 "identical bytes to " + ", ".join(p for p in paths if p != rel)))
+
+    warnings = defaultdict(list)
+    if good:
+        widths = defaultdict(int)
+        for r in good.values():
+            widths[r["width"]] += 1
+        deck_width = max(widths, key=widths.get)
+        aspects = sorted(r["height"] / r["width"] for r in good.values())
+        median = aspects[len(aspects) // 2]
+        for rel, r in good.items():
+            aspect = r["height"] / r["width"]
+            if abs(aspect - median) > median * args.aspect_tolerance:
+                problems.append(("mismatched", references.get(rel), rel,
+                                 f"{r['width']}x{r['height']} (aspect {aspect:.3f}), "
+                                 f"deck median aspect is {median:.3f}"))
+            elif r["width"] != deck_width:
+                # Same shape at another resolution still renders correctly, just costs more bytes.
+                warnings[f"a width other than the deck's {deck_width}px"].append(rel)
+
+    # Content that does not match its extension is served with the wrong Content-Type.
+    for rel, r in good.items():
+        if not rel.lower().endswith(EXTENSIONS[r["format"]]):
+            ext = os.path.splitext(rel)[1] or "(none)"
+            if args.strict_format:
+                problems.append(("mismatched", references.get(rel), rel, f"{r['format'].upper()} content with {ext} extension"))
+            else:
+                warnings[f"{r['format'].upper()} content with {ext} extension"].append(rel)
+
+    elapsed = time.perf_counter() - started
+    return {
+        "files": len(files),
+        "bytes": sum(r["size"] for r in results.values()),
+        "elapsed": elapsed,
+        "decoded": not args.fast,
+        "formats": {fmt: sum(1 for r in good.values() if r["format"] == fmt) for fmt in EXTENSIONS},
+        "warnings": {detail: sorted(paths) for detail, paths in warnings.items()},
+        "problems": [
+            {"kind": kind, "card": card_id, "path": path, "detail": detail}
+            for kind, card_id, path, detail in sorted(
+                problems, key=lambda p: (p[0], p[1] if p[1] is not None else -1, p[2] or ""))
+        ],
+        "files_detail": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Verify tarot card images on disk against the card data")
+    parser.add_argument("-j", "--jobs", type=int, default=min(32, (os.cpu_count() or 1) * 4),
+                        help="worker threads (default: 4 per CPU)")
+    parser.add_argument("--fast", action="store_true",
+                        help="check structure and CRCs only; skip inflating PNG data and decoding JPEGs")
+    parser.add_argument("--strict-format", action="store_true",
+                        help="fail when a file's content does not match its extension")
+    parser.add_argument("--aspect-tolerance", type=float, default=ASPECT_TOLERANCE,
+                        help=f"allowed relative deviation from the median aspect ratio (default: {ASPECT_TOLERANCE})")
+    parser.add_argument("--json", help="write the full report, including per-file hashes, to this file")
+    args = parser.parse_args()
+
+    if not os.path.isdir(RESULT_DIR):
+        raise SystemExit(f"{RESULT_DIR} does not exist")
+    report = verify(args)
+    for problem in report["problems"]:
+        card = f"card {problem['card']:>2}" if problem["card"] is not None else "       "
+        print(f"{problem['kind'].upper():<11} {card}  {problem['path'] or '-'}: {problem['detail']}")
+
+    for detail, paths in report["warnings"].items():
+        print(f"WARNING     {len(paths)} file(s) have {detail}: "
+              + ", ".join(paths[:4]) + (f" (+{len(paths) - 4} more)" if len(paths) > 4 else ""))
+
+    counts = defaultdict(int)
+    for problem in report["problems"]:
+        counts[problem["kind"]] += 1
+    summary = ", ".join(f"{counts[kind]} {kind}" for kind in ("missing", "corrupt", "mismatched", "orphaned"))
+    formats = ", ".join(f"{n} {fmt.upper()}" for fmt, n in report["formats"].items() if n)
+    if not report["decoded"]:
+        depth = "structure only"
+    elif report["formats"]["jpeg"] and Image is None:
+        depth = "full PNG decode; JPEG structure only, install Pillow to decode"
+    else:
+        depth = "full decode"
+    print(f"Checked {report['files']} files ({formats}, {report['bytes'] / 1024 / 1024:.1f} MiB, {depth}) "
+          f"in {report['elapsed'] * 1000:.0f} ms: {summary}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    sys.exit(1 if report["problems"] else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@ import Link from 'next/link';
 import { Card, CardContent } from '@/components/ui/card';
 import { Button } from '@/components/ui/button';
 import { BookOpen, Sparkles, Star, Crown, RefreshCw, ArrowLeft, Heart, Lightbulb } from 'lucide-react';
-import { getAnswers } from '@/data/answers';
+import { drawAnswer } from '@/lib/answer-book';
 import { useI18n } from '@/lib/i18n';
 import { useAnalytics } from '@/components/GA4Tracker';
 
@@ -57,12 +57,20 @@ export default function AnswerBookPage() {
     // Track click immediately or wait? Sheet requires 'answer' param.
     // So we track after generation or generate early.
     
-    // 模拟神秘的延迟，让用户感受到神圣的氛围
-    await new Promise(resolve => setTimeout(resolve, 1500));
-
-    // 从答案池中随机获取一个答案
-    const answers = getAnswers(language);
-    const finalAnswer = answers[Math.floor(Math.random() * answers.length)];
+    // 模拟神秘的延迟，让用户感受到神圣的氛围；抽取答案与延迟同时进行
+    let finalAnswer: string;
+    try {
+      [{ answer: finalAnswer }] = await Promise.all([
+        drawAnswer(language),
+        new Promise(resolve => setTimeout(resolve, 1500)),
+      ]);
+    } catch (error) {
+      // 接口与本地分片都不可用（如离线）时回到提问页，允许重试
+      console.error('[Answer Book] Failed to draw an answer:', error);
+      setStage('prompt');
+      setIsAnimating(false);
+      return;
+    }
     setAnswer(finalAnswer);
     setStage('answer');
     setIsAnimating(false);
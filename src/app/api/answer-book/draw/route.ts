@@ -0,0 +1,42 @@
+import { NextRequest, NextResponse } from 'next/server';
+import { randomInt } from 'node:crypto';
+import zh from '@/data/answer-shards/zh.json';
+import en from '@/data/answer-shards/en.json';
+import ja from '@/data/answer-shards/ja.json';
+import { normalizeAnswerLocale, type AnswerLocale, type DrawnAnswer } from '@/lib/answer-book';
+import {
+  withErrorHandler,
+  createSuccessResponse,
+  createErrorResponse,
+  ERROR_CODES,
+} from '@/lib/api-response';
+
+const POOLS: Record<AnswerLocale, string[]> = { zh, en, ja };
+
+/**
+ * GET /api/answer-book/draw?lang=zh[&index=12]
+ * 从答案之书中抽取一个答案；指定 index 时返回该位置的答案（用于分享、回放）
+ */
+export async function GET(request: NextRequest) {
+  return withErrorHandler(() => {
+    const lang = normalizeAnswerLocale(request.nextUrl.searchParams.get('lang'));
+    const pool = POOLS[lang];
+    const indexParam = request.nextUrl.searchParams.get('index');
+
+    let index: number;
+    if (indexParam === null) {
+      index = randomInt(pool.length);
+    } else {
+      index = Number(indexParam);
+      if (!Number.isInteger(index) || index < 0 || index >= pool.length) {
+        return NextResponse.json(
+          createErrorResponse(ERROR_CODES.INVALID_REQUEST, `index 必须是 0 到 ${pool.length - 1} 之间的整数`),
+          { status: 400 }
+        );
+      }
+    }
+
+    const data: DrawnAnswer = { lang, index, total: pool.length, answer: pool[index] };
+    return NextResponse.json(createSuccessResponse(data));
+  });
+}
@@ -0,0 +1,33 @@
+import { NextRequest } from 'next/server';
+import { responseCacheConfig } from '@/config/cache';
+import { interpretCache, suggestCache } from '@/lib/response-cache';
+import {
+  withErrorHandler,
+  createSuccessResponse,
+} from '@/lib/api-response';
+
+/**
+ * 查看解读结果缓存的命中统计
+ * GET /api/debug/response-cache
+ */
+export async function GET(_request: NextRequest) {
+  return withErrorHandler(async () => {
+    return Response.json(createSuccessResponse({
+      enabled: responseCacheConfig.enabled,
+      interpret: interpretCache.stats(),
+      suggest: suggestCache.stats(),
+    }));
+  });
+}
+
+/**
+ * 清空缓存（统计保留）
+ * DELETE /api/debug/response-cache
+ */
+export async function DELETE(_request: NextRequest) {
+  return withErrorHandler(async () => {
+    interpretCache.clear();
+    suggestCache.clear();
+    return Response.json(createSuccessResponse({ cleared: true }));
+  });
+}
@@ -0,0 +1,60 @@
+import { NextRequest } from 'next/server';
+import { tracingConfig } from '@/config/tracing';
+import { recentTraces, type TraceRecord } from '@/lib/trace';
+import {
+  withErrorHandler,
+  createSuccessResponse,
+} from '@/lib/api-response';
+
+function percentile(sorted: number[], pct: number): number {
+  if (sorted.length === 0) return 0;
+  const rank = Math.ceil((pct / 100) * sorted.length);
+  return sorted[Math.min(sorted.length, Math.max(rank, 1)) - 1];
+}
+
+function summarize(traces: TraceRecord[]) {
+  const byStage: Record<string, number[]> = { total: [] };
+  for (const trace of traces) {
+    for (const [stage, ms] of Object.entries(trace.stages)) {
+      (byStage[stage] ??= []).push(ms);
+    }
+    byStage.total.push(trace.totalMs);
+  }
+  return Object.fromEntries(
+    Object.entries(byStage).map(([stage, values]) => {
+      const sorted = values.sort((a, b) => a - b);
+      return [stage, {
+        count: sorted.length,
+        p50: percentile(sorted, 50),
+        p95: percentile(sorted, 95),
+        p99: percentile(sorted, 99),
+        max: sorted[sorted.length - 1] ?? 0,
+      }];
+    })
+  );
+}
+
+/**
+ * 查看最近请求的阶段耗时
+ * GET /api/debug/traces?route=/api/tarot/interpret&limit=100
+ */
+export async function GET(request: NextRequest) {
+  return withErrorHandler(async () => {
+    const { searchParams } = new URL(request.url);
+    const route = searchParams.get('route');
+    const limit = Number(searchParams.get('limit')) || tracingConfig.bufferSize;
+
+    const traces = recentTraces()
+      .filter((trace) => !route || trace.route === route)
+      .slice(-limit);
+
+    return Response.json(createSuccessResponse({
+      enabled: tracingConfig.enabled,
+      bufferSize: tracingConfig.bufferSize,
+      count: traces.length,
+      errors: traces.filter((trace) => trace.status === 'error').length,
+      stages: summarize(traces),
+      traces,
+    }));
+  });
+}
@@ -1,8 +1,10 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { proxyConfig } from '@/config/proxy';
+import { forwardRequest } from '@/lib/backend-proxy';
 
 /**
  * 后端 API 代理
- * 绕过 CORS 限制，将前端请求转发到后端服务
+ * 绕过 CORS 限制，将前端请求转发到后端服务（流式透传，复用 keep-alive 连接，见 src/lib/backend-proxy.ts）
  */
 
 // 优先使用服务端内部通信 URL，但仅当存在时。默认仍使用 NEXT_PUBLIC_BACKEND_URL (通常是域名)
@@ -42,76 +44,30 @@ async function proxyRequest(
   params: { path: string[] },
   method: string
 ) {
-  try {
-    // 构建后端 URL
-    const path = params.path.join('/');
-    const queryString = request.nextUrl.search;
-    const backendUrl = `${BACKEND_URL}/${path}${queryString}`;
-
-    console.log('[Backend Proxy]', {
-      method,
-      path,
-      queryString,
-      backendUrl,
-      hasAuth: request.headers.has('authorization'),
-    });
-
-    // 获取请求体
-    const body = method !== 'GET' ? await request.text() : undefined;
-
-    // 转发请求到后端
-    const response = await fetch(backendUrl, {
-      method,
-      headers: {
-        'Content-Type': 'application/json',
-        // 转发 Authorization header
-        ...(request.headers.get('authorization') && {
-          'Authorization': request.headers.get('authorization')!,
-        }),
-        ...(request.headers.get('Authorization') && {
-          'Authorization': request.headers.get('Authorization')!,
-        }),
-      },
-      body,
-      // 禁用缓存
-      cache: 'no-store',
-    });
+  // 构建后端 URL
+  const path = params.path.join('/');
+  const queryString = request.nextUrl.search;
+  const backendUrl = `${BACKEND_URL}/${path}${queryString}`;
+  const startedAt = Date.now();
 
-    console.log('[Backend Proxy Response]', {
-      status: response.status,
-      ok: response.ok,
-      contentType: response.headers.get('content-type'),
-    });
+  try {
+    // 请求体和响应体都直接流式透传（包括流式解读），不在这里缓冲
+    const response = await forwardRequest(request, backendUrl);
 
-    // 如果是流式响应，直接返回 body stream
-    if (response.headers.get('content-type')?.includes('text/event-stream') || 
-        response.headers.get('transfer-encoding') === 'chunked' ||
-        // AI 解读接口通常是流式的，即使 content-type 可能是 text/plain 或 application/json
-        path.includes('interpret')) {
-        
-        return new NextResponse(response.body, {
-            status: response.status,
-            headers: {
-                'Content-Type': response.headers.get('content-type') || 'application/json',
-                // 确保 CORS 和缓存头正确
-                'Cache-Control': 'no-cache',
-                'Connection': 'keep-alive',
-            },
-        });
+    if (proxyConfig.logRequests) {
+      console.log('[Backend Proxy]', {
+        method,
+        path,
+        status: response.status,
+        contentType: response.headers.get('content-type'),
+        headersMs: Date.now() - startedAt,
+        hasAuth: request.headers.has('authorization'),
+      });
     }
 
-    // 获取响应体
-    const responseText = await response.text();
-
-    // 转发响应
-    return new NextResponse(responseText, {
-      status: response.status,
-      headers: {
-        'Content-Type': response.headers.get('content-type') || 'application/json',
-      },
-    });
+    return response;
   } catch (error) {
-    console.error('[Backend Proxy Error]', error);
+    console.error('[Backend Proxy Error]', { method, path, backendUrl }, error);
     return NextResponse.json(
       {
         success: false,
@@ -1,9 +1,18 @@
 
 import { NextRequest, NextResponse } from 'next/server';
+import {
+  getPaymentStatus,
+  waitForPaymentStatus,
+  type PaymentStatusResult,
+} from '@/lib/payment-status-cache';
 
 /**
  * GET /api/stripe/payment-status/[session_id]
  * 查询 Stripe 支付状态
+ *
+ * 长轮询：带上 ?wait=秒数（最多 25）时，服务端保持连接，
+ * 直到状态不同于 ?since（默认 pending）或超时才返回。
+ * 同一 session 的并发请求共用一次后端查询（见 src/lib/payment-status-cache.ts）。
  */
 export async function GET(
   request: NextRequest,
@@ -25,13 +34,16 @@ export async function GET(
     // 获取 Authorization header
     const authHeader = request.headers.get('Authorization');
     
-    // 获取查询参数
-    const queryString = request.nextUrl.search;
+    // 获取查询参数（长轮询参数不透传给后端）
+    const searchParams = new URLSearchParams(request.nextUrl.search);
+    const waitSeconds = Number(searchParams.get('wait')) || 0;
+    const since = searchParams.get('since') || 'pending';
+    searchParams.delete('wait');
+    searchParams.delete('since');
+    const queryString = searchParams.toString() ? `?${searchParams}` : '';
     
     // 构造后端请求 URL
     const targetUrl = `${backendUrl}/api/stripe/payment-status/${session_id}${queryString}`;
-    
-    console.log(`[Payment Status] Proxying to: ${targetUrl}`);
 
     const headers: HeadersInit = {
       'Content-Type': 'application/json',
@@ -42,18 +54,30 @@ export async function GET(
       headers['Authorization'] = authHeader;
     }
 
-    const response = await fetch(targetUrl, {
-      method: 'GET',
-      headers,
-    });
+    const fetchStatus = async (): Promise<PaymentStatusResult> => {
+      const response = await fetch(targetUrl, {
+        method: 'GET',
+        headers,
+        cache: 'no-store',
+      });
+      return { httpStatus: response.status, body: await response.json() };
+    };
 
-    const data = await response.json();
+    // 按 session 与凭证区分缓存，不同用户之间不共享
+    const cacheKey = `${session_id}${queryString}|${authHeader ?? ''}`;
+    const { httpStatus, body: data } = waitSeconds > 0
+      ? await waitForPaymentStatus(cacheKey, fetchStatus, {
+          since,
+          timeoutMs: waitSeconds * 1000,
+          signal: request.signal,
+        })
+      : await getPaymentStatus(cacheKey, fetchStatus);
 
-    if (!response.ok) {
+    if (httpStatus < 200 || httpStatus >= 300) {
       console.error('[Payment Status] Backend error:', data);
       return NextResponse.json(
         { success: false, error: data.error || 'Failed to fetch payment status' },
-        { status: response.status }
+        { status: httpStatus }
       );
     }
 
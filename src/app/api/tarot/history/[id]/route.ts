@@ -0,0 +1,39 @@
+import { NextRequest } from 'next/server';
+import { tarotInterpretationManager } from '@/storage/database';
+import {
+  withErrorHandler,
+  createSuccessResponse,
+  ApiError,
+  ERROR_CODES,
+} from '@/lib/api-response';
+
+/**
+ * 单条解读记录（含完整正文）
+ * GET /api/tarot/history/[id]?userId=...
+ */
+export async function GET(
+  request: NextRequest,
+  { params }: { params: Promise<{ id: string }> }
+) {
+  return withErrorHandler(async () => {
+    const { id } = await params;
+    const userId = request.nextUrl.searchParams.get('userId');
+
+    if (!id || !userId) {
+      throw new ApiError(
+        ERROR_CODES.INVALID_REQUEST,
+        'Missing id or userId'
+      );
+    }
+
+    const interpretation = await tarotInterpretationManager.getInterpretationById(id);
+    if (!interpretation || interpretation.userId !== userId) {
+      throw new ApiError(
+        ERROR_CODES.NOT_FOUND,
+        'Interpretation not found'
+      );
+    }
+
+    return Response.json(createSuccessResponse({ interpretation }));
+  });
+}
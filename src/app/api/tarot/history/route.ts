@@ -1,5 +1,5 @@
 import { NextRequest } from 'next/server';
-import { tarotInterpretationManager } from '@/storage/database';
+import { tarotInterpretationManager, decodeHistoryCursor } from '@/storage/database';
 import {
   withErrorHandler,
   createSuccessResponse,
@@ -7,6 +7,16 @@ import {
   ERROR_CODES,
 } from '@/lib/api-response';
 
+const DEFAULT_PAGE_SIZE = 20;
+const MAX_PAGE_SIZE = 50;
+
+/**
+ * 解读历史（摘要列表，游标分页）
+ * GET /api/tarot/history?userId=...&limit=20&cursor=...
+ *
+ * 返回的记录不含完整解读正文（只有 preview），展开时通过 /api/tarot/history/[id] 获取；
+ * nextCursor 为 null 表示没有更早的记录
+ */
 export async function GET(request: NextRequest) {
   return withErrorHandler(async () => {
     const searchParams = request.nextUrl.searchParams;
@@ -19,8 +29,24 @@ export async function GET(request: NextRequest) {
       );
     }
 
-    const interpretations = await tarotInterpretationManager.getInterpretationsByUserId(userId, 20);
+    const limit = Math.min(
+      Math.max(Number(searchParams.get('limit')) || DEFAULT_PAGE_SIZE, 1),
+      MAX_PAGE_SIZE
+    );
+    const cursorParam = searchParams.get('cursor');
+    const cursor = cursorParam ? decodeHistoryCursor(cursorParam) : null;
+    if (cursorParam && !cursor) {
+      throw new ApiError(
+        ERROR_CODES.INVALID_REQUEST,
+        'Invalid cursor'
+      );
+    }
+
+    const page = await tarotInterpretationManager.getInterpretationSummaries(userId, { limit, cursor });
 
-    return Response.json(createSuccessResponse({ interpretations }));
+    return Response.json(createSuccessResponse({
+      interpretations: page.items,
+      nextCursor: page.nextCursor,
+    }));
   });
 }
@@ -1,7 +1,10 @@
 import { NextRequest } from 'next/server';
 import { LLMClient, Config } from 'coze-coding-dev-sdk';
 import { dailyQuotaManager, tarotInterpretationManager } from '@/storage/database';
-import { llmConfig } from '@/config';
+import { llmConfig, responseCacheConfig } from '@/config';
+import { streamFromStub } from '@/lib/llm-stub';
+import { startTrace, verboseLog } from '@/lib/trace';
+import { cacheKey, interpretCache, normalizeQuestion, replayText } from '@/lib/response-cache';
 import type { TarotCard, Spread } from '@/lib/tarot';
 import {
   ApiError,
@@ -9,12 +12,13 @@ import {
 } from '@/lib/api-response';
 
 export async function POST(request: NextRequest) {
-  console.log('=== /api/tarot/interpret 开始处理请求 ===');
+  const trace = startTrace('/api/tarot/interpret');
+  let reservedFor: { userId: string; date: string } | undefined;
 
   try {
-    console.log('[1] 解析请求体...');
     const body = await request.json();
-    console.log('[1.1] 请求体内容:', JSON.stringify({
+    trace.mark('parse');
+    verboseLog('[interpret] 请求体:', JSON.stringify({
       userId: body.userId,
       question: body.question,
       spread: body.spread,
@@ -23,33 +27,32 @@ export async function POST(request: NextRequest) {
 
     const { userId, question, spread, cards, tone }: { userId: string; question: string; spread: Spread; cards: TarotCard[]; tone?: string } = body;
 
-    console.log('[2] 验证必填字段...');
     if (!userId || !question || !spread || !cards || cards.length === 0) {
-      console.log('[2.1] 验证失败 - 缺少必填字段');
       throw new ApiError(
         ERROR_CODES.INVALID_REQUEST,
         'Missing required fields'
       );
     }
 
-    console.log('[3] 检查每日限额...');
-    // 检查每日限额
-    const canInterpret = await dailyQuotaManager.canInterpret(userId);
-    console.log('[3.1] 限额检查结果:', canInterpret);
+    trace.set('spread', spread.id);
+    trace.set('cards', cards.length);
+    if (tone) trace.set('tone', tone);
 
-    if (!canInterpret) {
-      console.log('[3.2] 配额已用完');
+    // 原子地检查并占用每日限额，解读失败时退还
+    const reservation = await dailyQuotaManager.reserveQuota(userId);
+    trace.mark('quota');
+
+    if (!reservation.success) {
       throw new ApiError(
         ERROR_CODES.QUOTA_EXCEEDED,
         '今日解读次数已用完，请明天再来'
       );
     }
+    reservedFor = { userId, date: reservation.date };
 
-    console.log('[4] 准备 LLM 配置...');
     const config = new Config();
     const client = new LLMClient(config);
 
-    console.log('[5] 构建用户提示词...');
     const cardsInfo = cards
       .map((card, index) => {
         const position = spread.positions[index];
@@ -79,8 +82,9 @@ ${toneInstruction}
 1. [问题1]
 2. [问题2]`;
 
-    console.log('[6] 调用 LLM 流式接口...');
-    console.log('[6.1] LLM 配置:', {
+    trace.set('promptChars', userPrompt.length);
+    trace.mark('prompt');
+    verboseLog('[interpret] LLM 配置:', {
       model: llmConfig.model,
       temperature: llmConfig.temperature,
       thinking: llmConfig.thinking,
@@ -88,44 +92,58 @@ ${toneInstruction}
       userPromptLength: userPrompt.length
     });
 
-    const stream = client.stream(
-      [
-        { role: 'system', content: llmConfig.systemPrompt },
-        { role: 'user', content: userPrompt },
-      ],
-      {
-        temperature: llmConfig.temperature,
-        thinking: llmConfig.thinking,
-        model: llmConfig.model,
-      }
-    );
+    const messages = [
+      { role: 'system' as const, content: llmConfig.systemPrompt },
+      { role: 'user' as const, content: userPrompt },
+    ];
+
+    // 相同输入命中缓存时直接回放，仍照常保存记录并扣减限额
+    const resultKey = responseCacheConfig.enabled
+      ? cacheKey({
+          model: llmConfig.model,
+          spread: [spread.id, spread.name],
+          cards: cards.map((card) => [card.id, card.name, !!card.isReversed]),
+          tone: tone ?? '',
+          question: normalizeQuestion(question),
+        })
+      : undefined;
+    const cached = resultKey ? interpretCache.get(resultKey) : undefined;
+    if (resultKey) trace.set('cache', cached !== undefined ? 'hit' : 'miss');
+
+    const stream = cached !== undefined
+      ? replayText(cached)
+      : llmConfig.stubUrl
+        ? streamFromStub(llmConfig.stubUrl, messages)
+        : client.stream(messages, {
+            temperature: llmConfig.temperature,
+            thinking: llmConfig.thinking,
+            model: llmConfig.model,
+          });
 
     const encoder = new TextEncoder();
     let fullInterpretation = '';
 
-    console.log('[7] 创建可读流...');
     const readableStream = new ReadableStream({
       async start(controller) {
-        console.log('[7.1] 流式响应开始...');
         try {
           let chunkCount = 0;
           for await (const chunk of stream) {
+            if (chunkCount === 0) trace.mark('llm_first_chunk');
             chunkCount++;
             if (chunk.content) {
               const text = chunk.content.toString();
               fullInterpretation += text;
               controller.enqueue(encoder.encode(text));
-
-              if (chunkCount % 10 === 0) {
-                console.log(`[7.2] 已接收 ${chunkCount} 个数据块, 当前内容长度: ${fullInterpretation.length}`);
-              }
             }
           }
+          trace.mark('stream');
+          trace.set('chunks', chunkCount);
+          trace.set('outputChars', fullInterpretation.length);
+          if (resultKey && cached === undefined && fullInterpretation) {
+            interpretCache.set(resultKey, fullInterpretation);
+          }
 
-          console.log(`[7.3] 流式响应完成，共接收 ${chunkCount} 个数据块，总长度: ${fullInterpretation.length}`);
-
-          // 保存解读记录并使用限额
-          console.log('[8] 保存解读记录...');
+          // 保存解读记录（限额已在请求开始时通过 reserveQuota 占用）
           const record = await tarotInterpretationManager.createInterpretation({
             userId,
             question,
@@ -133,27 +151,26 @@ ${toneInstruction}
             cards: JSON.stringify(cards),
             interpretation: fullInterpretation,
           });
-          console.log('[8.1] 解读记录保存成功', record.id);
 
           // Append ID metadata for client to use (hidden in markdown)
           const metadata = `\n\n<!--ID:${record.id}-->`;
           controller.enqueue(encoder.encode(metadata));
 
-          console.log('[9] 更新限额...');
-          await dailyQuotaManager.useQuota(userId);
-          console.log('[9.1] 限额更新成功');
+          trace.mark('db_write');
 
           controller.close();
-          console.log('[7.4] 流控制器已关闭');
+          trace.end('ok');
         } catch (error) {
-          console.error('[7.5] 流处理错误:', error);
-          console.error('[7.6] 错误堆栈:', error instanceof Error ? error.stack : 'No stack');
+          console.error('[interpret] 流处理错误:', error instanceof Error ? error.stack : error);
+          trace.end('error', error);
+          await dailyQuotaManager.releaseQuota(userId, reservation.date).catch((releaseError) => {
+            console.error('[interpret] 退还限额失败:', releaseError);
+          });
           controller.error(error);
         }
       },
     });
 
-    console.log('[10] 返回流式响应...');
     return new Response(readableStream, {
       headers: {
         'Content-Type': 'text/event-stream',
@@ -163,11 +180,17 @@ ${toneInstruction}
       },
     });
   } catch (error) {
-    console.error('=== /api/tarot/interpret 发生错误 ===');
-    console.error('[错误类型]:', error instanceof Error ? error.constructor.name : typeof error);
-    console.error('[错误消息]:', error instanceof Error ? error.message : String(error));
-    console.error('[错误堆栈]:', error instanceof Error ? error.stack : 'No stack');
-    console.error('[错误详情]:', JSON.stringify(error, Object.getOwnPropertyNames(error)));
+    trace.end('error', error);
+    if (reservedFor) {
+      await dailyQuotaManager.releaseQuota(reservedFor.userId, reservedFor.date).catch((releaseError) => {
+        console.error('[interpret] 退还限额失败:', releaseError);
+      });
+    }
+    if (error instanceof ApiError) {
+      verboseLog('[interpret] 请求被拒绝:', error.code, error.message);
+    } else {
+      console.error('[interpret] 处理失败:', error instanceof Error ? error.stack : error);
+    }
 
     // 返回200状态码，错误信息在响应体中
     const errorResponse = {
@@ -1,6 +1,22 @@
 import { NextRequest } from 'next/server';
 import { LLMClient, Config } from 'coze-coding-dev-sdk';
-import { llmConfig } from '@/config';
+import { llmConfig, responseCacheConfig } from '@/config';
+import { cacheKey, normalizeQuestion, suggestCache } from '@/lib/response-cache';
+import { streamFromStub } from '@/lib/llm-stub';
+import {
+  SUGGESTION_CATEGORIES,
+  SUGGESTION_TONES,
+  buildSuggestionMessages,
+  getIndexedPool,
+  getLivePool,
+  normalizeSuggestionLocale,
+  parseSuggestionLines,
+  pickSuggestions,
+  suggestionPoolKey,
+  type SuggestionCategory,
+  type SuggestionLocale,
+  type SuggestionTone,
+} from '@/lib/suggestion-pool';
 import type { TarotCard } from '@/lib/tarot';
 import {
   withErrorHandler,
@@ -9,6 +25,56 @@ import {
   ERROR_CODES,
 } from '@/lib/api-response';
 
+const DEFAULT_SUGGESTION_COUNT = 6;
+const MAX_SUGGESTION_COUNT = 10;
+// 实时生成时一次生成的问题数，之后的请求从中抽取
+const LIVE_POOL_SIZE = 24;
+
+/**
+ * 实时生成一个问题池（仅用于离线索引未覆盖的组合）
+ */
+async function generateLivePool(category: SuggestionCategory, locale: SuggestionLocale, tone: SuggestionTone) {
+  const messages = buildSuggestionMessages(category, locale, tone, LIVE_POOL_SIZE);
+  if (llmConfig.stubUrl) {
+    let text = '';
+    for await (const chunk of streamFromStub(llmConfig.stubUrl, messages)) text += chunk.content;
+    return parseSuggestionLines(text);
+  }
+  const client = new LLMClient(new Config());
+  const response = await client.invoke(messages, {
+    temperature: llmConfig.temperature,
+    model: llmConfig.model,
+  });
+  return parseSuggestionLines(response.content?.toString() ?? '');
+}
+
+/**
+ * GET /api/tarot/suggest?category=love&lang=zh&tone=warm&count=6
+ * 抽牌前的推荐问题：从离线生成的问题池中随机抽取，未覆盖的组合实时生成
+ */
+export async function GET(request: NextRequest) {
+  return withErrorHandler(async () => {
+    const params = request.nextUrl.searchParams;
+    const category = (params.get('category') || 'recommended') as SuggestionCategory;
+    const tone = (params.get('tone') || 'mystical') as SuggestionTone;
+    const locale = normalizeSuggestionLocale(params.get('lang'));
+    const count = Math.min(Math.max(Number(params.get('count')) || DEFAULT_SUGGESTION_COUNT, 1), MAX_SUGGESTION_COUNT);
+
+    if (!SUGGESTION_CATEGORIES.includes(category) || !SUGGESTION_TONES.includes(tone)) {
+      throw new ApiError(ERROR_CODES.INVALID_REQUEST, 'Unknown category or tone');
+    }
+
+    const key = suggestionPoolKey(category, locale, tone);
+    const indexed = getIndexedPool(key);
+    const pool = indexed ?? await getLivePool(key, () => generateLivePool(category, locale, tone));
+
+    return Response.json(createSuccessResponse({
+      questions: pickSuggestions(pool, count),
+      source: indexed ? 'index' : 'live',
+    }));
+  });
+}
+
 export async function POST(request: NextRequest) {
   return withErrorHandler(async () => {
     const body = await request.json();
@@ -21,6 +87,19 @@ export async function POST(request: NextRequest) {
       );
     }
 
+    const resultKey = responseCacheConfig.enabled
+      ? cacheKey({
+          model: llmConfig.model,
+          cards: cards.map((card) => [card.id, card.name, !!card.isReversed]),
+          question: normalizeQuestion(question),
+          interpretation,
+        })
+      : undefined;
+    const cached = resultKey ? suggestCache.get(resultKey) : undefined;
+    if (cached !== undefined) {
+      return Response.json(createSuccessResponse({ suggestion: cached }));
+    }
+
     const config = new Config();
     const client = new LLMClient(config);
 
@@ -60,6 +139,10 @@ ${interpretation}
       }
     );
 
+    if (resultKey && response.content) {
+      suggestCache.set(resultKey, response.content.toString());
+    }
+
     return Response.json(createSuccessResponse({ suggestion: response.content }));
   });
 }
@@ -28,7 +28,8 @@ interface TarotCard {
 interface HistoryItem {
   id: string;
   question: string;
-  interpretation: string;
+  interpretation?: string; // 列表只返回摘要，展开时再加载完整正文
+  preview?: string;
   spreadType: string;
   createdAt: string;
   cards: string; // JSON string
@@ -41,6 +42,9 @@ export default function HistoryPage() {
   const [loading, setLoading] = useState(true);
   const [expandedItem, setExpandedItem] = useState<string | null>(null);
   const [refreshing, setRefreshing] = useState(false);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [loadingDetail, setLoadingDetail] = useState<Record<string, boolean>>({});
 
   // 流式显示状态
   const [streamingText, setStreamingText] = useState<Record<string, string>>({});
@@ -56,11 +60,13 @@ export default function HistoryPage() {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [user]);
 
-  // 流式显示效果
+  // 流式显示效果（正文未加载时先获取）
   useEffect(() => {
     if (expandedItem) {
       const item = history.find(h => h.id === expandedItem);
-      if (item?.interpretation && !streamingText[expandedItem]) {
+      if (item && item.interpretation === undefined) {
+        fetchDetail(item.id);
+      } else if (item?.interpretation && !streamingText[expandedItem]) {
         // 开始流式显示
         startStreamingText(expandedItem, item.interpretation);
       }
@@ -99,7 +105,7 @@ export default function HistoryPage() {
       setLoading(true);
       setRefreshing(true);
 
-      const data = await apiRequest<{ interpretations: HistoryItem[] }>(
+      const data = await apiRequest<{ interpretations: HistoryItem[]; nextCursor: string | null }>(
         `/api/tarot/history?userId=${user.id}`,
         {
           method: 'GET',
@@ -107,6 +113,7 @@ export default function HistoryPage() {
       );
 
       setHistory(data.interpretations || []);
+      setNextCursor(data.nextCursor ?? null);
     } catch (error) {
       console.error('Error fetching history:', error);
       if (error instanceof ApiRequestError) {
@@ -118,6 +125,50 @@ export default function HistoryPage() {
     }
   };
 
+  const loadMore = async () => {
+    if (!user || !nextCursor) return;
+
+    try {
+      setLoadingMore(true);
+      const data = await apiRequest<{ interpretations: HistoryItem[]; nextCursor: string | null }>(
+        `/api/tarot/history?userId=${user.id}&cursor=${encodeURIComponent(nextCursor)}`,
+        {
+          method: 'GET',
+        }
+      );
+
+      setHistory(prev => [...prev, ...(data.interpretations || [])]);
+      setNextCursor(data.nextCursor ?? null);
+    } catch (error) {
+      console.error('Error loading more history:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
+  const fetchDetail = async (itemId: string) => {
+    if (!user || loadingDetail[itemId]) return;
+
+    try {
+      setLoadingDetail(prev => ({ ...prev, [itemId]: true }));
+      const data = await apiRequest<{ interpretation: HistoryItem }>(
+        `/api/tarot/history/${itemId}?userId=${user.id}`,
+        {
+          method: 'GET',
+        }
+      );
+
+      setHistory(prev => prev.map(h => (
+        h.id === itemId ? { ...h, interpretation: data.interpretation.interpretation ?? '' } : h
+      )));
+    } catch (error) {
+      console.error('Error fetching interpretation:', error);
+      setHistory(prev => prev.map(h => (h.id === itemId ? { ...h, interpretation: '' } : h)));
+    } finally {
+      setLoadingDetail(prev => ({ ...prev, [itemId]: false }));
+    }
+  };
+
   const handleRefresh = () => {
     fetchHistory();
   };
@@ -378,7 +429,11 @@ export default function HistoryPage() {
                             </span>
                           )}
                         </h3>
-                        {item.interpretation ? (
+                        {item.interpretation === undefined ? (
+                          <div className="flex items-center justify-center py-6 text-purple-200">
+                            <div className="animate-spin rounded-full h-6 w-6 border-b-2 border-purple-400" />
+                          </div>
+                        ) : item.interpretation ? (
                           <div className="bg-black rounded-lg p-3 sm:p-4 prose prose-invert prose-purple max-w-none border border-purple-500/20 text-white text-sm sm:text-base">
                             <ReactMarkdown remarkPlugins={[remarkGfm]}>
                               {streamingText[item.id] || item.interpretation}
@@ -418,6 +473,16 @@ export default function HistoryPage() {
                 </Card>
               );
             })}
+            {nextCursor && (
+              <Button
+                onClick={loadMore}
+                variant="outline"
+                className="w-full border-purple-500/30 text-purple-200 hover:bg-purple-500/10"
+                disabled={loadingMore}
+              >
+                {loadingMore ? (t.home.loading || 'Loading...') : t.home.loadMore}
+              </Button>
+            )}
           </div>
         </ScrollArea>
       )}
@@ -0,0 +1,50 @@
+import { getDb } from 'coze-coding-dev-sdk';
+import { eq } from 'drizzle-orm';
+import { tarotInterpretations } from '@/storage/database/shared/schema';
+import { readFallbackPreview, readSharePreview, sharePreviewKey } from '@/lib/share-preview';
+
+export const alt = 'Mentob AI - Tarot Reading';
+export const size = { width: 1200, height: 630 };
+export const contentType = 'image/jpeg';
+
+/**
+ * 分享页的 Open Graph 预览图：返回按抽牌结果预先生成的图片（见 scripts/render_share_previews.py）
+ * 未生成时返回通用预览图并只短暂缓存，避免在爬虫请求时实时合成，也不让 og:image 指向 404
+ */
+export default async function Image({ params }: { params: Promise<{ id: string }> }) {
+  const { id } = await params;
+
+  let key: string | undefined;
+  try {
+    const db = await getDb();
+    const [reading] = await db
+      .select({ spreadType: tarotInterpretations.spreadType, cards: tarotInterpretations.cards })
+      .from(tarotInterpretations)
+      .where(eq(tarotInterpretations.id, id))
+      .limit(1);
+    key = reading ? sharePreviewKey(reading.spreadType, reading.cards) : undefined;
+  } catch (error) {
+    // 查询失败时同样返回通用预览图，而不是 500
+    console.error('[Share Preview] Failed to load reading:', id, error);
+  }
+
+  const image = key ? await readSharePreview(key) : undefined;
+  if (!image) {
+    if (key) console.warn('[Share Preview] Not rendered yet:', id, key);
+    return new Response(new Uint8Array(await readFallbackPreview()), {
+      headers: {
+        'Content-Type': contentType,
+        // 预览图生成后应尽快替换通用图
+        'Cache-Control': 'public, max-age=300',
+      },
+    });
+  }
+
+  return new Response(new Uint8Array(image), {
+    headers: {
+      'Content-Type': contentType,
+      // 同一条解读的抽牌结果不会变化
+      'Cache-Control': 'public, max-age=86400',
+    },
+  });
+}
@@ -78,7 +78,13 @@ function SuccessContent() {
       return;
     }
 
-    // Polling function
+    // Long-poll: the server holds each request until the status differs from `lastStatus`
+    // (or ~25s pass), so there is no fixed-interval polling while the payment is pending.
+    const WAIT_SECONDS = 25;
+    const MAX_PENDING_ROUNDS = 8;
+    let lastStatus = 'pending';
+    let pendingRounds = 0;
+
     const checkPaymentStatus = async () => {
       try {
         console.log('[Success Page] Checking payment status for session:', sessionId);
@@ -92,7 +98,7 @@ function SuccessContent() {
           headers['Authorization'] = authHeader;
         }
 
-        const res = await fetch(`/api/stripe/payment-status/${sessionId}`, {
+        const res = await fetch(`/api/stripe/payment-status/${sessionId}?wait=${WAIT_SECONDS}&since=${encodeURIComponent(lastStatus)}`, {
           method: 'GET',
           headers,
         });
@@ -112,6 +118,7 @@ function SuccessContent() {
 
         console.log('[Success Page] Payment status response:', response);
         const paymentStatus = response.status;
+        lastStatus = paymentStatus || lastStatus;
 
         // Treat 'waiting_for_webhook' as success to avoid bad UX
         if (paymentStatus === 'completed' || paymentStatus === 'paid' || paymentStatus === 'waiting_for_webhook') {
@@ -142,8 +149,12 @@ function SuccessContent() {
           // Log success
           await logPaymentResult('info', 'Payment completed successfully', { sessionId, plan, status: paymentStatus });
         } else if (paymentStatus === 'pending') {
-          // Payment not finished
+          // Payment not finished; keep waiting for a change for a few more rounds
           setStatus('pending');
+          pendingRounds++;
+          if (pendingRounds < MAX_PENDING_ROUNDS) {
+            checkPaymentStatus();
+          }
         } else if (paymentStatus === 'failed') {
           // Payment failed
           setStatus('failed');
@@ -187,7 +198,7 @@ function SuccessContent() {
       }
     };
 
-    // Start polling
+    // Start waiting for the payment status
     checkPaymentStatus();
 
     console.log('Payment success page accessed');
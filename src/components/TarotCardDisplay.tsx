@@ -4,6 +4,7 @@ import { useState, useEffect } from 'react';
 import { type TarotCard, type SpreadPosition, type Spread } from '@/lib/tarot';
 import { useI18n } from '@/lib/i18n';
 import { useSpreadTranslations } from '@/lib/spreadTranslations';
+import { getCardPlaceholder, placeholderStyle } from '@/lib/card-placeholders';
 
 interface TarotCardDisplayProps {
   cards: TarotCard[];
@@ -95,6 +96,7 @@ export function TarotCardDisplay({ cards, positions, isDrawing, spread, cardStyl
         {cards.map((card, index) => {
           const isFlipped = flippedCards.has(index);
           const shouldFloat = !showAll && isFlipped;
+          const placeholder = getCardPlaceholder(card.imageUrl);
 
           return (
             <div
@@ -143,11 +145,15 @@ export function TarotCardDisplay({ cards, positions, isDrawing, spread, cardStyl
                     transform: 'rotateY(180deg)',
                   }}
                 >
-                  {/* 牌面图片 */}
+                  {/* 牌面图片（原图下载完成前先显示预生成的模糊预览） */}
                   {card.imageUrl ? (
                     <img
                       src={card.imageUrl}
                       alt={card.nameEn}
+                      width={placeholder?.width}
+                      height={placeholder?.height}
+                      decoding="async"
+                      style={placeholderStyle(placeholder)}
                       className={`w-full h-full object-cover ${card.isReversed ? 'rotate-180' : ''}`}
                       onError={(e) => {
                       // 图片加载失败时显示占位符
@@ -16,6 +16,7 @@ import Link from 'next/link';
 import { apiRequest, ApiRequestError } from '@/lib/api-client';
 import { useTarotFlow } from '@/lib/tarotFlowContext';
 import { useAnalytics } from '@/components/GA4Tracker';
+import { getCardPlaceholder, placeholderStyle, fitWithin } from '@/lib/card-placeholders';
 
 interface TarotResultProps {
   question: string;
@@ -134,6 +135,8 @@ export function TarotResult({
                     <img
                       src={card.imageUrl}
                       alt={card.nameEn}
+                      decoding="async"
+                      style={placeholderStyle(getCardPlaceholder(card.imageUrl))}
                       className="w-12 h-16 object-cover rounded"
                       onError={(e) => {
                         console.error(`Failed to load list image for card ${card.nameEn}:`, card.imageUrl);
@@ -163,6 +166,12 @@ export function TarotResult({
                       <img
                         src={card.imageUrl}
                         alt={card.nameEn}
+                        decoding="async"
+                        // 按原图比例预留尺寸，避免加载后版面跳动
+                        style={{
+                          ...placeholderStyle(getCardPlaceholder(card.imageUrl)),
+                          ...fitWithin(getCardPlaceholder(card.imageUrl), 200, 300),
+                        }}
                         className="max-w-[200px] max-h-[300px] object-contain rounded-lg border border-purple-500/30"
                         onError={(e) => {
                           console.error(`Failed to load expanded image for card ${card.nameEn}:`, card.imageUrl);
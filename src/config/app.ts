@@ -14,6 +14,7 @@ export interface AppConfig {
     dailyQuota: {
       free: number; // 免费用户每日限额
       paid: number; // 付费用户每日限额
+      exhaustedCacheSeconds: number; // 已用完限额的用户在进程内缓存的秒数
     };
     aiInterpretation: {
       enabled: boolean;
@@ -39,6 +40,7 @@ export interface AppConfig {
  * - APP_VERSION: 应用版本
  * - DAILY_QUOTA_FREE: 免费用户每日限额
  * - DAILY_QUOTA_PAID: 付费用户每日限额
+ * - DAILY_QUOTA_EXHAUSTED_CACHE_SECONDS: 已用完限额用户的缓存时长，默认 30 秒，设为 0 关闭
  */
 export const appConfig: AppConfig = {
   app: {
@@ -52,6 +54,9 @@ export const appConfig: AppConfig = {
     dailyQuota: {
       free: Number(process.env.DAILY_QUOTA_FREE) || 3,
       paid: Number(process.env.DAILY_QUOTA_PAID) || 999,
+      exhaustedCacheSeconds: process.env.DAILY_QUOTA_EXHAUSTED_CACHE_SECONDS !== undefined
+        ? Number(process.env.DAILY_QUOTA_EXHAUSTED_CACHE_SECONDS)
+        : 30,
     },
     aiInterpretation: {
       enabled: process.env.AI_INTERPRETATION_ENABLED !== 'false',
@@ -0,0 +1,27 @@
+/**
+ * 解读结果缓存配置
+ * 相同牌阵、牌面、正逆位、语气和问题的请求直接复用最近的结果（见 src/lib/response-cache.ts）
+ */
+
+export interface ResponseCacheConfig {
+  enabled: boolean; // 默认关闭，需显式开启
+  ttlSeconds: number; // 缓存有效期
+  maxEntries: number; // 每个接口最多缓存的条目数，超出后按 LRU 淘汰
+  replayChunkChars: number; // 命中时回放流的分块大小（字符数）
+}
+
+/**
+ * 缓存配置
+ *
+ * 可以通过环境变量覆盖：
+ * - RESPONSE_CACHE_ENABLED: 设为 true 开启缓存
+ * - RESPONSE_CACHE_TTL_SECONDS: 有效期，默认 600 秒
+ * - RESPONSE_CACHE_MAX_ENTRIES: 最大条目数，默认 500
+ * - RESPONSE_CACHE_REPLAY_CHUNK: 回放分块大小，默认 64 字符
+ */
+export const responseCacheConfig: ResponseCacheConfig = {
+  enabled: process.env.RESPONSE_CACHE_ENABLED === 'true',
+  ttlSeconds: Number(process.env.RESPONSE_CACHE_TTL_SECONDS) || 600,
+  maxEntries: Number(process.env.RESPONSE_CACHE_MAX_ENTRIES) || 500,
+  replayChunkChars: Number(process.env.RESPONSE_CACHE_REPLAY_CHUNK) || 64,
+};
@@ -9,3 +9,6 @@ export { llmConfig } from './llm';
 export { databaseConfig } from './database';
 export { appConfig } from './app';
 export { backendConfig, getApiUrl, validateBackendConfig } from './backend';
+export { tracingConfig } from './tracing';
+export { responseCacheConfig } from './cache';
+export { proxyConfig } from './proxy';
@@ -9,6 +9,7 @@ export interface LLMConfig {
   maxTokens?: number;
   thinking: 'enabled' | 'disabled';
   systemPrompt: string;
+  stubUrl?: string;
 }
 
 /**
@@ -38,6 +39,9 @@ export const llmConfig: LLMConfig = {
   
   // 思考模式：enabled (启用) / disabled (禁用)
   thinking: (process.env.LLM_THINKING as 'enabled' | 'disabled') || 'enabled',
+
+  // 本地压测用：设置后解读接口改为从该地址读取固定速率的模拟输出（见 scripts/mock_backend.py）
+  stubUrl: process.env.LLM_STUB_URL || undefined,
   
   // 系统提示词模板
   systemPrompt: `你是一位专业的塔罗牌解读师，拥有丰富的经验和深刻的洞察力。你的任务是：
@@ -0,0 +1,30 @@
+/**
+ * 后端代理连接池配置
+ * /api/proxy 通过 keep-alive 连接池转发到后端（见 src/lib/backend-proxy.ts）
+ */
+
+export interface ProxyConfig {
+  maxSockets: number; // 每个后端地址的最大并发连接数，超出后排队
+  maxFreeSockets: number; // 空闲时保留的 keep-alive 连接数
+  freeSocketTimeoutMs: number; // 空闲连接保留时长，应短于后端的 keep-alive 超时
+  idleTimeoutMs: number; // 连接上无数据传输超过该时长则中止（流式解读的两段输出之间也算）
+  logRequests: boolean; // 逐条打印代理日志
+}
+
+/**
+ * 代理配置
+ *
+ * 可以通过环境变量覆盖：
+ * - PROXY_MAX_SOCKETS: 默认 64
+ * - PROXY_MAX_FREE_SOCKETS: 默认 16
+ * - PROXY_FREE_SOCKET_TIMEOUT_MS: 默认 4000（uvicorn 默认 keep-alive 为 5 秒）
+ * - PROXY_IDLE_TIMEOUT_MS: 默认 120000
+ * - PROXY_LOG: 设为 true 打印每个请求
+ */
+export const proxyConfig: ProxyConfig = {
+  maxSockets: Number(process.env.PROXY_MAX_SOCKETS) || 64,
+  maxFreeSockets: Number(process.env.PROXY_MAX_FREE_SOCKETS) || 16,
+  freeSocketTimeoutMs: Number(process.env.PROXY_FREE_SOCKET_TIMEOUT_MS) || 4000,
+  idleTimeoutMs: Number(process.env.PROXY_IDLE_TIMEOUT_MS) || 120000,
+  logRequests: process.env.PROXY_LOG === 'true',
+};
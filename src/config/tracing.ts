@@ -0,0 +1,27 @@
+/**
+ * 请求耗时追踪配置
+ * 用于记录接口各阶段耗时（见 src/lib/trace.ts）
+ */
+
+export interface TracingConfig {
+  enabled: boolean;
+  bufferSize: number; // 内存环形缓冲区保留的最近请求数
+  logFile?: string; // 可选的本地 JSONL 输出文件
+  verbose: boolean; // 是否打印完整请求体等详细日志
+}
+
+/**
+ * 追踪配置
+ *
+ * 可以通过环境变量覆盖：
+ * - TRACE_ENABLED: 设为 false 关闭耗时追踪
+ * - TRACE_BUFFER_SIZE: 环形缓冲区大小，默认 500
+ * - TRACE_LOG_FILE: JSONL 输出文件路径，汇总可用 scripts/trace_report.py
+ * - TRACE_VERBOSE: 设为 true 打印请求体等详细日志（默认关闭）
+ */
+export const tracingConfig: TracingConfig = {
+  enabled: process.env.TRACE_ENABLED !== 'false',
+  bufferSize: Number(process.env.TRACE_BUFFER_SIZE) || 500,
+  logFile: process.env.TRACE_LOG_FILE || undefined,
+  verbose: process.env.TRACE_VERBOSE === 'true',
+};
@@ -1,4 +1,5 @@
 // 答案之书的答案池 - 支持多语言
+// 修改后运行 scripts/build_answer_shards.py 重新生成 src/data/answer-shards/ 下的分片（页面和接口只读取分片）
 export const ANSWERS = {
   zh: [
     "寻求更多的选择",
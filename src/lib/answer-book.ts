@@ -0,0 +1,78 @@
+/**
+ * 答案之书：按语言分片的答案池
+ *
+ * 答案内容在 src/data/answers.ts 中编辑，由 scripts/build_answer_shards.py 编译为
+ * src/data/answer-shards/<语言>.json。页面只按需加载当前语言的分片，
+ * 或通过 /api/answer-book/draw 在服务端抽取，不下载任何答案池数据。
+ */
+
+export type AnswerLocale = 'zh' | 'en' | 'ja';
+
+export interface DrawnAnswer {
+  lang: AnswerLocale;
+  index: number;
+  total: number;
+  answer: string;
+}
+
+const LOCALE_MAP: Record<string, AnswerLocale> = {
+  zh: 'zh',
+  en: 'en',
+  ja: 'ja',
+  cn: 'zh', // 兼容后端使用的 cn
+  jp: 'ja', // 兼容后端使用的 jp
+};
+
+// 每种语言单独打包为一个 chunk，只有用到时才下载
+const SHARD_LOADERS: Record<AnswerLocale, () => Promise<{ default: string[] }>> = {
+  zh: () => import('@/data/answer-shards/zh.json'),
+  en: () => import('@/data/answer-shards/en.json'),
+  ja: () => import('@/data/answer-shards/ja.json'),
+};
+
+const loadedPools = new Map<AnswerLocale, Promise<string[]>>();
+
+/**
+ * 将语言代码映射为答案池语言，未知语言回退到英文
+ */
+export function normalizeAnswerLocale(lang?: string | null): AnswerLocale {
+  return LOCALE_MAP[lang ?? ''] ?? 'en';
+}
+
+/**
+ * 加载某种语言的答案池（同一语言只加载一次）
+ */
+export function loadAnswerPool(lang?: string): Promise<string[]> {
+  const locale = normalizeAnswerLocale(lang);
+  let pool = loadedPools.get(locale);
+  if (!pool) {
+    pool = SHARD_LOADERS[locale]().then((module) => module.default);
+    // 加载失败时不缓存，下次重新尝试
+    pool.catch(() => loadedPools.delete(locale));
+    loadedPools.set(locale, pool);
+  }
+  return pool;
+}
+
+/**
+ * 随机抽取一个答案
+ *
+ * 优先请求服务端抽取；接口不可用时（如离线）回退为在本地加载当前语言的分片后抽取。
+ */
+export async function drawAnswer(lang?: string): Promise<DrawnAnswer> {
+  const locale = normalizeAnswerLocale(lang);
+  try {
+    const response = await fetch(`/api/answer-book/draw?lang=${locale}`, { cache: 'no-store' });
+    const result = await response.json();
+    if (response.ok && result.success) {
+      return result.data as DrawnAnswer;
+    }
+    console.warn('[Answer Book] Draw endpoint failed, drawing locally:', result.error);
+  } catch (error) {
+    console.warn('[Answer Book] Draw endpoint unavailable, drawing locally:', error);
+  }
+
+  const pool = await loadAnswerPool(locale);
+  const index = Math.floor(Math.random() * pool.length);
+  return { lang: locale, index, total: pool.length, answer: pool[index] };
+}
@@ -0,0 +1,145 @@
+/**
+ * 后端透传代理（仅服务端使用）
+ *
+ * 请求体与响应体都以流的形式直接转发，不在内存中缓冲；上游连接来自有上限的 keep-alive 连接池。
+ * 使用 node:http 而不是 fetch：fetch 会自动解压响应，
+ * 导致 Content-Encoding / Content-Length 与实际字节不符，无法原样转发。
+ */
+
+import http from 'node:http';
+import https from 'node:https';
+import { Readable } from 'node:stream';
+import type { ReadableStream as NodeReadableStream } from 'node:stream/web';
+import { proxyConfig } from '@/config/proxy';
+
+// 转发给后端的请求头（其余如 Cookie、Origin 不转发）
+const FORWARDED_REQUEST_HEADERS = [
+  'authorization',
+  'content-type',
+  'content-length',
+  'content-encoding',
+  'accept',
+  'accept-encoding',
+  'accept-language',
+  'if-none-match',
+  'if-modified-since',
+];
+
+// 逐跳头部只对单个连接有效，不能转发；Set-Cookie 不透传给浏览器
+const DROPPED_RESPONSE_HEADERS = new Set([
+  'connection',
+  'keep-alive',
+  'proxy-authenticate',
+  'proxy-authorization',
+  'te',
+  'trailer',
+  'transfer-encoding',
+  'upgrade',
+  'set-cookie',
+]);
+
+const agentOptions = {
+  keepAlive: true,
+  maxSockets: proxyConfig.maxSockets,
+  maxFreeSockets: proxyConfig.maxFreeSockets,
+  timeout: proxyConfig.freeSocketTimeoutMs,
+  scheduling: 'lifo' as const, // 优先复用最近用过的连接，让多余的空闲连接自然超时关闭
+};
+const httpAgent = new http.Agent(agentOptions);
+const httpsAgent = new https.Agent(agentOptions);
+
+export interface ProxyPoolStats {
+  sockets: number;
+  freeSockets: number;
+  queued: number;
+}
+
+function countSockets(sockets: NodeJS.ReadOnlyDict<unknown[]>): number {
+  return Object.values(sockets).reduce((sum, list) => sum + (list?.length ?? 0), 0);
+}
+
+/**
+ * 连接池当前状态：使用中 / 空闲 / 排队等待的连接数
+ */
+export function proxyPoolStats(): ProxyPoolStats {
+  return [httpAgent, httpsAgent].reduce(
+    (stats, agent) => ({
+      sockets: stats.sockets + countSockets(agent.sockets),
+      freeSockets: stats.freeSockets + countSockets(agent.freeSockets),
+      queued: stats.queued + countSockets(agent.requests),
+    }),
+    { sockets: 0, freeSockets: 0, queued: 0 }
+  );
+}
+
+function requestHeaders(request: Request): http.OutgoingHttpHeaders {
+  const headers: http.OutgoingHttpHeaders = {};
+  for (const name of FORWARDED_REQUEST_HEADERS) {
+    const value = request.headers.get(name);
+    if (value !== null) headers[name] = value;
+  }
+  return headers;
+}
+
+function responseHeaders(upstream: http.IncomingMessage): Headers {
+  const headers = new Headers();
+  for (const [name, value] of Object.entries(upstream.headers)) {
+    if (value === undefined || DROPPED_RESPONSE_HEADERS.has(name)) continue;
+    for (const item of Array.isArray(value) ? value : [value]) headers.append(name, item);
+  }
+  if (headers.get('content-type')?.includes('text/event-stream')) {
+    // 流式响应：禁止中间层（如 nginx）缓冲
+    if (!headers.has('cache-control')) headers.set('cache-control', 'no-cache');
+    headers.set('x-accel-buffering', 'no');
+  }
+  return headers;
+}
+
+/**
+ * 将请求原样转发到 targetUrl，返回流式响应
+ *
+ * 上游返回响应头后立即返回，响应体边收边转发；浏览器断开时同时中止上游请求。
+ * 连接或请求阶段的错误会以 reject 抛出，由调用方转成错误响应。
+ */
+export function forwardRequest(request: Request, targetUrl: string): Promise<Response> {
+  const url = new URL(targetUrl);
+  const isHttps = url.protocol === 'https:';
+  const method = request.method.toUpperCase();
+  const hasBody = request.body !== null && method !== 'GET' && method !== 'HEAD';
+
+  return new Promise((resolve, reject) => {
+    const upstreamRequest = (isHttps ? https : http).request(
+      url,
+      {
+        method,
+        headers: requestHeaders(request),
+        agent: isHttps ? httpsAgent : httpAgent,
+        timeout: proxyConfig.idleTimeoutMs,
+      },
+      (upstream) => {
+        const status = upstream.statusCode ?? 502;
+        // 204 / 304 等不允许有响应体
+        const body = status === 204 || status === 304 || method === 'HEAD'
+          ? null
+          : (Readable.toWeb(upstream) as ReadableStream<Uint8Array>);
+        if (!body) upstream.resume();
+        resolve(new Response(body, { status, statusText: upstream.statusMessage, headers: responseHeaders(upstream) }));
+      }
+    );
+
+    upstreamRequest.on('timeout', () => {
+      upstreamRequest.destroy(new Error(`upstream idle for ${proxyConfig.idleTimeoutMs}ms`));
+    });
+    // 响应头之前的错误会 reject；之后的错误由 Readable.toWeb 传递给响应流
+    upstreamRequest.on('error', reject);
+    request.signal?.addEventListener('abort', () => upstreamRequest.destroy(), { once: true });
+
+    if (hasBody) {
+      const source = Readable.fromWeb(request.body as unknown as NodeReadableStream<Uint8Array>);
+      source.on('error', (error) => upstreamRequest.destroy(error));
+      source.pipe(upstreamRequest);
+    } else {
+      upstreamRequest.end();
+    }
+  });
+}
@@ -0,0 +1,59 @@
+/**
+ * 牌面图片占位符
+ *
+ * 数据由 scripts/build_card_placeholders.py 预先生成（card-placeholders.json），
+ * 包含原图尺寸、平均色和几百字节的模糊预览图，用于在原图下载完成前先行绘制并预留版面。
+ */
+
+import CARD_PLACEHOLDERS from './card-placeholders.json';
+import type { CSSProperties } from 'react';
+
+export interface CardPlaceholder {
+  width: number;
+  height: number;
+  color: string;
+  blurDataURL: string;
+  hash: string;
+}
+
+const placeholders: Record<string, CardPlaceholder> = CARD_PLACEHOLDERS.images;
+
+// 带内容哈希的地址（/assets/...<hash>.png，见 scripts/fingerprint_assets.py）对应的原始地址
+const FINGERPRINTED_URL = /^\/assets(\/.+)\.[0-9a-f]{10}(\.[^./]+)?$/;
+
+/**
+ * 按图片地址获取占位符（原始地址和带哈希的地址均可），未生成时返回 undefined
+ */
+export function getCardPlaceholder(imageUrl?: string): CardPlaceholder | undefined {
+  if (!imageUrl) return undefined;
+  return placeholders[imageUrl.replace(FINGERPRINTED_URL, '$1$2')];
+}
+
+/**
+ * 占位背景：平均色打底，模糊预览图铺满
+ */
+export function placeholderStyle(placeholder?: CardPlaceholder): CSSProperties {
+  if (!placeholder) return {};
+  return {
+    backgroundColor: placeholder.color,
+    backgroundImage: `url("${placeholder.blurDataURL}")`,
+    backgroundSize: 'cover',
+    backgroundPosition: 'center',
+  };
+}
+
+/**
+ * 按原图比例缩放到不超过 maxWidth × maxHeight，用于图片加载前预留确定的尺寸
+ */
+export function fitWithin(
+  placeholder: CardPlaceholder | undefined,
+  maxWidth: number,
+  maxHeight: number
+): { width: number; height: number } | undefined {
+  if (!placeholder) return undefined;
+  const scale = Math.min(maxWidth / placeholder.width, maxHeight / placeholder.height, 1);
+  return {
+    width: Math.round(placeholder.width * scale),
+    height: Math.round(placeholder.height * scale),
+  };
+}
@@ -0,0 +1,42 @@
+/**
+ * 本地模拟 LLM 的流式客户端（仅用于压测）
+ *
+ * 设置 LLM_STUB_URL 后，解读接口改为从该地址读取按固定速率回放的分块输出，
+ * 以便把接口自身的开销与模型延迟区分开来。
+ */
+
+export interface StubMessage {
+  role: string;
+  content: string;
+}
+
+/**
+ * 从模拟 LLM 读取流式输出，产出与 LLMClient.stream 相同形状的数据块
+ * @param url - 模拟服务地址，如 http://127.0.0.1:8902/llm/stream
+ * @param messages - 对话消息
+ */
+export async function* streamFromStub(
+  url: string,
+  messages: StubMessage[]
+): AsyncGenerator<{ content: string }> {
+  const response = await fetch(url, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ messages }),
+    cache: 'no-store',
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`LLM stub responded with HTTP ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    const text = decoder.decode(value, { stream: true });
+    if (text) yield { content: text };
+  }
+  const rest = decoder.decode();
+  if (rest) yield { content: rest };
+}
@@ -0,0 +1,126 @@
+/**
+ * 支付状态共享缓存（仅服务端使用）
+ *
+ * 同一 session 的并发查询共用一次后端请求，结果短暂缓存；
+ * 长轮询等待时由服务端按退避间隔查询后端，状态变化后立即返回。
+ */
+
+export interface PaymentStatusResult {
+  httpStatus: number;
+  body: { status?: string; [key: string]: unknown };
+}
+
+interface Entry {
+  result?: PaymentStatusResult;
+  fetchedAt: number;
+  inflight?: Promise<PaymentStatusResult>;
+  lastStatus?: string;
+  unchanged: number; // 连续未变化的次数，用于退避
+}
+
+// 这些状态不会再变化，可以缓存更久
+const TERMINAL_STATUSES = new Set(['completed', 'paid', 'waiting_for_webhook', 'failed', 'not_found', 'expired']);
+
+const BASE_POLL_MS = Number(process.env.PAYMENT_STATUS_POLL_MS) || 1000;
+const MAX_POLL_MS = Number(process.env.PAYMENT_STATUS_MAX_POLL_MS) || 3000;
+const TERMINAL_TTL_MS = 60_000;
+const MAX_ENTRIES = 1000;
+
+export const MAX_WAIT_MS = 25_000;
+
+const entries = new Map<string, Entry>();
+
+function isTerminal(status?: string): boolean {
+  return !!status && TERMINAL_STATUSES.has(status);
+}
+
+function pollDelay(entry: Entry): number {
+  return Math.min(MAX_POLL_MS, BASE_POLL_MS * 1.5 ** entry.unchanged);
+}
+
+function ttl(entry: Entry): number {
+  return isTerminal(entry.lastStatus) ? TERMINAL_TTL_MS : pollDelay(entry);
+}
+
+function prune() {
+  if (entries.size <= MAX_ENTRIES) return;
+  const cutoff = Date.now() - TERMINAL_TTL_MS;
+  for (const [key, entry] of entries) {
+    if (!entry.inflight && entry.fetchedAt < cutoff) entries.delete(key);
+  }
+}
+
+/**
+ * 获取支付状态：缓存未过期时直接返回，否则合并到同一次后端请求
+ * @param key - 缓存键（session 与调用方凭证）
+ * @param fetcher - 实际查询后端的函数
+ */
+export function getPaymentStatus(
+  key: string,
+  fetcher: () => Promise<PaymentStatusResult>
+): Promise<PaymentStatusResult> {
+  let entry = entries.get(key);
+  if (!entry) {
+    entry = { fetchedAt: 0, unchanged: 0 };
+    entries.set(key, entry);
+    prune();
+  }
+  if (entry.result && Date.now() - entry.fetchedAt < ttl(entry)) {
+    return Promise.resolve(entry.result);
+  }
+  if (!entry.inflight) {
+    const current = entry;
+    current.inflight = fetcher()
+      .then((result) => {
+        const status = result.body.status;
+        current.unchanged = status === current.lastStatus ? current.unchanged + 1 : 0;
+        current.lastStatus = status;
+        current.fetchedAt = Date.now();
+        // 只缓存成功的响应，错误下次重新请求
+        current.result = result.httpStatus === 200 ? result : undefined;
+        return result;
+      })
+      .finally(() => {
+        current.inflight = undefined;
+      });
+  }
+  return entry.inflight;
+}
+
+function sleep(ms: number, signal?: AbortSignal): Promise<void> {
+  return new Promise((resolve) => {
+    const timer = setTimeout(resolve, ms);
+    signal?.addEventListener('abort', () => {
+      clearTimeout(timer);
+      resolve();
+    }, { once: true });
+  });
+}
+
+/**
+ * 长轮询：等待状态不同于 since（或进入终态），最多等待 timeoutMs
+ */
+export async function waitForPaymentStatus(
+  key: string,
+  fetcher: () => Promise<PaymentStatusResult>,
+  options: { since: string; timeoutMs: number; signal?: AbortSignal }
+): Promise<PaymentStatusResult> {
+  const deadline = Date.now() + Math.min(options.timeoutMs, MAX_WAIT_MS);
+  while (true) {
+    const result = await getPaymentStatus(key, fetcher);
+    const status = result.body.status;
+    if (
+      result.httpStatus !== 200 ||
+      status !== options.since ||
+      isTerminal(status) ||
+      Date.now() >= deadline ||
+      options.signal?.aborted
+    ) {
+      return result;
+    }
+
+    const entry = entries.get(key);
+    const untilRefresh = entry ? ttl(entry) - (Date.now() - entry.fetchedAt) : BASE_POLL_MS;
+    await sleep(Math.max(50, Math.min(untilRefresh, deadline - Date.now())), options.signal);
+  }
+}
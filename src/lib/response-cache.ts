@@ -0,0 +1,133 @@
+/**
+ * LLM 结果缓存（仅服务端使用）
+ *
+ * 按输入的规范化哈希缓存解读 / 建议文本，带 TTL 与容量上限（LRU 淘汰），
+ * 并统计命中情况，可在 /api/debug/response-cache 查看。
+ */
+
+import { createHash } from 'crypto';
+import { responseCacheConfig } from '@/config/cache';
+
+export interface CacheStats {
+  size: number;
+  maxEntries: number;
+  ttlSeconds: number;
+  hits: number;
+  misses: number;
+  expired: number;
+  evictions: number;
+  hitRate: number;
+}
+
+interface Entry<T> {
+  value: T;
+  expiresAt: number;
+}
+
+/**
+ * 带 TTL 的 LRU 缓存，利用 Map 的插入顺序：最近使用的条目重新插入到末尾，淘汰时移除最前面的
+ */
+export class ResponseCache<T> {
+  private readonly entries = new Map<string, Entry<T>>();
+  private hits = 0;
+  private misses = 0;
+  private expired = 0;
+  private evictions = 0;
+
+  constructor(
+    private readonly maxEntries: number,
+    private readonly ttlMs: number
+  ) {}
+
+  get(key: string): T | undefined {
+    const entry = this.entries.get(key);
+    if (!entry) {
+      this.misses++;
+      return undefined;
+    }
+    this.entries.delete(key);
+    if (entry.expiresAt <= Date.now()) {
+      this.expired++;
+      this.misses++;
+      return undefined;
+    }
+    this.entries.set(key, entry);
+    this.hits++;
+    return entry.value;
+  }
+
+  set(key: string, value: T) {
+    this.entries.delete(key);
+    this.entries.set(key, { value, expiresAt: Date.now() + this.ttlMs });
+    while (this.entries.size > this.maxEntries) {
+      const oldest = this.entries.keys().next().value as string;
+      this.entries.delete(oldest);
+      this.evictions++;
+    }
+  }
+
+  clear() {
+    this.entries.clear();
+  }
+
+  stats(): CacheStats {
+    const lookups = this.hits + this.misses;
+    return {
+      size: this.entries.size,
+      maxEntries: this.maxEntries,
+      ttlSeconds: this.ttlMs / 1000,
+      hits: this.hits,
+      misses: this.misses,
+      expired: this.expired,
+      evictions: this.evictions,
+      hitRate: lookups ? Math.round((this.hits / lookups) * 1000) / 1000 : 0,
+    };
+  }
+}
+
+/**
+ * 规范化问题文本：全角转半角、小写、合并空白、去掉结尾标点
+ */
+export function normalizeQuestion(question: string): string {
+  return question
+    .normalize('NFKC')
+    .toLowerCase()
+    .replace(/\s+/g, ' ')
+    .trim()
+    .replace(/[\s?!.。？！…~～]+$/u, '');
+}
+
+/**
+ * 对输入做规范化 JSON 序列化（对象键排序）后取 SHA-256
+ */
+export function cacheKey(parts: unknown): string {
+  const canonical = JSON.stringify(parts, (_key, value) =>
+    value && typeof value === 'object' && !Array.isArray(value)
+      ? Object.fromEntries(Object.entries(value).sort(([a], [b]) => (a < b ? -1 : a > b ? 1 : 0)))
+      : value
+  );
+  return createHash('sha256').update(canonical).digest('hex');
+}
+
+/**
+ * 将缓存的文本按固定大小分块回放，产出与 LLMClient.stream 相同形状的数据块
+ */
+export async function* replayText(
+  text: string,
+  chunkChars = responseCacheConfig.replayChunkChars
+): AsyncGenerator<{ content: string }> {
+  let offset = 0;
+  while (offset < text.length) {
+    let end = Math.min(offset + chunkChars, text.length);
+    // 不拆分代理对
+    const code = text.charCodeAt(end - 1);
+    if (end < text.length && code >= 0xd800 && code <= 0xdbff) end++;
+    yield { content: text.slice(offset, end) };
+    offset = end;
+  }
+}
+
+const ttlMs = responseCacheConfig.ttlSeconds * 1000;
+
+export const interpretCache = new ResponseCache<string>(responseCacheConfig.maxEntries, ttlMs);
+export const suggestCache = new ResponseCache<string>(responseCacheConfig.maxEntries, ttlMs);
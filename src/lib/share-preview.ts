@@ -0,0 +1,67 @@
+/**
+ * 分享页预览图（仅服务端使用）
+ *
+ * 预览图由 scripts/render_share_previews.py 批量预先生成，按抽牌结果（牌阵 + 各位置的牌与正逆位）
+ * 的内容哈希存放，相同的抽牌结果共用一张图。这里按同样的规则计算哈希并读取文件。
+ * 尚未生成的抽牌结果使用通用预览图 public/share-preview-fallback.jpg（由同一脚本的 --fallback 生成）。
+ */
+
+import { createHash } from 'crypto';
+import { readFile } from 'fs/promises';
+import path from 'path';
+
+// 与 scripts/render_share_previews.py 中的 LAYOUT_VERSION 保持一致
+const LAYOUT_VERSION = 'v1';
+
+const PREVIEW_DIR = process.env.SHARE_PREVIEW_DIR || path.join(process.cwd(), '.cache', 'share-previews');
+const FALLBACK_PATH = path.join(process.cwd(), 'public', 'share-preview-fallback.jpg');
+
+let fallbackPreview: Promise<Buffer> | undefined;
+
+interface DrawnCard {
+  id: string | number;
+  isReversed?: boolean;
+}
+
+/**
+ * 计算抽牌结果的预览图哈希；cardsJson 为解读记录中保存的牌面 JSON
+ */
+export function sharePreviewKey(spreadType: string, cardsJson: string): string | undefined {
+  let cards: DrawnCard[];
+  try {
+    cards = JSON.parse(cardsJson);
+  } catch {
+    return undefined;
+  }
+  if (!Array.isArray(cards) || cards.length === 0) return undefined;
+
+  const draw = cards.map((card) => `${card.id}${card.isReversed ? 'r' : 'u'}`).join(',');
+  return createHash('sha256')
+    .update(`share-preview/${LAYOUT_VERSION}|${spreadType}|${draw}`)
+    .digest('hex')
+    .slice(0, 20);
+}
+
+/**
+ * 读取预先生成的预览图，不存在时返回 undefined
+ */
+export async function readSharePreview(key: string): Promise<Buffer | undefined> {
+  try {
+    return await readFile(path.join(PREVIEW_DIR, key.slice(0, 2), `${key}.jpg`));
+  } catch {
+    return undefined;
+  }
+}
+
+/**
+ * 读取通用预览图（进程内只读取一次，读取失败时下次重试）
+ */
+export function readFallbackPreview(): Promise<Buffer> {
+  if (!fallbackPreview) {
+    fallbackPreview = readFile(FALLBACK_PATH);
+    fallbackPreview.catch(() => {
+      fallbackPreview = undefined;
+    });
+  }
+  return fallbackPreview;
+}
@@ -0,0 +1,143 @@
+/**
+ * 推荐问题池（仅服务端使用）
+ *
+ * 推荐问题只取决于牌阵类别、语言和语气，与具体用户无关。问题池由
+ * scripts/build_suggestion_pools.py 离线批量生成到 src/data/suggestion-pools.json，
+ * 接口直接从中随机抽取；索引未覆盖的组合才实时调用 LLM 生成，并在进程内短暂复用。
+ * 在索引覆盖全部组合之前，SuggestedQuestions 组件仍只显示内置问题，不请求该接口。
+ */
+
+import SUGGESTION_POOLS from '@/data/suggestion-pools.json';
+import { ResponseCache } from '@/lib/response-cache';
+import type { Spread } from '@/lib/tarot';
+
+export type SuggestionCategory = Spread['category'];
+export type SuggestionLocale = 'zh' | 'en' | 'ja';
+export type SuggestionTone = 'mystical' | 'rational' | 'warm' | 'direct';
+
+export const SUGGESTION_CATEGORIES: SuggestionCategory[] = [
+  'recommended', 'basic', 'love', 'decision', 'career', 'self', 'advanced',
+];
+export const SUGGESTION_TONES: SuggestionTone[] = ['mystical', 'rational', 'warm', 'direct'];
+
+const LOCALE_MAP: Record<string, SuggestionLocale> = {
+  zh: 'zh',
+  en: 'en',
+  ja: 'ja',
+  cn: 'zh', // 兼容后端使用的 cn
+  jp: 'ja', // 兼容后端使用的 jp
+};
+
+const LANGUAGE_NAMES: Record<SuggestionLocale, string> = { zh: '简体中文', en: 'English', ja: '日本語' };
+
+// 与 scripts/build_suggestion_pools.py 中的提示词保持一致
+const TONE_INSTRUCTIONS: Record<SuggestionTone, string> = {
+  mystical: '语气神秘且富有启发性，可以适度运用意象与象征。',
+  rational: '语气理性、具体，聚焦可以分析和行动的问题。',
+  warm: '语气温暖、治愈，关注情绪与自我关怀。',
+  direct: '语气直接、简洁，直指关键问题。',
+};
+const CATEGORY_TOPICS: Record<SuggestionCategory, string> = {
+  recommended: '日常生活中的常见困惑（感情、工作、选择、成长均可）',
+  basic: '近期的状况与走向',
+  love: '感情、恋爱与亲密关系',
+  decision: '面临的选择与决定',
+  career: '工作、事业与学业发展',
+  self: '自我认知、内在成长与情绪',
+  advanced: '人生阶段、长期方向与深层课题',
+};
+
+const LIST_MARKER = /^\s*(?:[-*•·]|\d+[.、)）]|[（(]\d+[)）])\s*/;
+
+// 实时生成的问题池最多保留的组合数与有效期，过期后重新生成
+const LIVE_POOL_MAX_ENTRIES = 100;
+const LIVE_POOL_TTL_MS = 60 * 60 * 1000;
+
+const indexedPools: Record<string, string[]> = SUGGESTION_POOLS.pools;
+const livePools = new ResponseCache<string[]>(LIVE_POOL_MAX_ENTRIES, LIVE_POOL_TTL_MS);
+// 正在生成中的问题池，并发请求共用同一次 LLM 调用
+const pendingPools = new Map<string, Promise<string[]>>();
+
+export function normalizeSuggestionLocale(lang?: string | null): SuggestionLocale {
+  return LOCALE_MAP[lang ?? ''] ?? 'en';
+}
+
+export function suggestionPoolKey(category: SuggestionCategory, locale: SuggestionLocale, tone: SuggestionTone): string {
+  return `${category}/${locale}/${tone}`;
+}
+
+/**
+ * 离线索引中的问题池，未覆盖时返回 undefined
+ */
+export function getIndexedPool(key: string): string[] | undefined {
+  const pool = indexedPools[key];
+  return pool && pool.length > 0 ? pool : undefined;
+}
+
+/**
+ * 从问题池中不重复地随机抽取 count 个问题
+ */
+export function pickSuggestions(pool: string[], count: number): string[] {
+  if (count >= pool.length) return [...pool];
+  const picked = new Set<number>();
+  while (picked.size < count) {
+    picked.add(Math.floor(Math.random() * pool.length));
+  }
+  return [...picked].map((index) => pool[index]);
+}
+
+/**
+ * 生成实时问题池的提示词（索引未覆盖时使用）
+ */
+export function buildSuggestionMessages(
+  category: SuggestionCategory,
+  locale: SuggestionLocale,
+  tone: SuggestionTone,
+  count: number
+) {
+  return [
+    {
+      role: 'system' as const,
+      content: '你是一位专业的塔罗牌解读师。请为准备抽牌的用户写一些可以向塔罗提问的问题。每个问题单独一行，不要编号、不要解释、不要引号。',
+    },
+    {
+      role: 'user' as const,
+      content: `主题：${CATEGORY_TOPICS[category]}
+语言：${LANGUAGE_NAMES[locale]}（locale: ${locale}）
+${TONE_INSTRUCTIONS[tone]}
+请写 ${count} 个彼此不同、以第一人称提出的问题（count: ${count}），每个不超过 40 个字。`,
+    },
+  ];
+}
+
+/**
+ * 将模型输出按行拆分为问题列表：去掉编号与引号、过滤过短或过长的行并去重
+ */
+export function parseSuggestionLines(text: string): string[] {
+  const questions = text
+    .split('\n')
+    .map((line) => line.trim().replace(LIST_MARKER, '').trim().replace(/^["'“”「」]+|["'“”「」]+$/g, ''))
+    .filter((line) => line.length >= 4 && line.length <= 80);
+  return [...new Set(questions)];
+}
+
+/**
+ * 获取实时生成的问题池：结果按 TTL 与容量上限（LRU）缓存，并发请求共用同一次 LLM 调用；生成失败时不缓存
+ */
+export function getLivePool(key: string, generate: () => Promise<string[]>): Promise<string[]> {
+  const cached = livePools.get(key);
+  if (cached) return Promise.resolve(cached);
+
+  let pool = pendingPools.get(key);
+  if (!pool) {
+    pool = generate()
+      .then((questions) => {
+        if (questions.length === 0) throw new Error('LLM returned no usable questions');
+        livePools.set(key, questions);
+        return questions;
+      })
+      .finally(() => pendingPools.delete(key));
+    pendingPools.set(key, pool);
+  }
+  return pool;
+}
@@ -1,6 +1,8 @@
 // 完整的78张塔罗牌数据
 // 包含22张大阿卡纳和56张小阿卡纳
 
+import { getCardPlaceholder, type CardPlaceholder } from './card-placeholders';
+
 export interface TarotCardData {
   id: number;
   name: string;
@@ -12,6 +14,7 @@ export interface TarotCardData {
   imageUrl?: string;
   suit?: 'Wands' | 'Cups' | 'Swords' | 'Pentacles';
   number?: number;
+  placeholder?: CardPlaceholder; // 预生成的图片占位符（尺寸 + 模糊预览）
 }
 
 // 大阿卡纳 (22张) - Major Arcana
@@ -24,7 +27,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '新的开始、冒险、天真、自发性、自由精神',
     reversedMeaning: '鲁莽、冒险、愚蠢、不负责任',
     keywords: ['beginning', 'adventure', 'innocence', 'spontaneity', 'free spirit'],
-    imageUrl: '/tarot-cards/result/Major/The_Fool_New_beginnings.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Fool_New_beginnings.2167f5658f.png',
   },
   {
     id: 1,
@@ -34,7 +37,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '创造力、意志力、技能、专注、行动力',
     reversedMeaning: '欺骗、意志薄弱、能力滥用',
     keywords: ['creativity', 'willpower', 'skill', 'focus', 'manifestation'],
-    imageUrl: '/tarot-cards/result/Major/The_Magician_Creativity.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Magician_Creativity.caba541d6d.png',
   },
   {
     id: 2,
@@ -44,7 +47,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '直觉、神秘、潜意识、智慧、内在知识',
     reversedMeaning: '压抑情感、缺乏内在指引、秘密被揭露',
     keywords: ['intuition', 'mystery', 'subconscious', 'wisdom', 'inner knowledge'],
-    imageUrl: '/tarot-cards/result/Major/The_High_Priestess_Intuition.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_High_Priestess_Intuition.871660ca97.png',
   },
   {
     id: 3,
@@ -54,7 +57,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '丰饶、创造力、自然、养育、美丽',
     reversedMeaning: '创造力受阻、依赖他人、空虚',
     keywords: ['fertility', 'creativity', 'nature', 'nurturing', 'beauty'],
-    imageUrl: '/tarot-cards/result/Major/The_Empress_Abundance.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Empress_Abundance.30d6d259f1.png',
   },
   {
     id: 4,
@@ -64,7 +67,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '权威、结构、控制、领导力、稳定性',
     reversedMeaning: '控制欲过强、缺乏纪律、软弱',
     keywords: ['authority', 'structure', 'control', 'leadership', 'stability'],
-    imageUrl: '/tarot-cards/result/Major/The_Emperor_Authority.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Emperor_Authority.8fe3f22593.png',
   },
   {
     id: 5,
@@ -74,7 +77,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '传统、精神指引、信仰、学习、从众',
     reversedMeaning: '反叛、新方法、限制自由、虚假信念',
     keywords: ['tradition', 'spiritual guidance', 'faith', 'learning', 'conformity'],
-    imageUrl: '/tarot-cards/result/Major/The_Hierophant_Tradition.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Hierophant_Tradition.8c28f442fb.png',
   },
   {
     id: 6,
@@ -84,7 +87,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '爱情、和谐、关系、价值观选择、结合',
     reversedMeaning: '不和谐、不平衡、错误选择、分离',
     keywords: ['love', 'harmony', 'relationships', 'choices', 'union'],
-    imageUrl: '/tarot-cards/result/Major/The_Lovers_Love.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Lovers_Love.c23b6e7c6b.png',
   },
   {
     id: 7,
@@ -94,7 +97,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '胜利、意志力、自律、决心、成功',
     reversedMeaning: '失去方向、攻击性、缺乏控制',
     keywords: ['victory', 'willpower', 'discipline', 'determination', 'success'],
-    imageUrl: '/tarot-cards/result/Major/The_Chariot_Victory.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Chariot_Victory.83153d3769.png',
   },
   {
     id: 8,
@@ -104,7 +107,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '勇气、耐心、内在力量、慈悲、同情心',
     reversedMeaning: '软弱、自我怀疑、缺乏纪律',
     keywords: ['courage', 'patience', 'inner strength', 'compassion', 'control'],
-    imageUrl: '/tarot-cards/result/Major/Strength_Strength.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Strength_Strength.aabb1892e4.png',
   },
   {
     id: 9,
@@ -114,7 +117,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '内省、寻求真理、内在指引、孤独、智慧',
     reversedMeaning: '孤独、孤立、退缩、拒绝建议',
     keywords: ['introspection', 'seeking truth', 'inner guidance', 'solitude', 'wisdom'],
-    imageUrl: '/tarot-cards/result/Major/The_Hermit_Introspection.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Hermit_Introspection.a9d0e3bbf1.png',
   },
   {
     id: 10,
@@ -124,7 +127,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '改变、周期、命运、转折点、好运',
     reversedMeaning: '坏运气、抵抗变化、中断、破坏',
     keywords: ['change', 'cycles', 'fate', 'turning point', 'luck'],
-    imageUrl: '/tarot-cards/result/Major/Wheel_of_Fortune_Destiny.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Wheel_of_Fortune_Destiny.44ed4bc7f3.png',
   },
   {
     id: 11,
@@ -134,7 +137,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '正义、公平、真理、因果、法律',
     reversedMeaning: '不公正、缺乏责任感、不诚实',
     keywords: ['justice', 'fairness', 'truth', 'causality', 'law'],
-    imageUrl: '/tarot-cards/result/Major/Justice_Justice.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Justice_Justice.e67c8ea3bf.png',
   },
   {
     id: 12,
@@ -144,7 +147,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '牺牲、新视角、等待、放下、放手',
     reversedMeaning: '停滞、无谓牺牲、延迟',
     keywords: ['sacrifice', 'new perspective', 'waiting', 'letting go', 'surrender'],
-    imageUrl: '/tarot-cards/result/Major/The_Hanged_Man_Sacrifice.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Hanged_Man_Sacrifice.6527f54fd0.png',
   },
   {
     id: 13,
@@ -154,7 +157,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '结束、转变、重生、新的开始、放手',
     reversedMeaning: '抗拒变化、无法放手、停滞',
     keywords: ['endings', 'transition', 'rebirth', 'new beginnings', 'letting go'],
-    imageUrl: '/tarot-cards/result/Major/Death_Change.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Death_Change.ba8e2fbdaa.png',
   },
   {
     id: 14,
@@ -164,7 +167,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '平衡、适度、耐心、目的、和谐',
     reversedMeaning: '不平衡、过度、缺乏耐心',
     keywords: ['balance', 'moderation', 'patience', 'purpose', 'harmony'],
-    imageUrl: '/tarot-cards/result/Major/Temperance_Balance.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Temperance_Balance.34beef3421.png',
   },
   {
     id: 15,
@@ -174,7 +177,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '束缚、物质主义、成瘾、无知、沉迷',
     reversedMeaning: '解放、打破束缚、重获力量',
     keywords: ['bondage', 'materialism', 'addiction', 'ignorance', 'attachment'],
-    imageUrl: '/tarot-cards/result/Major/The_Devil_Temptation.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Devil_Temptation.68246a919a.png',
   },
   {
     id: 16,
@@ -184,7 +187,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '突变、混乱、启示、觉醒、释放',
     reversedMeaning: '避免灾难、推迟改变、恐惧',
     keywords: ['sudden change', 'upheaval', 'revelation', 'awakening', 'release'],
-    imageUrl: '/tarot-cards/result/Major/The_Tower_Sudden_change.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Tower_Sudden_change.013eaf0f2c.png',
   },
   {
     id: 17,
@@ -194,7 +197,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '希望、灵感、平静、更新、精神力量',
     reversedMeaning: '绝望、缺乏信心、消极',
     keywords: ['hope', 'inspiration', 'peace', 'renewal', 'spiritual power'],
-    imageUrl: '/tarot-cards/result/Major/The_Star_Hope.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Star_Hope.ea666381d9.png',
   },
   {
     id: 18,
@@ -204,7 +207,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '幻觉、恐惧、焦虑、潜意识、直觉',
     reversedMeaning: '释放恐惧、压抑情绪、混乱',
     keywords: ['illusion', 'fear', 'anxiety', 'subconscious', 'intuition'],
-    imageUrl: '/tarot-cards/result/Major/The_Moon_Illusion.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Moon_Illusion.7e794d9b4f.png',
   },
   {
     id: 19,
@@ -214,7 +217,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '快乐、成功、活力、积极性、乐观',
     reversedMeaning: '暂时的挫折、缺乏成功、悲观',
     keywords: ['joy', 'success', 'vitality', 'positivity', 'optimism'],
-    imageUrl: '/tarot-cards/result/Major/The_Sun_Success.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_Sun_Success.5769e0a906.png',
   },
   {
     id: 20,
@@ -224,7 +227,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '审判、重生、内在召唤、宽恕、觉醒',
     reversedMeaning: '自我怀疑、拒绝召唤、忽视教训',
     keywords: ['judgment', 'rebirth', 'inner calling', 'absolution', 'awakening'],
-    imageUrl: '/tarot-cards/result/Major/Judgement_Rebirth.png',
+    imageUrl: '/assets/tarot-cards/result/Major/Judgement_Rebirth.223de9b757.png',
   },
   {
     id: 21,
@@ -234,7 +237,7 @@ export const majorArcana: TarotCardData[] = [
     meaning: '完成、整合、成就、旅行、圆满',
     reversedMeaning: '未完成、缺乏封闭、拖延',
     keywords: ['completion', 'integration', 'accomplishment', 'travel', 'wholeness'],
-    imageUrl: '/tarot-cards/result/Major/The_World_Completion.png',
+    imageUrl: '/assets/tarot-cards/result/Major/The_World_Completion.b38d6046d6.png',
   },
 ];
 
@@ -248,7 +251,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '新的开始、灵感、行动、激情、创造力',
     reversedMeaning: '延迟、缺乏方向、缺乏激情',
     keywords: ['new beginnings', 'inspiration', 'action', 'passion', 'creativity'],
-    imageUrl: '/tarot-cards/result/Minor/Ace_of_Wands_Creativity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ace_of_Wands_Creativity.570d90d075.png',
     suit: 'Wands',
     number: 1,
   },
@@ -260,7 +263,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '规划、决策、发现、未来愿景',
     reversedMeaning: '害怕未知、拖延、缺乏计划',
     keywords: ['planning', 'decisions', 'discovery', 'future vision'],
-    imageUrl: '/tarot-cards/result/Minor/Two_of_Wands_Planning.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Two_of_Wands_Planning.3a650c29b7.png',
     suit: 'Wands',
     number: 2,
   },
@@ -272,7 +275,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '扩张、远见、准备、进展',
     reversedMeaning: '挫折、缺乏进展、延迟',
     keywords: ['expansion', 'foresight', 'preparation', 'progress'],
-    imageUrl: '/tarot-cards/result/Minor/Three_of_Wands_Expansion.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Three_of_Wands_Expansion.37c0e44b6f.png',
     suit: 'Wands',
     number: 3,
   },
@@ -284,7 +287,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '庆祝、和谐、家庭、稳定',
     reversedMeaning: '缺乏和谐、家庭问题、不稳定',
     keywords: ['celebration', 'harmony', 'home', 'stability'],
-    imageUrl: '/tarot-cards/result/Minor/Four_of_Wands_Stability.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Four_of_Wands_Stability.3968a3279c.png',
     suit: 'Wands',
     number: 4,
   },
@@ -296,7 +299,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '冲突、竞争、斗争、分歧',
     reversedMeaning: '避免冲突、团结、合作',
     keywords: ['conflict', 'competition', 'struggle', 'discord'],
-    imageUrl: '/tarot-cards/result/Minor/Five_of_Wands_Competition.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Five_of_Wands_Competition.7b815885fa.png',
     suit: 'Wands',
     number: 5,
   },
@@ -308,7 +311,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '胜利、成功、骄傲、认可',
     reversedMeaning: '失败、缺乏认可、自尊心过强',
     keywords: ['victory', 'success', 'pride', 'recognition'],
-    imageUrl: '/tarot-cards/result/Minor/Six_of_Wands_Victory.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Six_of_Wands_Victory.75ec7c52bf.png',
     suit: 'Wands',
     number: 6,
   },
@@ -320,7 +323,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '挑战、防御、坚持、立场',
     reversedMeaning: '放弃、被压倒、缺乏防御',
     keywords: ['challenge', 'defensive', 'persistence', 'taking a stand'],
-    imageUrl: '/tarot-cards/result/Minor/Seven_of_Wands_Challenge.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Seven_of_Wands_Challenge.7a7980bf29.png',
     suit: 'Wands',
     number: 7,
   },
@@ -332,7 +335,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '速度、行动、快速移动、旅行',
     reversedMeaning: '延迟、挫折、缺乏进展',
     keywords: ['speed', 'action', 'rapid movement', 'travel'],
-    imageUrl: '/tarot-cards/result/Minor/Eight_of_Wands_Speed.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Eight_of_Wands_Speed.a61b876cfb.png',
     suit: 'Wands',
     number: 8,
   },
@@ -344,7 +347,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '韧性、坚持、警惕、准备',
     reversedMeaning: '疲惫、缺乏准备、防御崩溃',
     keywords: ['resilience', 'persistence', 'vigilance', 'preparedness'],
-    imageUrl: '/tarot-cards/result/Minor/Nine_of_Wands_Persistence.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Nine_of_Wands_Persistence.036576bdec.png',
     suit: 'Wands',
     number: 9,
   },
@@ -356,7 +359,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '负担、压力、责任、过度劳累',
     reversedMeaning: '释放负担、委托、卸载',
     keywords: ['burden', 'stress', 'responsibility', 'overexertion'],
-    imageUrl: '/tarot-cards/result/Minor/Ten_of_Wands_Burden.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ten_of_Wands_Burden.c9b973ae1b.png',
     suit: 'Wands',
     number: 10,
   },
@@ -368,7 +371,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '新消息、灵感、探索、冒险精神',
     reversedMeaning: '缺乏灵感、坏消息、拖延',
     keywords: ['new messages', 'inspiration', 'exploration', 'adventure'],
-    imageUrl: '/tarot-cards/result/Minor/Page_of_Wands_Exploration.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Page_of_Wands_Exploration.8c911873fb.png',
     suit: 'Wands',
     number: 11,
   },
@@ -380,7 +383,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '行动、激情、冒险、快速移动',
     reversedMeaning: '缺乏方向、冲动、鲁莽',
     keywords: ['action', 'passion', 'adventure', 'rapid movement'],
-    imageUrl: '/tarot-cards/result/Minor/Knight_of_Wands_Adventure.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Knight_of_Wands_Adventure.0d272a925a.png',
     suit: 'Wands',
     number: 12,
   },
@@ -392,7 +395,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '自信、独立、温暖、热情',
     reversedMeaning: '不自信、傲慢、自私、嫉妒',
     keywords: ['confidence', 'independence', 'warmth', 'enthusiasm'],
-    imageUrl: '/tarot-cards/result/Minor/Queen_of_Wands_Confidence.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Queen_of_Wands_Confidence.eccdb3a477.png',
     suit: 'Wands',
     number: 13,
   },
@@ -404,7 +407,7 @@ export const wandsCards: TarotCardData[] = [
     meaning: '领导力、愿景、企业家精神、决定',
     reversedMeaning: '专制、冲动、缺乏远见',
     keywords: ['leadership', 'vision', 'entrepreneurship', 'decisiveness'],
-    imageUrl: '/tarot-cards/result/Minor/King_of_Wands_Leadership.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/King_of_Wands_Leadership.26e7b4aab0.png',
     suit: 'Wands',
     number: 14,
   },
@@ -420,7 +423,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '新的情感关系、爱情、精神觉醒、直觉',
     reversedMeaning: '情感压抑、情感空虚',
     keywords: ['new relationships', 'love', 'spiritual awakening', 'intuition'],
-    imageUrl: '/tarot-cards/result/Minor/Ace_of_Cups_New_feelings.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ace_of_Cups_New_feelings.ece0526101.png',
     suit: 'Cups',
     number: 1,
   },
@@ -432,7 +435,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '伙伴关系、平等、和谐',
     reversedMeaning: '失衡、关系破裂、冲突',
     keywords: ['partnership', 'equality', 'harmony'],
-    imageUrl: '/tarot-cards/result/Minor/Two_of_Cups_Partnership.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Two_of_Cups_Partnership.e68670833a.png',
     suit: 'Cups',
     number: 2,
   },
@@ -444,7 +447,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '庆祝、友谊、社交活动',
     reversedMeaning: '孤独、过度社交、庆祝不足',
     keywords: ['celebration', 'friendship', 'social events'],
-    imageUrl: '/tarot-cards/result/Minor/Three_of_Cups_Friendship.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Three_of_Cups_Friendship.df2d8a31ad.png',
     suit: 'Cups',
     number: 3,
   },
@@ -456,7 +459,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '冷漠、无聊、失望、内省',
     reversedMeaning: '新机会、觉醒、热情',
     keywords: ['apathy', 'boredom', 'disappointment', 'introspection'],
-    imageUrl: '/tarot-cards/result/Minor/Four_of_Cups_Apathy.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Four_of_Cups_Apathy.c967ed98b3.png',
     suit: 'Cups',
     number: 4,
   },
@@ -468,7 +471,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '失去、悲伤、后悔、失望',
     reversedMeaning: '接受损失、继续前行、希望',
     keywords: ['loss', 'grief', 'regret', 'disappointment'],
-    imageUrl: '/tarot-cards/result/Minor/Five_of_Cups_Disappointment.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Five_of_Cups_Disappointment.5775c13f4b.png',
     suit: 'Cups',
     number: 5,
   },
@@ -480,7 +483,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '怀旧、童年记忆、快乐、纯真',
     reversedMeaning: '停留在过去、无法前行',
     keywords: ['nostalgia', 'childhood memories', 'joy', 'innocence'],
-    imageUrl: '/tarot-cards/result/Minor/Six_of_Cups_Nostalgia.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Six_of_Cups_Nostalgia.34d57cc4fc.png',
     suit: 'Cups',
     number: 6,
   },
@@ -492,7 +495,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '选择、幻想、愿望、诱惑',
     reversedMeaning: '清晰、决策、现实',
     keywords: ['choices', 'fantasy', 'wishes', 'temptation'],
-    imageUrl: '/tarot-cards/result/Minor/Seven_of_Cups_Fantasy.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Seven_of_Cups_Fantasy.59e7dcf68e.png',
     suit: 'Cups',
     number: 7,
   },
@@ -504,7 +507,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '离开、放弃、失望、寻求更多',
     reversedMeaning: '无法离开、被困住、继续探索',
     keywords: ['leaving', 'abandonment', 'disappointment', 'seeking more'],
-    imageUrl: '/tarot-cards/result/Minor/Eight_of_Cups_Abandonment.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Eight_of_Cups_Abandonment.c31905430b.png',
     suit: 'Cups',
     number: 8,
   },
@@ -516,7 +519,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '满足、愿望实现、幸福、满足感',
     reversedMeaning: '不满、贪婪、缺乏满足感',
     keywords: ['satisfaction', 'wishes fulfilled', 'contentment', 'gratification'],
-    imageUrl: '/tarot-cards/result/Minor/Nine_of_Cups_Satisfaction.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Nine_of_Cups_Satisfaction.1f3b95acef.png',
     suit: 'Cups',
     number: 9,
   },
@@ -528,7 +531,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '家庭和谐、幸福、满足、感情满足',
     reversedMeaning: '家庭破裂、不和谐、不满意',
     keywords: ['family harmony', 'happiness', 'fulfillment', 'emotional satisfaction'],
-    imageUrl: '/tarot-cards/result/Minor/Ten_of_Cups_Happiness.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ten_of_Cups_Happiness.bc3cc8696e.png',
     suit: 'Cups',
     number: 10,
   },
@@ -540,7 +543,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '创造力、直觉、情感消息',
     reversedMeaning: '情感不成熟、创造力受阻',
     keywords: ['creativity', 'intuition', 'emotional messages'],
-    imageUrl: '/tarot-cards/result/Minor/Page_of_Cups_Sensitivity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Page_of_Cups_Sensitivity.c2b5cb6b9c.png',
     suit: 'Cups',
     number: 11,
   },
@@ -552,7 +555,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '浪漫、魅力、想象力、美',
     reversedMeaning: '情绪化、不可靠、幻想',
     keywords: ['romance', 'charm', 'imagination', 'beauty'],
-    imageUrl: '/tarot-cards/result/Minor/Knight_of_Cups_Romance.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Knight_of_Cups_Romance.cdab62d439.png',
     suit: 'Cups',
     number: 12,
   },
@@ -564,7 +567,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '情感智慧、直觉、同情心、养育',
     reversedMeaning: '情绪化、不安全感、缺乏同情心',
     keywords: ['emotional intelligence', 'intuition', 'compassion', 'nurturing'],
-    imageUrl: '/tarot-cards/result/Minor/Queen_of_Cups_Intuition.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Queen_of_Cups_Intuition.60fb95901b.png',
     suit: 'Cups',
     number: 13,
   },
@@ -576,7 +579,7 @@ export const cupsCards: TarotCardData[] = [
     meaning: '情感平衡、同情心、智慧、冷静',
     reversedMeaning: '情感不稳定、傲慢、控制欲强',
     keywords: ['emotional balance', 'compassion', 'wisdom', 'calmness'],
-    imageUrl: '/tarot-cards/result/Minor/King_of_Cups_Emotional_maturity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/King_of_Cups_Emotional_maturity.36db80658b.png',
     suit: 'Cups',
     number: 14,
   },
@@ -592,7 +595,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '突破、清晰、新思想、精神力量',
     reversedMeaning: '困惑、思想混乱、缺乏清晰',
     keywords: ['breakthrough', 'clarity', 'new ideas', 'mental power'],
-    imageUrl: '/tarot-cards/result/Minor/Ace_of_Swords_Clarity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ace_of_Swords_Clarity.b2576207ac.png',
     suit: 'Swords',
     number: 1,
   },
@@ -604,7 +607,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '犹豫、难以选择、僵局、避免冲突',
     reversedMeaning: '做出选择、冲突、不确定性',
     keywords: ['hesitation', 'difficult choices', 'deadlock', 'avoiding conflict'],
-    imageUrl: '/tarot-cards/result/Minor/Two_of_Swords_Indecision.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Two_of_Swords_Indecision.5ccb7327a9.png',
     suit: 'Swords',
     number: 2,
   },
@@ -616,7 +619,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '心碎、悲伤、痛苦、情感创伤',
     reversedMeaning: '从痛苦中恢复、释放悲伤、继续前行',
     keywords: ['heartbreak', 'sorrow', 'pain', 'emotional trauma'],
-    imageUrl: '/tarot-cards/result/Minor/Three_of_Swords_Heartbreak.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Three_of_Swords_Heartbreak.6fd03ceaf2.png',
     suit: 'Swords',
     number: 3,
   },
@@ -628,7 +631,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '休息、恢复、沉思、安静',
     reversedMeaning: '焦虑、缺乏休息、恢复受阻',
     keywords: ['rest', 'recovery', 'contemplation', 'quiet'],
-    imageUrl: '/tarot-cards/result/Minor/Four_of_Swords_Rest.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Four_of_Swords_Rest.df9c6fe732.png',
     suit: 'Swords',
     number: 4,
   },
@@ -640,7 +643,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '冲突、失败、放弃、背叛',
     reversedMeaning: '避免冲突、寻求解决、妥协',
     keywords: ['conflict', 'defeat', 'giving up', 'betrayal'],
-    imageUrl: '/tarot-cards/result/Minor/Five_of_Swords_Defeat.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Five_of_Swords_Defeat.62dc88f810.png',
     suit: 'Swords',
     number: 5,
   },
@@ -652,7 +655,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '过渡、离开平静、离开不稳定、移动',
     reversedMeaning: '停留在不愉快的情况中、被困住',
     keywords: ['transition', 'leaving the calm', 'leaving the turbulent', 'movement'],
-    imageUrl: '/tarot-cards/result/Minor/Six_of_Swords_Transition.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Six_of_Swords_Transition.3a57c74bb3.png',
     suit: 'Swords',
     number: 6,
   },
@@ -664,7 +667,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '欺骗、战术、逃跑、寻求出路',
     reversedMeaning: '诚实、直接面对问题、停止逃避',
     keywords: ['deception', 'tactics', 'running away', 'seeking a way out'],
-    imageUrl: '/tarot-cards/result/Minor/Seven_of_Swords_Deception.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Seven_of_Swords_Deception.0d48d337d7.png',
     suit: 'Swords',
     number: 7,
   },
@@ -676,7 +679,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '束缚、限制、自我囚禁、受害者心态',
     reversedMeaning: '释放束缚、新视角、自由',
     keywords: ['bondage', 'restriction', 'self-imprisonment', 'victim mentality'],
-    imageUrl: '/tarot-cards/result/Minor/Eight_of_Swords_Restriction.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Eight_of_Swords_Restriction.60f5979c02.png',
     suit: 'Swords',
     number: 8,
   },
@@ -688,7 +691,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '焦虑、担忧、噩梦、恐惧',
     reversedMeaning: '释放恐惧、积极思考、解决问题',
     keywords: ['anxiety', 'worry', 'nightmares', 'fear'],
-    imageUrl: '/tarot-cards/result/Minor/Nine_of_Swords_Anxiety.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Nine_of_Swords_Anxiety.e86f4d06db.png',
     suit: 'Swords',
     number: 9,
   },
@@ -700,7 +703,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '痛苦的结束、背叛、损失、绝望',
     reversedMeaning: '恢复、新生、结束痛苦周期',
     keywords: ['painful endings', 'betrayal', 'loss', 'hopelessness'],
-    imageUrl: '/tarot-cards/result/Minor/Ten_of_Swords_Ruin.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ten_of_Swords_Ruin.e5a4a63238.png',
     suit: 'Swords',
     number: 10,
   },
@@ -712,7 +715,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '好奇心、新思想、沟通、监控',
     reversedMeaning: '缺乏好奇心、信息不准确、恶意八卦',
     keywords: ['curiosity', 'new ideas', 'communication', 'surveillance'],
-    imageUrl: '/tarot-cards/result/Minor/Page_of_Swords_Curiosity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Page_of_Swords_Curiosity.3558fec35f.png',
     suit: 'Swords',
     number: 11,
   },
@@ -724,7 +727,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '行动、雄心、追求、快速移动',
     reversedMeaning: '缺乏方向、冲动、攻击性',
     keywords: ['action', 'ambition', 'pursuit', 'rapid movement'],
-    imageUrl: '/tarot-cards/result/Minor/Knight_of_Swords_Impulsiveness.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Knight_of_Swords_Impulsiveness.c76f71c02d.png',
     suit: 'Swords',
     number: 12,
   },
@@ -736,7 +739,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '独立、清晰、直接、纪律',
     reversedMeaning: '严厉、孤立、缺乏同情心、冷酷',
     keywords: ['independence', 'clarity', 'directness', 'discipline'],
-    imageUrl: '/tarot-cards/result/Minor/Queen_of_Swords_Independence.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Queen_of_Swords_Independence.6c2cda979a.png',
     suit: 'Swords',
     number: 13,
   },
@@ -748,7 +751,7 @@ export const swordsCards: TarotCardData[] = [
     meaning: '智力、权威、逻辑、真理',
     reversedMeaning: '操纵、残酷、缺乏同情心、傲慢',
     keywords: ['intellect', 'authority', 'logic', 'truth'],
-    imageUrl: '/tarot-cards/result/Minor/King_of_Swords_Logic.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/King_of_Swords_Logic.458433b5eb.png',
     suit: 'Swords',
     number: 14,
   },
@@ -764,7 +767,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '新的机会、繁荣、富足、物质成功',
     reversedMeaning: '错失机会、缺乏繁荣、贫穷',
     keywords: ['new opportunities', 'prosperity', 'abundance', 'material success'],
-    imageUrl: '/tarot-cards/result/Minor/Ace_of_Pentacles_Material_opportunity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ace_of_Pentacles_Material_opportunity.db29bdf798.png',
     suit: 'Pentacles',
     number: 1,
   },
@@ -776,7 +779,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '平衡、适应、时间管理、优先事项',
     reversedMeaning: '失衡、缺乏灵活性、不知所措',
     keywords: ['balance', 'adaptability', 'time management', 'priorities'],
-    imageUrl: '/tarot-cards/result/Minor/Two_of_Pentacles_Balance.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Two_of_Pentacles_Balance.0d1b92f27a.png',
     suit: 'Pentacles',
     number: 2,
   },
@@ -788,7 +791,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '团队合作、合作、实现目标、技能',
     reversedMeaning: '缺乏团队合作、项目失败、技能不足',
     keywords: ['teamwork', 'collaboration', 'achieving goals', 'skills'],
-    imageUrl: '/tarot-cards/result/Minor/Three_of_Pentacles_Teamwork.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Three_of_Pentacles_Teamwork.25a3fcf20e.png',
     suit: 'Pentacles',
     number: 3,
   },
@@ -800,7 +803,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '贪婪、占有欲、控制、保守',
     reversedMeaning: '慷慨、分享、放开',
     keywords: ['greed', 'possessiveness', 'control', 'conservatism'],
-    imageUrl: '/tarot-cards/result/Minor/Four_of_Pentacles_Security.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Four_of_Pentacles_Security.14656bfded.png',
     suit: 'Pentacles',
     number: 4,
   },
@@ -812,7 +815,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '贫困、缺乏、困难、疾病',
     reversedMeaning: '恢复、改善、帮助可用',
     keywords: ['poverty', 'lack', 'hardship', 'illness'],
-    imageUrl: '/tarot-cards/result/Minor/Five_of_Pentacles_Hardship.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Five_of_Pentacles_Hardship.57f4759d6d.png',
     suit: 'Pentacles',
     number: 5,
   },
@@ -824,7 +827,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '慷慨、慈善、分享财富、帮助他人',
     reversedMeaning: '自私、不平等、缺乏帮助',
     keywords: ['generosity', 'charity', 'sharing wealth', 'helping others'],
-    imageUrl: '/tarot-cards/result/Minor/Six_of_Pentacles_Generosity.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Six_of_Pentacles_Generosity.9d89c02386.png',
     suit: 'Pentacles',
     number: 6,
   },
@@ -836,7 +839,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '耐心、投资、长期目标、等待',
     reversedMeaning: '不耐烦、缺乏投资、短期思考',
     keywords: ['patience', 'investment', 'long-term goals', 'waiting'],
-    imageUrl: '/tarot-cards/result/Minor/Seven_of_Pentacles_Assessment.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Seven_of_Pentacles_Assessment.4358935db9.png',
     suit: 'Pentacles',
     number: 7,
   },
@@ -848,7 +851,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '技能、勤奋、工匠精神、精通',
     reversedMeaning: '缺乏技能、懒惰、缺乏努力',
     keywords: ['skill', 'diligence', 'craftsmanship', 'mastery'],
-    imageUrl: '/tarot-cards/result/Minor/Eight_of_Pentacles_Dedication.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Eight_of_Pentacles_Dedication.6e38bf34d4.png',
     suit: 'Pentacles',
     number: 8,
   },
@@ -860,7 +863,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '奢侈品、自给自足、财务独立、成功',
     reversedMeaning: '缺乏奢侈、依赖他人、不成功',
     keywords: ['luxury', 'self-sufficiency', 'financial independence', 'success'],
-    imageUrl: '/tarot-cards/result/Minor/Nine_of_Pentacles_Independence.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Nine_of_Pentacles_Independence.daae2b874f.png',
     suit: 'Pentacles',
     number: 9,
   },
@@ -872,7 +875,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '财富、家庭遗产、稳定、长期成功',
     reversedMeaning: '财富损失、家庭遗产破裂、不稳定',
     keywords: ['wealth', 'family legacy', 'stability', 'long-term success'],
-    imageUrl: '/tarot-cards/result/Minor/Ten_of_Pentacles_Wealth.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Ten_of_Pentacles_Wealth.3e4b233d13.png',
     suit: 'Pentacles',
     number: 10,
   },
@@ -884,7 +887,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '学习、实践、研究、新商业想法',
     reversedMeaning: '缺乏学习、理论化、不切实际',
     keywords: ['learning', 'practicality', 'study', 'new business ideas'],
-    imageUrl: '/tarot-cards/result/Minor/Page_of_Pentacles_Learning.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Page_of_Pentacles_Learning.6cb6d42cf5.png',
     suit: 'Pentacles',
     number: 11,
   },
@@ -896,7 +899,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '勤奋、可靠、务实、常规',
     reversedMeaning: '懒惰、不切实际、过于常规',
     keywords: ['diligence', 'reliability', 'practicality', 'routine'],
-    imageUrl: '/tarot-cards/result/Minor/Knight_of_Pentacles_Responsibility.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Knight_of_Pentacles_Responsibility.3480bb3729.png',
     suit: 'Pentacles',
     number: 12,
   },
@@ -908,7 +911,7 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '养育、实用、财务智慧、慷慨',
     reversedMeaning: '不切实际、缺乏财务智慧、自私',
     keywords: ['nurturing', 'practicality', 'financial wisdom', 'generosity'],
-    imageUrl: '/tarot-cards/result/Minor/Queen_of_Pentacles_Abundance.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/Queen_of_Pentacles_Abundance.0b2b476f9d.png',
     suit: 'Pentacles',
     number: 13,
   },
@@ -920,20 +923,20 @@ export const pentaclesCards: TarotCardData[] = [
     meaning: '财富、商业、领导力、稳定',
     reversedMeaning: '贪婪、物质主义、自私',
     keywords: ['wealth', 'business', 'leadership', 'stability'],
-    imageUrl: '/tarot-cards/result/Minor/King_of_Pentacles_Wealth.png',
+    imageUrl: '/assets/tarot-cards/result/Minor/King_of_Pentacles_Wealth.6a98f84eb5.png',
     suit: 'Pentacles',
     number: 14,
   },
 ];
 
-// 完整的78张牌
+// 完整的78张牌（附带图片占位符）
 export const allTarotCards: TarotCardData[] = [
   ...majorArcana,
   ...wandsCards,
   ...cupsCards,
   ...swordsCards,
   ...pentaclesCards,
-];
+].map(card => ({ ...card, placeholder: getCardPlaceholder(card.imageUrl) }));
 
 // 按ID获取牌
 export function getCardById(id: number): TarotCardData | undefined {
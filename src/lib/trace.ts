@@ -0,0 +1,125 @@
+/**
+ * 接口阶段耗时追踪（仅服务端使用）
+ *
+ * 每个请求记录各阶段耗时，结果写入内存环形缓冲区（/api/debug/traces 可查看），
+ * 设置 TRACE_LOG_FILE 时同时追加到本地 JSONL 文件，用 scripts/trace_report.py 汇总。
+ */
+
+import { appendFile } from 'fs/promises';
+import { tracingConfig } from '@/config/tracing';
+
+export interface TraceRecord {
+  route: string;
+  startedAt: string;
+  status: 'ok' | 'error';
+  error?: string;
+  totalMs: number;
+  stages: Record<string, number>; // 各阶段耗时（毫秒），按完成顺序
+  meta: Record<string, string | number | boolean>;
+}
+
+const buffer: TraceRecord[] = [];
+let nextSlot = 0;
+
+let pendingLines: string[] = [];
+let flushing = false;
+
+function round(ms: number): number {
+  return Math.round(ms * 10) / 10;
+}
+
+async function flushSink() {
+  if (flushing || !tracingConfig.logFile) return;
+  flushing = true;
+  try {
+    while (pendingLines.length > 0) {
+      const lines = pendingLines;
+      pendingLines = [];
+      await appendFile(tracingConfig.logFile, lines.join(''));
+    }
+  } catch (error) {
+    console.error('[trace] 写入日志文件失败:', error instanceof Error ? error.message : error);
+    pendingLines = [];
+  } finally {
+    flushing = false;
+  }
+}
+
+function record(entry: TraceRecord) {
+  if (buffer.length < tracingConfig.bufferSize) {
+    buffer.push(entry);
+  } else {
+    buffer[nextSlot] = entry;
+  }
+  nextSlot = (nextSlot + 1) % tracingConfig.bufferSize;
+
+  if (tracingConfig.logFile) {
+    pendingLines.push(JSON.stringify(entry) + '\n');
+    void flushSink();
+  }
+}
+
+/**
+ * 单个请求的耗时追踪
+ *
+ * mark(stage) 记录自上一个阶段结束以来的耗时；end() 写入缓冲区，只生效一次。
+ */
+export class RequestTrace {
+  private readonly startedAt = new Date().toISOString();
+  private readonly start = performance.now();
+  private last = this.start;
+  private finished = false;
+  private readonly stages: Record<string, number> = {};
+  private readonly meta: Record<string, string | number | boolean> = {};
+
+  constructor(private readonly route: string) {}
+
+  mark(stage: string) {
+    const now = performance.now();
+    this.stages[stage] = round(now - this.last);
+    this.last = now;
+  }
+
+  set(key: string, value: string | number | boolean) {
+    this.meta[key] = value;
+  }
+
+  end(status: 'ok' | 'error' = 'ok', error?: unknown) {
+    if (this.finished || !tracingConfig.enabled) return;
+    this.finished = true;
+    record({
+      route: this.route,
+      startedAt: this.startedAt,
+      status,
+      ...(error !== undefined && {
+        error: error instanceof Error ? error.message : String(error),
+      }),
+      totalMs: round(performance.now() - this.start),
+      stages: this.stages,
+      meta: this.meta,
+    });
+  }
+}
+
+export function startTrace(route: string): RequestTrace {
+  return new RequestTrace(route);
+}
+
+/**
+ * 获取最近的追踪记录（从旧到新）
+ */
+export function recentTraces(limit = tracingConfig.bufferSize): TraceRecord[] {
+  const ordered = buffer.length < tracingConfig.bufferSize
+    ? buffer.slice()
+    : buffer.slice(nextSlot).concat(buffer.slice(0, nextSlot));
+  return ordered.slice(-limit);
+}
+
+/**
+ * 详细日志，仅在 TRACE_VERBOSE=true 时输出
+ */
+export function verboseLog(...args: unknown[]) {
+  if (tracingConfig.verbose) {
+    console.log(...args);
+  }
+}
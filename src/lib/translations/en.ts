@@ -190,6 +190,7 @@ export const en: TranslationType = {
     history: 'Reading History',
     loading: 'Loading...',
     noHistory: 'No reading history yet',
+    loadMore: 'Load More',
     startReading: 'Start your first tarot reading today',
     newReading: 'New Reading',
     proUpgradeRequired: {
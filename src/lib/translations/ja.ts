@@ -190,6 +190,7 @@ export const ja: TranslationType = {
     history: 'リーディング履歴',
     loading: '読み込み中...',
     noHistory: 'リーディング履歴がありません',
+    loadMore: 'もっと見る',
     startReading: '初めてのタロットリーディングを始めましょう',
     newReading: '新規リーディング',
     proUpgradeRequired: {
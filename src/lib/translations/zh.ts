@@ -189,6 +189,7 @@ export const zh = {
     history: '解读历史',
     loading: '加载中...',
     noHistory: '暂无解读历史',
+    loadMore: '加载更多',
     startReading: '开始你的第一次塔罗解读',
     newReading: '新解读',
     proUpgradeRequired: {
@@ -4,11 +4,43 @@ import { dailyQuotas, insertDailyQuotaSchema, type DailyQuota, type InsertDailyQ
 import { appConfig } from '@/config';
 import { DEMO_ACCOUNT } from '@/config/demo-account';
 
+const EXHAUSTED_CACHE_MAX_USERS = 10000;
+
 export class DailyQuotaManager {
+  // 今日已用完限额的用户 -> { 日期, 过期时间 }，命中时直接拒绝，不访问数据库
+  private exhausted = new Map<string, { date: string; until: number }>();
+
   private get MAX_DAILY_INTERPRETATIONS(): number {
     return appConfig.features.dailyQuota.free;
   }
 
+  private today(): string {
+    return new Date().toISOString().split('T')[0];
+  }
+
+  private isKnownExhausted(userId: string, date: string): boolean {
+    const entry = this.exhausted.get(userId);
+    if (!entry) return false;
+    if (entry.date === date && entry.until > Date.now()) return true;
+    this.exhausted.delete(userId);
+    return false;
+  }
+
+  private markExhausted(userId: string, date: string) {
+    const ttlMs = appConfig.features.dailyQuota.exhaustedCacheSeconds * 1000;
+    if (ttlMs <= 0) return;
+    if (this.exhausted.size >= EXHAUSTED_CACHE_MAX_USERS) {
+      const now = Date.now();
+      for (const [key, entry] of this.exhausted) {
+        if (entry.until <= now) this.exhausted.delete(key);
+      }
+      if (this.exhausted.size >= EXHAUSTED_CACHE_MAX_USERS) {
+        this.exhausted.delete(this.exhausted.keys().next().value as string);
+      }
+    }
+    this.exhausted.set(userId, { date, until: Date.now() + ttlMs });
+  }
+
   // 检查是否为演示账号
   private isDemoUser(userId: string): boolean {
     return userId === DEMO_ACCOUNT.id;
@@ -55,9 +87,13 @@ export class DailyQuotaManager {
       return 999999;
     }
 
-    const today = new Date().toISOString().split('T')[0];
-    const quota = await this.getOrCreateQuota(userId, today);
-    return Math.max(0, this.MAX_DAILY_INTERPRETATIONS - quota.count);
+    if (this.isKnownExhausted(userId, this.today())) {
+      return 0;
+    }
+
+    // 只读查询：没有记录即视为今日未使用，不再为此插入空行
+    const quota = await this.getTodayQuota(userId);
+    return Math.max(0, this.MAX_DAILY_INTERPRETATIONS - (quota?.count ?? 0));
   }
 
   async canInterpret(userId: string): Promise<boolean> {
@@ -70,27 +106,80 @@ export class DailyQuotaManager {
     return remaining > 0;
   }
 
-  async useQuota(userId: string): Promise<{ success: boolean; remaining: number }> {
+  /**
+   * 原子地检查并占用一次限额：单条 upsert，仅在 count 未达上限时插入或递增。
+   * 并发请求不会同时越过上限；用完后该用户会被短暂缓存，后续请求不再访问数据库。
+   * 解读失败时应以返回的 date 调用 releaseQuota 退还，避免跨零点时退到次日的计数。
+   */
+  async reserveQuota(userId: string): Promise<{ success: boolean; remaining: number; date: string }> {
+    const today = this.today();
+
     // 演示账号无限制，不消耗配额
     if (this.isDemoUser(userId)) {
-      return { success: true, remaining: 999999 };
+      return { success: true, remaining: 999999, date: today };
     }
 
-    const today = new Date().toISOString().split('T')[0];
-    const remaining = await this.getRemainingQuota(userId);
+    const limit = this.MAX_DAILY_INTERPRETATIONS;
+    if (limit <= 0 || this.isKnownExhausted(userId, today)) {
+      return { success: false, remaining: 0, date: today };
+    }
+
+    const db = await getDb();
+    const [quota] = await db
+      .insert(dailyQuotas)
+      .values({ userId, date: today, count: 1 })
+      .onConflictDoUpdate({
+        target: [dailyQuotas.userId, dailyQuotas.date],
+        set: {
+          count: sql`${dailyQuotas.count} + 1`,
+          updatedAt: new Date(),
+        },
+        setWhere: sql`${dailyQuotas.count} < ${limit}`,
+      })
+      .returning({ count: dailyQuotas.count });
+
+    if (!quota) {
+      this.markExhausted(userId, today);
+      return { success: false, remaining: 0, date: today };
+    }
 
-    if (remaining <= 0) {
-      return { success: false, remaining: 0 };
+    const remaining = Math.max(0, limit - quota.count);
+    if (remaining === 0) {
+      this.markExhausted(userId, today);
     }
+    return { success: true, remaining, date: today };
+  }
 
-    await this.incrementQuota(userId, today);
-    const newRemaining = await this.getRemainingQuota(userId);
+  /**
+   * 退还一次通过 reserveQuota 占用的限额
+   * @param date reserveQuota 返回的占用日期
+   */
+  async releaseQuota(userId: string, date: string): Promise<void> {
+    if (this.isDemoUser(userId)) {
+      return;
+    }
+
+    this.exhausted.delete(userId);
+    const db = await getDb();
+    await db
+      .update(dailyQuotas)
+      .set({
+        count: sql`${dailyQuotas.count} - 1`,
+        updatedAt: new Date(),
+      })
+      .where(and(
+        eq(dailyQuotas.userId, userId),
+        eq(dailyQuotas.date, date),
+        sql`${dailyQuotas.count} > 0`
+      ));
+  }
 
-    return { success: true, remaining: newRemaining };
+  async useQuota(userId: string): Promise<{ success: boolean; remaining: number; date: string }> {
+    return this.reserveQuota(userId);
   }
 
   async getTodayQuota(userId: string): Promise<DailyQuota | null> {
-    const today = new Date().toISOString().split('T')[0];
+    const today = this.today();
     const db = await getDb();
     const [quota] = await db
       .select()
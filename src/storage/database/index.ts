@@ -1,4 +1,11 @@
 export { userManager } from './userManager';
 export { dailyQuotaManager } from './dailyQuotaManager';
-export { tarotInterpretationManager } from './tarotInterpretationManager';
+export {
+  tarotInterpretationManager,
+  encodeHistoryCursor,
+  decodeHistoryCursor,
+  type HistoryCursor,
+  type HistoryPage,
+  type TarotInterpretationSummary,
+} from './tarotInterpretationManager';
 export * from './shared/schema';
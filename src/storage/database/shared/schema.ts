@@ -1,4 +1,4 @@
-import { pgTable, text, varchar, integer, timestamp, boolean, index } from 'drizzle-orm/pg-core';
+import { pgTable, text, varchar, integer, timestamp, boolean, index, uniqueIndex } from 'drizzle-orm/pg-core';
 import { sql } from 'drizzle-orm';
 import { createSchemaFactory } from 'drizzle-zod';
 import { z } from 'zod';
@@ -44,6 +44,8 @@ export const tarotInterpretations = pgTable(
   (table) => ({
     userIdIdx: index('tarot_interpretations_user_id_idx').on(table.userId),
     createdAtIdx: index('tarot_interpretations_created_at_idx').on(table.createdAt),
+    // 历史记录游标分页：WHERE user_id = ? AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+    userCreatedAtIdx: index('tarot_interpretations_user_id_created_at_id_idx').on(table.userId, table.createdAt, table.id),
   })
 );
 
@@ -63,7 +65,8 @@ export const dailyQuotas = pgTable(
     updatedAt: timestamp('updated_at', { withTimezone: true }),
   },
   (table) => ({
-    userIdDateIdx: index('daily_quotas_user_id_date_idx').on(table.userId, table.date),
+    // 唯一约束：reserveQuota 依赖它做 ON CONFLICT 原子递增
+    userIdDateIdx: uniqueIndex('daily_quotas_user_id_date_idx').on(table.userId, table.date),
   })
 );
 
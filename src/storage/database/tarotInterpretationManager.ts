@@ -2,6 +2,50 @@ import { eq, and, desc, sql } from 'drizzle-orm';
 import { getDb } from 'coze-coding-dev-sdk';
 import { tarotInterpretations, insertTarotInterpretationSchema, type TarotInterpretation, type InsertTarotInterpretation } from './shared/schema';
 
+// 历史列表的摘要投影：不含完整解读正文，只带前若干字的预览
+const SUMMARY_PREVIEW_CHARS = 120;
+const summaryColumns = {
+  id: tarotInterpretations.id,
+  userId: tarotInterpretations.userId,
+  question: tarotInterpretations.question,
+  spreadType: tarotInterpretations.spreadType,
+  cards: tarotInterpretations.cards,
+  createdAt: tarotInterpretations.createdAt,
+  preview: sql<string>`left(${tarotInterpretations.interpretation}, ${SUMMARY_PREVIEW_CHARS})`,
+  // 游标用微秒精度的时间戳，JS Date 只有毫秒，直接用会跳过同一毫秒内的记录
+  cursorMicros: sql<string>`(extract(epoch from ${tarotInterpretations.createdAt}) * 1000000)::bigint::text`,
+};
+
+export type TarotInterpretationSummary = Omit<TarotInterpretation, 'interpretation'> & { preview: string };
+
+export interface HistoryCursor {
+  createdAtMicros: string; // created_at 的 Unix 微秒数
+  id: string;
+}
+
+export interface HistoryPage<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+/**
+ * 游标编码为 base64url(`createdAtMicros|id`)，对客户端不透明
+ */
+export function encodeHistoryCursor(cursor: HistoryCursor): string {
+  return Buffer.from(`${cursor.createdAtMicros}|${cursor.id}`).toString('base64url');
+}
+
+/**
+ * 解析游标，格式不合法时返回 null
+ */
+export function decodeHistoryCursor(value: string): HistoryCursor | null {
+  const [createdAtMicros, id] = Buffer.from(value, 'base64url').toString().split('|');
+  if (!id || !/^\d{1,19}$/.test(createdAtMicros ?? '')) {
+    return null;
+  }
+  return { createdAtMicros, id };
+}
+
 export class TarotInterpretationManager {
   async createInterpretation(data: InsertTarotInterpretation): Promise<TarotInterpretation> {
     const db = await getDb();
@@ -28,6 +72,41 @@ export class TarotInterpretationManager {
       .limit(limit);
   }
 
+  /**
+   * 按 (createdAt, id) 倒序的游标分页，走 (user_id, created_at, id) 复合索引，
+   * 翻到多深都只扫描一页的数据；返回摘要投影，完整正文用 getInterpretationById 获取
+   */
+  async getInterpretationSummaries(
+    userId: string,
+    options: { limit?: number; cursor?: HistoryCursor | null } = {}
+  ): Promise<HistoryPage<TarotInterpretationSummary>> {
+    const limit = options.limit ?? 20;
+    const cursor = options.cursor;
+    const db = await getDb();
+    const rows = await db
+      .select(summaryColumns)
+      .from(tarotInterpretations)
+      .where(
+        cursor
+          ? and(
+              eq(tarotInterpretations.userId, userId),
+              sql`(${tarotInterpretations.createdAt}, ${tarotInterpretations.id}) < (timestamptz 'epoch' + ${cursor.createdAtMicros}::bigint * interval '1 microsecond', ${cursor.id})`
+            )
+          : eq(tarotInterpretations.userId, userId)
+      )
+      .orderBy(desc(tarotInterpretations.createdAt), desc(tarotInterpretations.id))
+      .limit(limit + 1);
+
+    const page = rows.slice(0, limit);
+    const last = page[page.length - 1];
+    return {
+      items: page.map(({ cursorMicros: _cursorMicros, ...summary }) => summary),
+      nextCursor: rows.length > limit && last
+        ? encodeHistoryCursor({ createdAtMicros: last.cursorMicros, id: last.id })
+        : null,
+    };
+  }
+
   async getInterpretationById(id: string): Promise<TarotInterpretation | null> {
     const db = await getDb();
     const [interpretation] = await db
@@ -2,15 +2,38 @@
 """
 Stripe API 测试脚本
 用于测试 FastAPI 后端的 Stripe Checkout Session 接口
+
+    python test-stripe-api.py                                  # 交互式功能测试
+    python test-stripe-api.py --backend-url http://localhost:8901 --all-prices
+    python test-stripe-api.py --load -c 20 -n 500              # 压测：500 个请求，20 并发
+    python test-stripe-api.py --load -c 20 --duration 60       # 压测：持续 60 秒
 """
 
-import requests
+import argparse
+import itertools
 import json
+import math
+import os
 import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
 
 # 配置
-BACKEND_URL = "http://120.76.142.91:8901"
-API_ENDPOINT = f"{BACKEND_URL}/api/stripe/create-checkout-session"
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://120.76.142.91:8901")
+API_PATH = "/api/stripe/create-checkout-session"
+API_ENDPOINT = f"{BACKEND_URL}{API_PATH}"
+
+PRICE_IDS = {
+    "Pro Monthly": "price_1Sren7GVP93aj81Tr4d18z2S",
+    "Pro Yearly": "price_1SrendGVP93aj81TJU8Jc8Gg",
+    "Premium Monthly": "price_1SreoFGVP93aj81TEHp1vIRO",
+    "Premium Yearly": "price_1SreoaGVP93aj81TAiUfVBTK",
+}
 
 # 测试数据
 TEST_DATA = {
@@ -137,16 +160,9 @@ def test_with_different_price_ids():
     """测试不同的价格ID"""
     print_info("测试不同的价格ID")
 
-    price_ids = {
-        "Pro Monthly": "price_1Sren7GVP93aj81Tr4d18z2S",
-        "Pro Yearly": "price_1SrendGVP93aj81TJU8Jc8Gg",
-        "Premium Monthly": "price_1SreoFGVP93aj81TEHp1vIRO",
-        "Premium Yearly": "price_1SreoaGVP93aj81TAiUfVBTK",
-    }
-
     results = {}
 
-    for name, price_id in price_ids.items():
+    for name, price_id in PRICE_IDS.items():
         test_data = TEST_DATA.copy()
         test_data["priceId"] = price_id
         test_data["userId"] = f"test-{name.lower().replace(' ', '-')}"
@@ -179,7 +195,166 @@ def test_with_different_price_ids():
     return all(results.values())
 
 
+def percentile(sorted_values, pct):
+    """最近秩法百分位数，sorted_values 需已排序"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
+
+
+class LoadStats:
+    """线程安全地收集每个价格ID的延迟和错误"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(Counter)
+
+    def record(self, name, latency, error=None):
+        with self._lock:
+            if error is None:
+                self.latencies[name].append(latency)
+            else:
+                self.errors[name][error] += 1
+
+    def names(self):
+        return sorted(set(self.latencies) | set(self.errors))
+
+
+def post_checkout(session, name, price_id, seq, timeout):
+    """发送一次 checkout 请求，返回 (耗时秒, 错误类别或 None)"""
+    test_data = TEST_DATA.copy()
+    test_data["priceId"] = price_id
+    test_data["userId"] = f"load-{name.lower().replace(' ', '-')}-{seq}"
+
+    started = time.perf_counter()
+    try:
+        response = session.post(API_ENDPOINT, json=test_data, timeout=timeout)
+        latency = time.perf_counter() - started
+        if response.status_code != 200:
+            return latency, f"HTTP {response.status_code}"
+        try:
+            data = response.json()
+        except ValueError:
+            return latency, "invalid JSON"
+        if not data.get("success"):
+            return latency, f"API error: {data.get('error', {}).get('message') or 'unknown'}"
+        return latency, None
+    except requests.exceptions.Timeout:
+        return time.perf_counter() - started, "timeout"
+    except requests.exceptions.ConnectionError:
+        return time.perf_counter() - started, "connection error"
+    except Exception as e:
+        return time.perf_counter() - started, type(e).__name__
+
+
+def run_load_test(concurrency, total=None, duration=None, timeout=30):
+    """并发压测 checkout 接口，按价格ID轮询；total 和 duration 至少给一个"""
+    print_info(f"压测 {API_ENDPOINT}")
+    limit = f"{total} 个请求" if total else f"{duration} 秒"
+    print(f"  并发: {concurrency}，{limit}，价格ID: {len(PRICE_IDS)} 个\n")
+
+    stats = LoadStats()
+    # 每个线程一个 Session，各自复用一条 keep-alive 连接，总连接数等于并发数
+    local = threading.local()
+
+    def session():
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+            local.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+            local.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        return local.session
+
+    counter = itertools.count()
+    counter_lock = threading.Lock()
+    prices = list(PRICE_IDS.items())
+    deadline = time.perf_counter() + duration if duration else None
+
+    def worker():
+        while True:
+            with counter_lock:
+                seq = next(counter)
+            if total is not None and seq >= total:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            name, price_id = prices[seq % len(prices)]
+            latency, error = post_checkout(session(), name, price_id, seq, timeout)
+            stats.record(name, latency, error)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for _ in range(concurrency):
+            executor.submit(worker)
+    elapsed = time.perf_counter() - started
+
+    print_load_report(stats, elapsed)
+    return not any(stats.errors.values())
+
+
+def print_load_report(stats, elapsed):
+    print(f"{'价格ID':<18}{'请求':>7}{'错误':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    all_latencies = []
+    total_requests = total_errors = 0
+    for name in stats.names():
+        latencies = sorted(stats.latencies[name])
+        errors = sum(stats.errors[name].values())
+        all_latencies.extend(latencies)
+        total_requests += len(latencies) + errors
+        total_errors += errors
+        print(f"{name:<18}{len(latencies) + errors:>7}{errors:>7}"
+              f"{percentile(latencies, 50) * 1000:>10.1f}{percentile(latencies, 95) * 1000:>10.1f}"
+              f"{percentile(latencies, 99) * 1000:>10.1f}{(latencies[-1] if latencies else 0) * 1000:>10.1f}")
+
+    all_latencies.sort()
+    print(f"{'ALL':<18}{total_requests:>7}{total_errors:>7}"
+          f"{percentile(all_latencies, 50) * 1000:>10.1f}{percentile(all_latencies, 95) * 1000:>10.1f}"
+          f"{percentile(all_latencies, 99) * 1000:>10.1f}{(all_latencies[-1] if all_latencies else 0) * 1000:>10.1f}")
+
+    throughput = total_requests / elapsed if elapsed > 0 else 0
+    print(f"\n耗时 {elapsed:.2f}s，吞吐 {throughput:.1f} req/s，成功 {len(all_latencies)}，失败 {total_errors}")
+
+    if total_errors:
+        print("\n错误分布:")
+        for name in stats.names():
+            for error, count in stats.errors[name].most_common():
+                print(f"  {name:<18}{count:>6}  {error}")
+    print()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stripe Checkout Session 接口测试 / 压测")
+    parser.add_argument("--backend-url", default=BACKEND_URL,
+                        help=f"后端地址 (默认: {BACKEND_URL}，也可用 BACKEND_URL 环境变量)")
+    parser.add_argument("--all-prices", action="store_true",
+                        help="非交互地测试所有价格ID")
+    parser.add_argument("--load", action="store_true", help="压测模式（非交互）")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="压测并发数 (默认: 10)")
+    parser.add_argument("-n", "--requests", type=int, help="压测总请求数 (默认: 100，与 --duration 二选一)")
+    parser.add_argument("--duration", type=float, help="压测持续秒数")
+    parser.add_argument("--timeout", type=float, default=30, help="单个请求超时秒数 (默认: 30)")
+    args = parser.parse_args()
+    if args.requests is None and args.duration is None:
+        args.requests = 100
+    return args
+
+
 def main():
+    global BACKEND_URL, API_ENDPOINT
+    args = parse_args()
+    BACKEND_URL = args.backend_url.rstrip("/")
+    API_ENDPOINT = f"{BACKEND_URL}{API_PATH}"
+
+    if args.load:
+        print_header("Stripe API 压测")
+        if run_load_test(max(1, args.concurrency), args.requests, args.duration, args.timeout):
+            print_success("压测完成，无错误")
+        else:
+            print_warning("压测完成，存在错误")
+            sys.exit(1)
+        return
+
     print_header("Stripe API 测试工具")
 
     # 测试后端连接
@@ -200,7 +375,12 @@ def main():
 
     # 可选：测试所有价格ID
     print()
-    read = input("是否测试所有价格ID? (y/n): ").strip().lower()
+    if args.all_prices:
+        read = 'y'
+    elif sys.stdin.isatty():
+        read = input("是否测试所有价格ID? (y/n): ").strip().lower()
+    else:
+        read = 'n'
     if read == 'y':
         print()
         print_header("测试所有价格ID")
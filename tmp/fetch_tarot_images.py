@@ -1,25 +1,23 @@
+import os
+import sys
 import json
-import urllib.request
-import urllib.parse
 
-def fetch_json(url):
-    with urllib.request.urlopen(url) as response:
-        return json.loads(response.read().decode())
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
+
+from tarot_source import fetch_listing
 
-def get_files(path):
-    url = f"https://api.github.com/repos/ricarvy/tarot_source/contents/{path}?ref=main"
-    data = fetch_json(url)
-    if isinstance(data, list):
-        return [item for item in data if item.get('type') == 'file']
-    return []
 
 def main():
-    print("Fetching Major Arcana images...")
-    major_files = get_files('result/Major')
+    # 一次递归 tree 请求取得全部图片，带 ETag 缓存；TAROT_SOURCE_OFFLINE=1 时只读缓存
+    print("Fetching tarot image listing...")
+    listing = fetch_listing()
+    if listing is None:
+        print("Could not fetch image listing")
+        sys.exit(1)
+
+    major_files = [item for path, item in listing.items() if path.startswith('Major/')]
+    minor_files = [item for path, item in listing.items() if path.startswith('Minor/')]
     print(f"Found {len(major_files)} Major Arcana images")
-
-    print("Fetching Minor Arcana images...")
-    minor_files = get_files('result/Minor')
     print(f"Found {len(minor_files)} Minor Arcana images")
 
     all_files = major_files + minor_files